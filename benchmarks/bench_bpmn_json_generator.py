@@ -0,0 +1,67 @@
+"""
+Benchmark the BPMN XML -> JSON conversion on synthetic diagrams of increasing size.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_bpmn_json_generator.py
+"""
+
+import time
+import tracemalloc
+
+from bpmn_assistant.services import BpmnJsonGenerator
+
+from synthetic_bpmn import make_branchy_bpmn, make_linear_bpmn
+
+SIZES = [100, 1_000, 10_000]
+REPEATS = 3
+
+
+def bench(bpmn_xml: str, streaming: bool = False) -> float:
+    """
+    Return the best wall-clock time (in seconds) of converting the given document.
+    """
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        BpmnJsonGenerator().create_bpmn_json(bpmn_xml, streaming=streaming)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(bpmn_xml: str, streaming: bool = False) -> float:
+    """
+    Return the peak memory (in MB) allocated while converting the given document.
+    """
+    tracemalloc.start()
+    BpmnJsonGenerator().create_bpmn_json(bpmn_xml, streaming=streaming)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024
+
+
+def main():
+    print(f"{'elements':>10} {'linear (ms)':>12} {'branchy (ms)':>13}")
+    for size in SIZES:
+        linear_ms = bench(make_linear_bpmn(size)) * 1000
+        branchy_ms = bench(make_branchy_bpmn(size)) * 1000
+        print(f"{size:>10} {linear_ms:>12.2f} {branchy_ms:>13.2f}")
+
+    # Documents exported by modeling tools, with a shape per element and an edge per flow
+    print()
+    print(
+        f"{'elements':>10} {'size (MB)':>10} {'tree (ms)':>10} {'stream (ms)':>12}"
+        f" {'tree peak (MB)':>15} {'stream peak (MB)':>17}"
+    )
+    for size in SIZES:
+        bpmn_xml = make_linear_bpmn(size, with_diagram=True)
+        print(
+            f"{size:>10} {len(bpmn_xml) / 1024 / 1024:>10.2f}"
+            f" {bench(bpmn_xml) * 1000:>10.2f}"
+            f" {bench(bpmn_xml, streaming=True) * 1000:>12.2f}"
+            f" {peak_memory(bpmn_xml):>15.2f}"
+            f" {peak_memory(bpmn_xml, streaming=True):>17.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark the in-process diagram layout (BpmnXmlGenerator with with_layout=True) against
+the round-trip through the layout server (bpmn_layout_server, bpmn-auto-layout).
+The layout server part is skipped if the server is not reachable.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_bpmn_layout.py
+    LAYOUT_SERVER_URL=http://localhost:3001/process-bpmn PYTHONPATH=src python benchmarks/bench_bpmn_layout.py
+"""
+
+import json
+import logging
+import os
+import time
+import urllib.error
+import urllib.request
+from typing import Callable, Optional
+
+from bpmn_assistant.services import BpmnXmlGenerator
+
+from synthetic_bpmn import make_branchy_process, make_nested_process
+
+LAYOUT_SERVER_URL = os.getenv(
+    "LAYOUT_SERVER_URL", "http://localhost:3001/process-bpmn"
+)
+PROCESSES = {
+    "branchy, 10 elements": make_branchy_process(10),
+    "branchy, 100 elements": make_branchy_process(100),
+    "branchy, 1000 elements": make_branchy_process(1_000),
+    "nested, 10 levels": make_nested_process(10, tasks_per_branch=2),
+}
+REPEATS = 5
+
+
+def native_layout(process: list[dict]) -> str:
+    return BpmnXmlGenerator().create_bpmn_xml(process, with_layout=True)
+
+
+def layout_server(process: list[dict]) -> str:
+    bpmn_xml = BpmnXmlGenerator().create_bpmn_xml(process)
+    request = urllib.request.Request(
+        LAYOUT_SERVER_URL,
+        data=json.dumps({"bpmnXml": bpmn_xml}).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request, timeout=60) as response:
+        return json.load(response)["layoutedXml"]
+
+
+def bench(layout: Callable[[list[dict]], str], process: list[dict]) -> float:
+    """
+    Return the median wall-clock time (in seconds) of laying out the given process.
+    """
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        layout(process)
+        timings.append(time.perf_counter() - start)
+    return sorted(timings)[len(timings) // 2]
+
+
+def layout_server_available() -> bool:
+    try:
+        layout_server(make_branchy_process(10))
+        return True
+    except (urllib.error.URLError, OSError) as e:
+        print(f"Layout server not reachable at {LAYOUT_SERVER_URL} ({e}), skipping it\n")
+        return False
+
+
+def format_ms(seconds: Optional[float]) -> str:
+    return f"{seconds * 1000:.2f}" if seconds is not None else "-"
+
+
+def main():
+    # The transformed process is dumped to the debug log, which would dominate the results
+    logging.getLogger("bpmn_assistant").setLevel(logging.INFO)
+
+    with_server = layout_server_available()
+
+    print(f"{'process':>24} {'native (ms)':>12} {'layout server (ms)':>19}")
+    for name, process in PROCESSES.items():
+        native_s = bench(native_layout, process)
+        server_s = bench(layout_server, process) if with_server else None
+        print(f"{name:>24} {format_ms(native_s):>12} {format_ms(server_s):>19}")
+
+
+if __name__ == "__main__":
+    main()
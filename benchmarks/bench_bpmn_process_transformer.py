@@ -0,0 +1,75 @@
+"""
+Benchmark the transformation of the JSON process structure (BpmnProcessTransformer) on
+synthetic processes of increasing size. The time per element stays flat when the
+transformation is linear in the size of the process.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_bpmn_process_transformer.py
+"""
+
+import time
+import tracemalloc
+
+from bpmn_assistant.services import BpmnProcessTransformer
+
+from synthetic_bpmn import (
+    make_branchy_process,
+    make_linear_process,
+    make_nested_process,
+)
+
+SIZES = [1_000, 2_500, 5_000, 10_000]
+NESTING_DEPTHS = [10, 50, 200]
+REPEATS = 3
+
+
+def bench(process: list[dict]) -> float:
+    """
+    Return the best wall-clock time (in seconds) of transforming the given process.
+    """
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        BpmnProcessTransformer().transform(process)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(process: list[dict]) -> float:
+    """
+    Return the peak memory (in MB) allocated while transforming the given process.
+    """
+    tracemalloc.start()
+    BpmnProcessTransformer().transform(process)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024
+
+
+def main():
+    print(
+        f"{'elements':>10} {'linear (ms)':>12} {'us/element':>11}"
+        f" {'branchy (ms)':>13} {'us/element':>11}"
+    )
+    for size in SIZES:
+        linear_s = bench(make_linear_process(size))
+        branchy_s = bench(make_branchy_process(size))
+        print(
+            f"{size:>10} {linear_s * 1000:>12.2f} {linear_s / size * 1e6:>11.2f}"
+            f" {branchy_s * 1000:>13.2f} {branchy_s / size * 1e6:>11.2f}"
+        )
+
+    # Deeply nested gateways
+    print()
+    print(f"{'depth':>10} {'elements':>10} {'time (ms)':>10} {'peak (MB)':>10}")
+    for depth in NESTING_DEPTHS:
+        process = make_nested_process(depth)
+        num_elements = len(BpmnProcessTransformer().transform(process)["elements"])
+        print(
+            f"{depth:>10} {num_elements:>10} {bench(process) * 1000:>10.2f}"
+            f" {peak_memory(process):>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
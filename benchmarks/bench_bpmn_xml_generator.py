@@ -0,0 +1,81 @@
+"""
+Benchmark the JSON -> BPMN XML conversion on synthetic processes of increasing size,
+building the whole XML string (create_bpmn_xml) versus writing it chunk by chunk to a
+file (write_bpmn_xml).
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_bpmn_xml_generator.py
+"""
+
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Callable
+
+from bpmn_assistant.services import BpmnXmlGenerator
+
+from synthetic_bpmn import make_branchy_process
+
+SIZES = [1_000, 10_000, 50_000]
+REPEATS = 3
+
+
+def create(process: list[dict], path: str) -> None:
+    bpmn_xml = BpmnXmlGenerator().create_bpmn_xml(process)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(bpmn_xml)
+
+
+def write(process: list[dict], path: str) -> None:
+    BpmnXmlGenerator().write_bpmn_xml(process, path)
+
+
+def bench(export: Callable[[list[dict], str], None], process: list[dict], path: str) -> float:
+    """
+    Return the best wall-clock time (in seconds) of exporting the given process to a file.
+    """
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        export(process, path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(
+    export: Callable[[list[dict], str], None], process: list[dict], path: str
+) -> float:
+    """
+    Return the peak memory (in MB) allocated while exporting the given process to a file.
+    """
+    tracemalloc.start()
+    export(process, path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024
+
+
+def main():
+    # The transformed process is dumped to the debug log, which would dominate the results
+    logging.getLogger("bpmn_assistant").setLevel(logging.INFO)
+
+    print(
+        f"{'elements':>10} {'create (ms)':>12} {'write (ms)':>11}"
+        f" {'create peak (MB)':>17} {'write peak (MB)':>16}"
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "process.bpmn")
+        for size in SIZES:
+            process = make_branchy_process(size)
+            print(
+                f"{size:>10} {bench(create, process, path) * 1000:>12.2f}"
+                f" {bench(write, process, path) * 1000:>11.2f}"
+                f" {peak_memory(create, process, path):>17.2f}"
+                f" {peak_memory(write, process, path):>16.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
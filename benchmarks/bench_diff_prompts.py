@@ -0,0 +1,97 @@
+"""
+Benchmark the input of an editing session on a large process, with the full process sent
+in every intermediate step (before) versus only the changes since the last version shown
+to the LLM, with a full checkpoint every few steps (after).
+
+The LLM is simulated: it adds a task at a random place in every step, and the size of its
+conversation history (all the prompts and responses so far, the input of every call) is
+recorded. The tokens are estimated as characters / 4. The time is the time spent by the
+service (applying the edits and rendering the prompts), without the LLM.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_diff_prompts.py
+"""
+
+import json
+import logging
+import random
+import time
+from typing import Optional
+from unittest.mock import Mock
+
+from bench_edit_functions import make_process
+
+from bpmn_assistant.core import LLMFacade
+from bpmn_assistant.services.process_editing import BpmnEditingService
+
+SIZES = [100, 500, 2_000]
+# The initial edit and 6 intermediate ones, then the LLM stops (the 7 iterations allowed)
+STEPS = 7
+CHECKPOINT_INTERVAL = 3
+
+
+def run_session(
+    process: list[dict], diff_checkpoint_interval: Optional[int]
+) -> tuple[list[int], float]:
+    """
+    Run an editing session of STEPS edits.
+    Returns:
+        The input size (in characters) of every LLM call, and the time spent by the service
+    """
+    rng = random.Random(0)
+    task_ids = [element["id"] for element in process if element["type"] == "task"]
+    history_size = 0
+    input_sizes = []
+    step = 0
+
+    def call(prompt: str, *args, **kwargs) -> dict:
+        nonlocal history_size, step
+        history_size += len(prompt)
+        input_sizes.append(history_size)
+
+        if step == STEPS:
+            response: dict = {"stop": True}
+        else:
+            response = {
+                "function": "add_element",
+                "arguments": {
+                    "element": {"type": "task", "id": f"new{step}", "label": "New"},
+                    "after_id": rng.choice(task_ids),
+                },
+            }
+        step += 1
+        history_size += len(json.dumps(response))
+        return response
+
+    llm_facade = Mock(LLMFacade, usage=[])
+    llm_facade.call.side_effect = call
+    service = BpmnEditingService(
+        llm_facade, process, "Add the tasks", diff_checkpoint_interval
+    )
+
+    start = time.perf_counter()
+    service.edit_bpmn()
+    return input_sizes, time.perf_counter() - start
+
+
+def main():
+    print(f"{STEPS} edits, a full checkpoint every {CHECKPOINT_INTERVAL} diffs")
+    print(
+        f"{'elements':>9} {'mode':>5} {'input tokens':>13} {'last call':>10} "
+        f"{'service time':>13}"
+    )
+
+    for size in SIZES:
+        process = make_process(size)
+
+        for mode, interval in [("full", None), ("diff", CHECKPOINT_INTERVAL)]:
+            input_sizes, elapsed = run_session(process, interval)
+            print(
+                f"{size:>9} {mode:>5} {sum(input_sizes) // 4:>13,} "
+                f"{input_sizes[-1] // 4:>10,} {elapsed * 1000:>10.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    logging.getLogger("bpmn_assistant").setLevel(logging.WARNING)
+    main()
@@ -0,0 +1,135 @@
+"""
+Benchmark the process editing functions on a large process, before and after the path
+copying: before, every function deep-copied the whole process (move_element twice, through
+delete_element and add_element), now only the containers on the path to the edited element
+are copied and everything else is shared with the original process.
+
+The "before" timings are the current functions preceded by the deep copies they used to
+make. The memory is the size of the new allocations kept by the edited process.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_edit_functions.py
+"""
+
+import timeit
+import tracemalloc
+from copy import deepcopy
+
+from bpmn_assistant.services.process_editing import (
+    add_element,
+    delete_element,
+    move_element,
+    redirect_branch,
+    update_element,
+)
+
+SIZES = [100, 1_000, 5_000]
+NUMBER = 20
+
+
+def make_process(size: int) -> list[dict]:
+    """
+    A process of about `size` elements: a sequence of tasks, with an exclusive gateway
+    (holding a nested parallel gateway) every 10 tasks.
+    """
+    process: list[dict] = [{"type": "startEvent", "id": "start"}]
+
+    for i in range(size // 20):
+        process += [
+            {"type": "task", "id": f"task{i}_{j}", "label": f"Task {i}.{j}"}
+            for j in range(10)
+        ]
+        process.append(
+            {
+                "type": "exclusiveGateway",
+                "id": f"gateway{i}",
+                "label": f"Gateway {i}?",
+                "has_join": True,
+                "branches": [
+                    {
+                        "condition": f"Condition {i}.{b}",
+                        "path": [
+                            {"type": "task", "id": f"branch{i}_{b}", "label": "Branch"},
+                            {
+                                "type": "parallelGateway",
+                                "id": f"parallel{i}_{b}",
+                                "branches": [
+                                    [{"type": "task", "id": f"p{i}_{b}_{k}", "label": "P"}]
+                                    for k in range(3)
+                                ],
+                            },
+                        ],
+                    }
+                    for b in range(2)
+                ],
+            }
+        )
+
+    process.append({"type": "endEvent", "id": "end"})
+    return process
+
+
+def edits(process: list[dict]) -> dict:
+    """
+    The edits (and the number of deep copies they used to make), on elements in the middle
+    of the process.
+    """
+    i = len(process) // 22
+    new_task = {"type": "task", "id": "new_task", "label": "New task"}
+    return {
+        "delete_element": (1, lambda: delete_element(process, f"p{i}_1_2")),
+        "redirect_branch": (
+            1,
+            lambda: redirect_branch(process, f"Condition {i}.0", f"task{i}_0"),
+        ),
+        "add_element": (1, lambda: add_element(process, new_task, after_id=f"task{i}_5")),
+        "move_element": (
+            2,
+            lambda: move_element(process, f"task{i}_5", before_id=f"branch{i}_1"),
+        ),
+        "update_element": (
+            1,
+            lambda: update_element(
+                process, {"type": "userTask", "id": f"task{i}_3", "label": "Updated"}
+            ),
+        ),
+    }
+
+
+def retained_memory(function) -> int:
+    tracemalloc.start()
+    result = function()  # noqa: F841 (kept alive while measuring)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    print(
+        f"{'elements':>8} {'function':>16} {'before (ms)':>12} {'after (ms)':>11}"
+        f" {'speedup':>8} {'before (KB)':>12} {'after (KB)':>11}"
+    )
+
+    for size in SIZES:
+        process = make_process(size)
+
+        for name, (copies, edit) in edits(process).items():
+
+            def legacy_edit():
+                for _ in range(copies):
+                    deepcopy(process)
+                return edit()
+
+            before = min(timeit.repeat(legacy_edit, number=NUMBER, repeat=3)) / NUMBER
+            after = min(timeit.repeat(edit, number=NUMBER, repeat=3)) / NUMBER
+            before_memory = retained_memory(lambda: deepcopy(process)) * copies
+            after_memory = retained_memory(edit)
+            print(
+                f"{size:>8} {name:>16} {before * 1000:>12.3f} {after * 1000:>11.3f}"
+                f" {before / after:>7.1f}x {before_memory / 1024:>12.1f}"
+                f" {after_memory / 1024:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark an editing session (a chain of edits, each on the result of the previous one) on
+a large process, with the lookups done by traversals (before: get_all_ids, then
+find_position, which calls get_all_ids again) versus a ProcessIndex shared by the edits and
+maintained incrementally (after).
+
+The session adds tasks at random places, then updates and deletes them.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_edit_session.py
+"""
+
+import random
+import time
+from typing import Optional
+
+from bench_edit_functions import make_process
+
+from bpmn_assistant.services.process_editing import (
+    ProcessIndex,
+    add_element,
+    delete_element,
+    update_element,
+)
+from bpmn_assistant.services.process_editing.helpers import (
+    copy_path,
+    find_position,
+    get_all_ids,
+)
+
+SIZES = [100, 1_000, 5_000]
+EDITS = 50
+
+
+def legacy_add_element(
+    process: list[dict],
+    element: dict,
+    before_id: Optional[str] = None,
+    after_id: Optional[str] = None,
+) -> dict:
+    ids = get_all_ids(process)
+    assert element["id"] not in ids
+    assert (before_id or after_id) in ids
+    position = find_position(process, before_id=before_id, after_id=after_id)
+    process_copy, target_list = copy_path(process, position.path)
+    target_list.insert(position.index, element)
+    return {"process": process_copy, "added_element": element}
+
+
+def legacy_update_element(process: list[dict], new_element: dict) -> dict:
+    assert new_element["id"] in get_all_ids(process)
+    position = find_position(process, before_id=new_element["id"])
+    process_copy, target_list = copy_path(process, position.path)
+    target_list[position.index] = new_element
+    return {"process": process_copy, "updated_element": new_element}
+
+
+def legacy_delete_element(process: list[dict], element_id: str) -> dict:
+    assert element_id in get_all_ids(process)
+    position = find_position(process, before_id=element_id)
+    process_copy, target_list = copy_path(process, position.path)
+    removed_element = target_list.pop(position.index)
+    return {"process": process_copy, "removed_element": removed_element}
+
+
+def session(process: list[dict], indexed: bool) -> list[dict]:
+    rng = random.Random(0)
+    targets = rng.sample(get_all_ids(process)[1:], EDITS)
+    process_index = ProcessIndex(process) if indexed else None
+
+    for i, target_id in enumerate(targets):
+        element = {"type": "task", "id": f"new{i}", "label": "New task"}
+        if indexed:
+            process = add_element(
+                process, element, after_id=target_id, process_index=process_index
+            )["process"]
+        else:
+            process = legacy_add_element(process, element, after_id=target_id)["process"]
+
+    for i in range(EDITS):
+        element = {"type": "userTask", "id": f"new{i}", "label": "Updated task"}
+        if indexed:
+            process = update_element(process, element, process_index)["process"]
+        else:
+            process = legacy_update_element(process, element)["process"]
+
+    for i in range(EDITS):
+        if indexed:
+            process = delete_element(process, f"new{i}", process_index)["process"]
+        else:
+            process = legacy_delete_element(process, f"new{i}")["process"]
+
+    return process
+
+
+def main():
+    print(f"{EDITS * 3} edits per session")
+    print(f"{'elements':>8} {'before (ms)':>12} {'after (ms)':>11} {'speedup':>8}")
+
+    for size in SIZES:
+        process = make_process(size)
+        timings = {}
+
+        for indexed in [False, True]:
+            start = time.perf_counter()
+            result = session(process, indexed)
+            timings[indexed] = time.perf_counter() - start
+            assert result == process
+
+        print(
+            f"{size:>8} {timings[False] * 1000:>12.1f} {timings[True] * 1000:>11.1f}"
+            f" {timings[False] / timings[True]:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Benchmark the encoding of the process in the prompts: the Python repr of the process
+(before) versus the compact outline of process_to_outline (after), on the BPMN fixtures of
+the tests and on a large synthetic process.
+
+For every process, the report shows the tokens of the encoded process and of the
+define_change_request prompt holding it, and the time to encode the process and to decode
+the outline back (outline_to_process, checked to give the same process). The tokens are
+counted with the Anthropic tokenizer bundled with litellm if the tokenizers package is
+installed, otherwise estimated as characters / 4.
+
+With --model, the end-to-end latency of a respond_to_query call (the prompt of the talk
+turns) is measured for both encodings with the real LLM (its API key must be set).
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_process_outline.py
+    PYTHONPATH=src python benchmarks/bench_process_outline.py --model gpt-4o-mini
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import time
+from pathlib import Path
+from typing import Callable
+
+from bench_edit_functions import make_process
+
+from bpmn_assistant.core.enums import OutputMode
+from bpmn_assistant.prompts import PromptTemplateProcessor
+from bpmn_assistant.services import (
+    BpmnJsonGenerator,
+    outline_to_process,
+    process_to_outline,
+)
+from bpmn_assistant.utils import get_llm_facade
+
+FIXTURES_DIR = Path(__file__).parent.parent / "tests" / "fixtures"
+SYNTHETIC_SIZE = 1_000
+REPEATS = 100
+LIVE_REPEATS = 3
+
+
+def load_processes() -> dict[str, list[dict]]:
+    processes = {
+        path.stem: BpmnJsonGenerator().create_bpmn_json(path.read_text())
+        for path in sorted(FIXTURES_DIR.glob("*.bpmn"))
+    }
+    processes[f"synthetic ({SYNTHETIC_SIZE})"] = make_process(SYNTHETIC_SIZE)
+    return processes
+
+
+def token_counter() -> tuple[str, Callable[[str], int]]:
+    """
+    Return the name of the tokenizer and the function counting the tokens of a text.
+    """
+    try:
+        import litellm
+        from tokenizers import Tokenizer
+
+        path = os.path.join(
+            os.path.dirname(litellm.__file__),
+            "litellm_core_utils",
+            "tokenizers",
+            "anthropic_tokenizer.json",
+        )
+        tokenizer = Tokenizer.from_file(path)
+        return "Anthropic tokenizer", lambda text: len(tokenizer.encode(text).ids)
+    except Exception:
+        return "characters / 4", lambda text: len(text) // 4
+
+
+def best_time(function: Callable[[], object]) -> float:
+    """
+    Return the best time (in microseconds) of calling the function.
+    """
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+def compare_tokens(processes: dict[str, list[dict]]) -> None:
+    tokenizer_name, count_tokens = token_counter()
+    prompt_processor = PromptTemplateProcessor()
+
+    def prompt_tokens(encoded_process: str) -> int:
+        prompt = prompt_processor.render_template(
+            "define_change_request.jinja2",
+            process=encoded_process,
+            message_history="User: Add a review task at the start",
+        )
+        return count_tokens(prompt)
+
+    print(f"Tokens counted with: {tokenizer_name}")
+    print(
+        f"{'process':>28} {'repr':>7} {'outline':>8} {'saved':>6} "
+        f"{'prompt (repr)':>14} {'(outline)':>10} {'encode':>10} {'decode':>10}"
+    )
+
+    total_repr = total_outline = 0
+    for name, process in processes.items():
+        outline = process_to_outline(process)
+        assert outline_to_process(outline) == process, name
+
+        repr_tokens = count_tokens(str(process))
+        outline_tokens = count_tokens(outline)
+        total_repr += repr_tokens
+        total_outline += outline_tokens
+
+        print(
+            f"{name:>28} {repr_tokens:>7,} {outline_tokens:>8,} "
+            f"{1 - outline_tokens / repr_tokens:>6.0%} "
+            f"{prompt_tokens(str(process)):>14,} {prompt_tokens(outline):>10,} "
+            f"{best_time(lambda: process_to_outline(process)):>7.0f} us "
+            f"{best_time(lambda: outline_to_process(outline)):>7.0f} us"
+        )
+
+    print(
+        f"{'total':>28} {total_repr:>7,} {total_outline:>8,} "
+        f"{1 - total_outline / total_repr:>6.0%}"
+    )
+
+
+def compare_latency(processes: dict[str, list[dict]], model: str) -> None:
+    """
+    Measure the median latency of a respond_to_query call with both encodings, alternating
+    them to spread the load of the provider.
+    """
+    prompt_processor = PromptTemplateProcessor()
+    print()
+    print(f"respond_to_query with {model}, median of {LIVE_REPEATS} calls")
+    print(f"{'process':>28} {'repr (s)':>9} {'outline (s)':>12}")
+
+    for name, process in processes.items():
+        latencies: dict[str, list[float]] = {"repr": [], "outline": []}
+
+        for _ in range(LIVE_REPEATS):
+            for encoding, encoded_process in [
+                ("repr", str(process)),
+                ("outline", process_to_outline(process)),
+            ]:
+                prompt = prompt_processor.render_template(
+                    "respond_to_query.jinja2",
+                    process=encoded_process,
+                    message_history="User: What happens after the first task?",
+                )
+                llm_facade = get_llm_facade(model, OutputMode.TEXT)
+
+                start = time.perf_counter()
+                llm_facade.call(prompt, max_tokens=100, temperature=0)
+                latencies[encoding].append(time.perf_counter() - start)
+
+        print(
+            f"{name:>28} {statistics.median(latencies['repr']):>9.2f} "
+            f"{statistics.median(latencies['outline']):>12.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", help="Measure the latency with this LLM")
+    args = parser.parse_args()
+
+    processes = load_processes()
+    compare_tokens(processes)
+
+    if args.model:
+        compare_latency(processes, args.model)
+
+
+if __name__ == "__main__":
+    logging.getLogger("bpmn_assistant").setLevel(logging.WARNING)
+    main()
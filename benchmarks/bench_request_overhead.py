@@ -0,0 +1,115 @@
+"""
+Benchmark the per-request overhead of resolving the LLM facade (get_llm_facade) and the
+available providers (get_available_providers), before and after the cached settings:
+before, every call loaded the .env file again (load_dotenv(override=True)) and rebuilt the
+lists of models from the enums.
+
+The benchmark runs in a temporary directory holding a .env file with the API keys.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_request_overhead.py
+"""
+
+import logging
+import os
+import tempfile
+import timeit
+
+from dotenv import find_dotenv, load_dotenv
+
+from bpmn_assistant.config import Settings
+from bpmn_assistant.core import LLMFacade
+from bpmn_assistant.core.enums import (
+    AnthropicModels,
+    FireworksAIModels,
+    GoogleModels,
+    OpenAIModels,
+    OutputMode,
+    Provider,
+)
+from bpmn_assistant.utils import utils
+
+ENV_FILE = """\
+OPENAI_API_KEY=openai-key
+ANTHROPIC_API_KEY=anthropic-key
+GEMINI_API_KEY=gemini-key
+FIREWORKS_AI_API_KEY=fireworks-key
+"""
+MODELS = {
+    "first model": OpenAIModels.GPT_4O_MINI.value,
+    "last model": FireworksAIModels.DEEPSEEK_R1.value,
+}
+NUMBER = 2_000
+
+
+def legacy_get_llm_facade(
+    model: str, output_mode: OutputMode = OutputMode.JSON
+) -> LLMFacade:
+    load_dotenv(find_dotenv(usecwd=True), override=True)
+
+    if model in [m.value for m in OpenAIModels]:
+        api_key = os.getenv("OPENAI_API_KEY")
+        provider = Provider.OPENAI
+    elif model in [m.value for m in AnthropicModels]:
+        api_key = os.getenv("ANTHROPIC_API_KEY")
+        provider = Provider.ANTHROPIC
+    elif model in [m.value for m in GoogleModels]:
+        api_key = os.getenv("GEMINI_API_KEY")
+        provider = Provider.GOOGLE
+    elif model in [m.value for m in FireworksAIModels]:
+        api_key = os.getenv("FIREWORKS_AI_API_KEY")
+        provider = Provider.FIREWORKS_AI
+    else:
+        raise Exception("Invalid model")
+
+    return LLMFacade(provider, api_key, model, output_mode=output_mode)
+
+
+def legacy_get_available_providers() -> dict:
+    load_dotenv(find_dotenv(usecwd=True), override=True)
+    return {
+        "openai": bool(os.getenv("OPENAI_API_KEY")),
+        "anthropic": bool(os.getenv("ANTHROPIC_API_KEY")),
+        "google": bool(os.getenv("GEMINI_API_KEY")),
+        "fireworks_ai": bool(os.getenv("FIREWORKS_AI_API_KEY")),
+    }
+
+
+def bench(function, *args) -> float:
+    """
+    Return the best time per call (in microseconds).
+    """
+    times = timeit.repeat(lambda: function(*args), number=NUMBER, repeat=3)
+    return min(times) / NUMBER * 1e6
+
+
+def main():
+    print(f"{'call':>40} {'before (us)':>12} {'after (us)':>11} {'speedup':>8}")
+
+    for name, model in MODELS.items():
+        before = bench(legacy_get_llm_facade, model)
+        after = bench(utils.get_llm_facade, model)
+        print(
+            f"{f'get_llm_facade ({name})':>40} {before:>12.1f} {after:>11.1f}"
+            f" {before / after:>7.1f}x"
+        )
+
+    before = bench(legacy_get_available_providers)
+    after = bench(utils.get_available_providers)
+    print(
+        f"{'get_available_providers':>40} {before:>12.1f} {after:>11.1f}"
+        f" {before / after:>7.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    logging.getLogger("bpmn_assistant").setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as directory:
+        env_file = os.path.join(directory, ".env")
+        with open(env_file, "w") as file:
+            file.write(ENV_FILE)
+        os.chdir(directory)
+
+        utils.settings = Settings(env_file)
+        main()
@@ -0,0 +1,106 @@
+"""
+Benchmark of a modify turn on an existing process, serial (determine_intent_async, then
+edit_bpmn_async: change request, then edit) versus speculative (edit_bpmn_speculatively_async:
+the change request is defined while the intent is determined), and of a talk turn, where the
+speculative change request is cancelled.
+
+The LLM facades are in-process fakes answering every call after a fixed latency, so the
+timings only reflect the number of sequential LLM round-trips.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_speculative_modify.py
+"""
+
+import asyncio
+import logging
+import time
+from unittest.mock import AsyncMock, Mock
+
+from bpmn_assistant.core import LLMFacade, MessageItem
+from bpmn_assistant.services import BpmnModelingService, determine_intent_async
+
+LATENCY = 0.2  # Seconds per fake LLM call
+ROUNDS = 5
+PROCESS = [
+    {"type": "startEvent", "id": "start1"},
+    {"type": "task", "id": "task1", "label": "Review the application"},
+    {"type": "endEvent", "id": "end1"},
+]
+MESSAGE_HISTORY = [MessageItem(role="user", content="Remove the review task")]
+
+
+def fake_facade(*responses) -> LLMFacade:
+    """
+    A facade answering the calls with the responses in turn, after the latency.
+    """
+    responses = list(responses)
+
+    async def call_async(**kwargs):
+        await asyncio.sleep(LATENCY)
+        return responses.pop(0)
+
+    llm_facade = Mock(LLMFacade, usage=[])
+    llm_facade.call_async = AsyncMock(side_effect=call_async)
+    return llm_facade
+
+
+def facades(intent: str) -> tuple[LLMFacade, LLMFacade, LLMFacade]:
+    """
+    The intent, edit and text facades of one turn.
+    """
+    return (
+        fake_facade({"intent": intent}),
+        fake_facade(
+            {"function": "delete_element", "arguments": {"element_id": "task1"}},
+            {"stop": True},
+        ),
+        fake_facade("Delete the task 'Review the application'"),
+    )
+
+
+async def serial_turn(service: BpmnModelingService, intent: str) -> None:
+    intent_llm_facade, llm_facade, text_llm_facade = facades(intent)
+
+    intent_response = await determine_intent_async(intent_llm_facade, MESSAGE_HISTORY)
+    if intent_response["intent"] == "modify":
+        await service.edit_bpmn_async(
+            llm_facade, text_llm_facade, PROCESS, MESSAGE_HISTORY
+        )
+
+
+async def speculative_turn(service: BpmnModelingService, intent: str) -> None:
+    intent_llm_facade, llm_facade, text_llm_facade = facades(intent)
+
+    await service.edit_bpmn_speculatively_async(
+        llm_facade,
+        text_llm_facade,
+        PROCESS,
+        MESSAGE_HISTORY,
+        determine_intent_async(intent_llm_facade, MESSAGE_HISTORY),
+    )
+
+
+async def bench(turn, intent: str) -> float:
+    """
+    Return the average time of a turn (in seconds).
+    """
+    service = BpmnModelingService()
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        await turn(service, intent)
+    return (time.perf_counter() - start) / ROUNDS
+
+
+async def main():
+    print(f"{LATENCY * 1000:.0f} ms per LLM call")
+    print(f"{'turn':>6} {'serial (s)':>11} {'speculative (s)':>16}")
+
+    for intent in ["modify", "talk"]:
+        serial = await bench(serial_turn, intent)
+        speculative = await bench(speculative_turn, intent)
+        print(f"{intent:>6} {serial:>11.3f} {speculative:>16.3f}")
+
+
+if __name__ == "__main__":
+    logging.getLogger("bpmn_assistant").setLevel(logging.WARNING)
+    asyncio.run(main())
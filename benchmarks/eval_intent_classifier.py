@@ -0,0 +1,105 @@
+"""
+Offline evaluation of the local intent classifier (IntentClassifier) over recorded message
+histories, one JSON object per line with the "message_history" and the intent decided by the
+LLM (the format of INTENT_DECISIONS_LOG).
+
+The naive Bayes model is evaluated by k-fold cross-validation. For every confidence
+threshold, the report shows the share of the turns answered locally (the LLM calls avoided),
+the accuracy of these local answers, and the time per classification.
+
+Usage:
+    PYTHONPATH=src python benchmarks/eval_intent_classifier.py [histories.jsonl]
+    PYTHONPATH=src python benchmarks/eval_intent_classifier.py \
+        histories.jsonl --save-model model.json
+"""
+
+import argparse
+import logging
+import os
+import random
+import time
+
+from bpmn_assistant.services import IntentClassifier
+
+DEFAULT_HISTORIES = os.path.join(
+    os.path.dirname(__file__), "data", "intent_histories.jsonl"
+)
+THRESHOLDS = [0.6, 0.7, 0.8, 0.9, 0.95, 0.99]
+FOLDS = 5
+
+
+def cross_validated_predictions(
+    decisions: list, use_model: bool
+) -> list[tuple[str, float, str]]:
+    """
+    Predict every decision with a model trained on the other folds.
+    Returns:
+        The (predicted intent, confidence, recorded intent) triples
+    """
+    predictions = []
+
+    for fold in range(FOLDS):
+        train = [d for i, d in enumerate(decisions) if i % FOLDS != fold]
+        test = [d for i, d in enumerate(decisions) if i % FOLDS == fold]
+
+        model = IntentClassifier.train_model(train) if use_model else None
+        classifier = IntentClassifier(model=model)
+
+        for history, intent in test:
+            predicted, confidence = classifier.predict(history)
+            predictions.append((predicted, confidence, intent))
+
+    return predictions
+
+
+def time_per_classification(decisions: list) -> float:
+    """
+    Return the time per classification (in microseconds) with a model trained on everything.
+    """
+    classifier = IntentClassifier(model=IntentClassifier.train_model(decisions))
+    histories = [history for history, _ in decisions] * 20
+
+    start = time.perf_counter()
+    for history in histories:
+        classifier.classify(history)
+    return (time.perf_counter() - start) / len(histories) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("histories", nargs="?", default=DEFAULT_HISTORIES)
+    parser.add_argument(
+        "--save-model", help="Train on all the histories and save the model"
+    )
+    args = parser.parse_args()
+
+    decisions = IntentClassifier.load_decisions(args.histories)
+    random.Random(0).shuffle(decisions)
+    print(f"{len(decisions)} recorded decisions, {FOLDS}-fold cross-validation")
+    print(f"{time_per_classification(decisions):.1f} us per classification")
+    print()
+
+    for name, use_model in [("rules only", False), ("rules + model", True)]:
+        predictions = cross_validated_predictions(decisions, use_model)
+        print(name)
+        print(f"{'threshold':>10} {'answered locally':>17} {'accuracy':>9}")
+
+        for threshold in THRESHOLDS:
+            answered = [p for p in predictions if p[1] >= threshold]
+            correct = sum(1 for predicted, _, intent in answered if predicted == intent)
+            accuracy = correct / len(answered) if answered else float("nan")
+            print(
+                f"{threshold:>10.2f} {len(answered) / len(predictions):>16.0%}"
+                f" {accuracy:>9.1%}"
+            )
+        print()
+
+    if args.save_model:
+        model = IntentClassifier.train_model(decisions)
+        IntentClassifier.save_model(model, args.save_model)
+        print(f"Model saved to {args.save_model}")
+
+
+if __name__ == "__main__":
+    logging.getLogger("bpmn_assistant").setLevel(logging.WARNING)
+    main()
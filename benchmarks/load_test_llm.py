@@ -0,0 +1,107 @@
+"""
+Load test of the LLM path against a local mock LLM server (mock_llm_server.py), which
+answers every call after a fixed latency.
+
+N concurrent intent determinations are run on one event loop, as one uvicorn worker would:
+- blocking: the synchronous `determine_intent` called from a coroutine (the event loop is
+  blocked for every LLM round-trip, so the calls run one after the other)
+- async: `determine_intent_async`
+- endpoint: POST /determine_intent on the FastAPI app (through an in-process ASGI transport)
+
+The Anthropic and OpenAI clients are pointed at the mock server, so both the Anthropic
+provider and the LiteLLM provider (e.g. MODEL=gpt-4o-mini) can be load tested.
+
+Usage:
+    PYTHONPATH=src python benchmarks/load_test_llm.py
+    MODEL=gpt-4o-mini PYTHONPATH=src python benchmarks/load_test_llm.py
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Awaitable, Callable
+
+import httpx
+
+from mock_llm_server import free_port, start_in_thread
+
+LATENCY = 0.1  # Seconds per mocked LLM call
+CONCURRENCY = [1, 10, 100, 500]
+MAX_BLOCKING_CONCURRENCY = 100  # Beyond this the blocking runs take too long
+MODEL = os.getenv("MODEL", "claude-3-5-haiku-20241022")
+MESSAGE_HISTORY = [{"role": "user", "content": "Add a review task after the approval."}]
+
+port = free_port()
+os.environ["ANTHROPIC_BASE_URL"] = f"http://127.0.0.1:{port}"
+os.environ["ANTHROPIC_API_KEY"] = "mock-api-key"
+os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{port}/v1"
+os.environ["OPENAI_API_KEY"] = "mock-api-key"
+
+from bpmn_assistant.app import app  # noqa: E402 (reads the environment variables)
+from bpmn_assistant.core import MessageItem  # noqa: E402
+from bpmn_assistant.services import (  # noqa: E402
+    determine_intent,
+    determine_intent_async,
+)
+from bpmn_assistant.utils import get_llm_facade  # noqa: E402
+
+message_history = [MessageItem(**message) for message in MESSAGE_HISTORY]
+
+
+async def blocking_call() -> None:
+    determine_intent(get_llm_facade(MODEL), message_history)
+
+
+async def async_call() -> None:
+    await determine_intent_async(get_llm_facade(MODEL), message_history)
+
+
+def endpoint_call(client: httpx.AsyncClient) -> Callable[[], Awaitable[None]]:
+    async def call() -> None:
+        response = await client.post(
+            "/determine_intent",
+            json={"message_history": MESSAGE_HISTORY, "model": MODEL},
+        )
+        response.raise_for_status()
+
+    return call
+
+
+async def run(call: Callable[[], Awaitable[None]], concurrency: int) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(call() for _ in range(concurrency)))
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    print(f"Mock LLM latency: {LATENCY * 1000:.0f} ms per call")
+    print(
+        f"{'concurrent calls':>16} {'mode':>10} {'wall time (s)':>14} {'calls/s':>10}"
+    )
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://app", timeout=None
+    ) as client:
+        modes = {
+            "blocking": blocking_call,
+            "async": async_call,
+            "endpoint": endpoint_call(client),
+        }
+
+        for concurrency in CONCURRENCY:
+            for mode, call in modes.items():
+                if mode == "blocking" and concurrency > MAX_BLOCKING_CONCURRENCY:
+                    continue
+                elapsed = await run(call, concurrency)
+                print(
+                    f"{concurrency:>16} {mode:>10} {elapsed:>14.2f} "
+                    f"{concurrency / elapsed:>10.1f}"
+                )
+
+
+if __name__ == "__main__":
+    logging.getLogger("bpmn_assistant").setLevel(logging.WARNING)
+    start_in_thread(port, LATENCY)
+    asyncio.run(main())
@@ -0,0 +1,135 @@
+"""
+Count the connections opened to the LLM API under a sustained mix of requests, with one
+set of API clients per request (as before LLMClientRegistry) and with the process-wide
+registry of clients shared by all the requests.
+
+The mix replays, against a local mock LLM server (mock_llm_server.py), what the endpoints
+do: /determine_intent makes one JSON call, /modify makes two JSON calls and a text call on
+two facades. The requests run both on a thread pool (sync API) and on an event loop
+(async API).
+
+Usage:
+    PYTHONPATH=src python benchmarks/load_test_llm_connections.py
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from mock_llm_server import free_port, start_in_thread
+
+LATENCY = 0.02  # Seconds per mocked LLM call
+REQUESTS = 300  # Requests per run, 1 in 3 is a /modify
+THREADS = 16
+CONCURRENCY = 50  # In-flight requests on the event loop
+MODEL = "claude-3-5-haiku-20241022"
+API_KEY = "mock-api-key"
+
+port = free_port()
+os.environ["ANTHROPIC_BASE_URL"] = f"http://127.0.0.1:{port}"
+
+from bpmn_assistant.core import LLMClientRegistry, LLMFacade  # noqa: E402
+from bpmn_assistant.core.enums import OutputMode, Provider  # noqa: E402
+
+
+def make_facade(
+    registry: LLMClientRegistry, output_mode: OutputMode = OutputMode.JSON
+) -> LLMFacade:
+    return LLMFacade(
+        Provider.ANTHROPIC,
+        API_KEY,
+        MODEL,
+        output_mode=output_mode,
+        client_registry=registry,
+    )
+
+
+def sync_request(index: int, shared_registry: Optional[LLMClientRegistry]) -> None:
+    # Without a shared registry, the facades of every request get their own clients
+    registry = shared_registry or LLMClientRegistry()
+
+    llm_facade = make_facade(registry)
+    llm_facade.call("Determine the intent")
+
+    if index % 3 == 0:
+        text_llm_facade = make_facade(registry, OutputMode.TEXT)
+        llm_facade.call("Edit the process")
+        text_llm_facade.call("Comment on the changes")
+
+    if shared_registry is None:
+        registry.close()
+
+
+async def async_request(
+    index: int, shared_registry: Optional[LLMClientRegistry]
+) -> None:
+    registry = shared_registry or LLMClientRegistry()
+
+    llm_facade = make_facade(registry)
+    await llm_facade.call_async("Determine the intent")
+
+    if index % 3 == 0:
+        text_llm_facade = make_facade(registry, OutputMode.TEXT)
+        await llm_facade.call_async("Edit the process")
+        await text_llm_facade.call_async("Comment on the changes")
+
+    if shared_registry is None:
+        await registry.aclose()
+
+
+def run_threads(registry: Optional[LLMClientRegistry]) -> None:
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        list(executor.map(lambda i: sync_request(i, registry), range(REQUESTS)))
+
+
+def run_event_loop(registry: Optional[LLMClientRegistry]) -> None:
+    async def main() -> None:
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+
+        async def request(index: int) -> None:
+            async with semaphore:
+                await async_request(index, registry)
+
+        await asyncio.gather(*(request(i) for i in range(REQUESTS)))
+
+        if registry is not None:
+            await registry.aclose()
+
+    asyncio.run(main())
+
+
+def server_stats(method: str = "GET") -> dict:
+    request = urllib.request.Request(f"http://127.0.0.1:{port}/stats", method=method)
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read() or "null")
+
+
+if __name__ == "__main__":
+    logging.getLogger("bpmn_assistant").setLevel(logging.WARNING)
+    start_in_thread(port, LATENCY)
+
+    print(f"{REQUESTS} requests per run, mock LLM latency {LATENCY * 1000:.0f} ms")
+    print(
+        f"{'clients':>20} {'API':>6} {'wall time (s)':>14} {'LLM calls':>10} "
+        f"{'connections':>12}"
+    )
+
+    for api, run in [("sync", run_threads), ("async", run_event_loop)]:
+        for name, registry in [
+            ("one per request", None),
+            ("shared registry", LLMClientRegistry()),
+        ]:
+            server_stats("DELETE")
+            start = time.perf_counter()
+            run(registry)
+            elapsed = time.perf_counter() - start
+            stats = server_stats()
+            print(
+                f"{name:>20} {api:>6} {elapsed:>14.2f} {stats['requests']:>10} "
+                f"{stats['connections']:>12}"
+            )
@@ -0,0 +1,131 @@
+"""
+A local mock of the LLM APIs, for load tests: answers the Anthropic Messages API
+(POST /v1/messages) and the OpenAI Chat Completions API (POST /v1/chat/completions) after a
+fixed latency, without doing any work. JSON-mode requests get a valid "determine intent"
+answer, the other ones a short text. GET /stats returns the number of requests served and
+of client connections (distinct client addresses) seen, DELETE /stats resets them.
+
+Usage:
+    python benchmarks/mock_llm_server.py [port] [latency in seconds]
+"""
+
+import asyncio
+import socket
+import sys
+import threading
+import time
+import uuid
+from typing import Any
+
+import uvicorn
+from fastapi import FastAPI, Request
+
+INTENT_JSON = '{"intent": "modify"}'
+TEXT_REPLY = "Sure, here is the process."
+
+
+def create_app(latency: float) -> FastAPI:
+    app = FastAPI()
+    app.state.requests = 0
+    app.state.connections = set()
+
+    @app.middleware("http")
+    async def count_connections(request: Request, call_next):
+        if request.url.path != "/stats":
+            app.state.requests += 1
+            app.state.connections.add(request.scope["client"])
+        return await call_next(request)
+
+    @app.get("/stats")
+    async def stats() -> dict[str, int]:
+        return {
+            "requests": app.state.requests,
+            "connections": len(app.state.connections),
+        }
+
+    @app.delete("/stats")
+    async def reset_stats() -> None:
+        app.state.requests = 0
+        app.state.connections.clear()
+
+    @app.post("/v1/messages")
+    async def messages(request: Request) -> dict[str, Any]:
+        body = await request.json()
+        await asyncio.sleep(latency)
+
+        last_message = body["messages"][-1]
+        if last_message["role"] == "assistant" and last_message["content"] == "{":
+            # The provider prefilled "{" to constrain the output to a JSON object
+            text = INTENT_JSON[1:]
+        else:
+            text = TEXT_REPLY
+
+        return {
+            "id": f"msg_{uuid.uuid4().hex}",
+            "type": "message",
+            "role": "assistant",
+            "model": body["model"],
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": 10, "output_tokens": 10},
+        }
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request) -> dict[str, Any]:
+        body = await request.json()
+        await asyncio.sleep(latency)
+
+        is_json = body.get("response_format") is not None
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body["model"],
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {
+                        "role": "assistant",
+                        "content": INTENT_JSON if is_json else TEXT_REPLY,
+                    },
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 10, "total_tokens": 20},
+        }
+
+    return app
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_in_thread(port: int, latency: float) -> uvicorn.Server:
+    """
+    Start the mock server in a daemon thread and wait until it accepts connections.
+    """
+    server = uvicorn.Server(
+        uvicorn.Config(
+            create_app(latency),
+            host="127.0.0.1",
+            port=port,
+            log_level="warning",
+            backlog=4096,
+        )
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+
+    while not server.started:
+        time.sleep(0.01)
+
+    return server
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8089
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.2
+    uvicorn.run(create_app(latency), host="127.0.0.1", port=port, backlog=4096)
@@ -0,0 +1,212 @@
+"""
+Generators for synthetic BPMN documents used by the benchmarks.
+"""
+
+BPMN_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<bpmn:definitions xmlns:bpmn="http://www.omg.org/spec/BPMN/20100524/MODEL" '
+    'xmlns:bpmndi="http://www.omg.org/spec/BPMN/20100524/DI" '
+    'xmlns:dc="http://www.omg.org/spec/DD/20100524/DC" '
+    'xmlns:di="http://www.omg.org/spec/DD/20100524/DI" id="Definitions_1">\n'
+)
+BPMN_FOOTER = "</bpmn:definitions>\n"
+
+
+def _element(tag: str, element_id: str, name: str | None = None) -> str:
+    name_attr = f' name="{name}"' if name else ""
+    return f'    <bpmn:{tag} id="{element_id}"{name_attr} />\n'
+
+
+def _flow(source: str, target: str, name: str | None = None) -> str:
+    name_attr = f' name="{name}"' if name else ""
+    return (
+        f'    <bpmn:sequenceFlow id="{source}-{target}"{name_attr} '
+        f'sourceRef="{source}" targetRef="{target}" />\n'
+    )
+
+
+def _diagram(element_ids: list[str], flows: list[tuple[str, str]]) -> str:
+    """
+    Build a BPMNDiagram section with one shape per element and one edge per flow,
+    mimicking the DI section exported by modeling tools.
+    """
+    parts = [
+        '  <bpmndi:BPMNDiagram id="BPMNDiagram_1">\n',
+        '    <bpmndi:BPMNPlane id="BPMNPlane_1" bpmnElement="Process_1">\n',
+    ]
+    for index, element_id in enumerate(element_ids):
+        parts.append(
+            f'      <bpmndi:BPMNShape id="{element_id}_di" bpmnElement="{element_id}">\n'
+            f'        <dc:Bounds x="{index * 150}" y="100" width="100" height="80" />\n'
+            f"      </bpmndi:BPMNShape>\n"
+        )
+    for index, (source, target) in enumerate(flows):
+        parts.append(
+            f'      <bpmndi:BPMNEdge id="{source}-{target}_di" bpmnElement="{source}-{target}">\n'
+            f'        <di:waypoint x="{index * 150 + 100}" y="140" />\n'
+            f'        <di:waypoint x="{index * 150 + 150}" y="140" />\n'
+            f"      </bpmndi:BPMNEdge>\n"
+        )
+    parts.append("    </bpmndi:BPMNPlane>\n  </bpmndi:BPMNDiagram>\n")
+    return "".join(parts)
+
+
+def make_linear_bpmn(num_elements: int, with_diagram: bool = False) -> str:
+    """
+    Create a linear process with a start event, (num_elements - 2) tasks and an end event.
+    """
+    element_ids = ["start"]
+    element_ids += [f"task{i}" for i in range(1, num_elements - 1)]
+    element_ids.append("end")
+
+    parts = [BPMN_HEADER, '  <bpmn:process id="Process_1" isExecutable="false">\n']
+    parts.append(_element("startEvent", "start"))
+    for element_id in element_ids[1:-1]:
+        parts.append(_element("task", element_id, f"Task {element_id}"))
+    parts.append(_element("endEvent", "end"))
+
+    flows = list(zip(element_ids, element_ids[1:]))
+    parts += [_flow(source, target) for source, target in flows]
+    parts.append("  </bpmn:process>\n")
+
+    if with_diagram:
+        parts.append(_diagram(element_ids, flows))
+
+    parts.append(BPMN_FOOTER)
+    return "".join(parts)
+
+
+def make_branchy_bpmn(num_elements: int, with_diagram: bool = False) -> str:
+    """
+    Create a process made of consecutive exclusive gateway blocks (split, two tasks, join),
+    with roughly num_elements elements in total. The number of distinct paths through the
+    process doubles with every block.
+    """
+    element_ids = ["start"]
+    parts = [BPMN_HEADER, '  <bpmn:process id="Process_1" isExecutable="false">\n']
+    parts.append(_element("startEvent", "start"))
+    flows: list[tuple[str, str]] = []
+    flow_names: dict[tuple[str, str], str] = {}
+
+    previous = "start"
+    for block in range((num_elements - 2) // 4):
+        split, join = f"split{block}", f"join{block}"
+        yes, no = f"yes{block}", f"no{block}"
+        parts.append(_element("exclusiveGateway", split, f"Decision {block}"))
+        parts.append(_element("task", yes, f"Task {yes}"))
+        parts.append(_element("task", no, f"Task {no}"))
+        parts.append(_element("exclusiveGateway", join))
+        element_ids += [split, yes, no, join]
+        flows += [(previous, split), (split, yes), (split, no), (yes, join), (no, join)]
+        flow_names[(split, yes)] = "Yes"
+        flow_names[(split, no)] = "No"
+        previous = join
+
+    parts.append(_element("endEvent", "end"))
+    element_ids.append("end")
+    flows.append((previous, "end"))
+
+    parts += [_flow(source, target, flow_names.get((source, target))) for source, target in flows]
+    parts.append("  </bpmn:process>\n")
+
+    if with_diagram:
+        parts.append(_diagram(element_ids, flows))
+
+    parts.append(BPMN_FOOTER)
+    return "".join(parts)
+
+
+def make_linear_process(num_elements: int) -> list[dict]:
+    """
+    Create the JSON representation of a linear process with num_elements elements.
+    """
+    process = [{"type": "startEvent", "id": "start"}]
+    process += [
+        {"type": "task", "id": f"task{i}", "label": f"Task {i}"}
+        for i in range(1, num_elements - 1)
+    ]
+    process.append({"type": "endEvent", "id": "end"})
+    return process
+
+
+def make_branchy_process(num_elements: int) -> list[dict]:
+    """
+    Create the JSON representation of a process made of consecutive exclusive gateways
+    (with a join) and parallel gateways, each with two single-task branches, with roughly
+    num_elements elements in total.
+    """
+    process: list[dict] = [{"type": "startEvent", "id": "start"}]
+
+    for block in range((num_elements - 2) // 4):
+        if block % 2:
+            process.append(
+                {
+                    "type": "parallelGateway",
+                    "id": f"pg{block}",
+                    "branches": [
+                        [{"type": "task", "id": f"a{block}", "label": f"Task a{block}"}],
+                        [{"type": "task", "id": f"b{block}", "label": f"Task b{block}"}],
+                    ],
+                }
+            )
+        else:
+            process.append(
+                {
+                    "type": "exclusiveGateway",
+                    "id": f"eg{block}",
+                    "label": f"Decision {block}",
+                    "has_join": True,
+                    "branches": [
+                        {
+                            "condition": "Yes",
+                            "path": [
+                                {"type": "task", "id": f"a{block}", "label": f"Task a{block}"}
+                            ],
+                        },
+                        {
+                            "condition": "No",
+                            "path": [
+                                {"type": "task", "id": f"b{block}", "label": f"Task b{block}"}
+                            ],
+                        },
+                    ],
+                }
+            )
+
+    process.append({"type": "endEvent", "id": "end"})
+    return process
+
+
+def make_nested_process(depth: int, tasks_per_branch: int = 10) -> list[dict]:
+    """
+    Create the JSON representation of a process with `depth` nested exclusive gateways: the
+    first branch of every gateway contains tasks followed by the next gateway, the second
+    branch only contains tasks.
+    """
+
+    def tasks(prefix: str) -> list[dict]:
+        return [
+            {"type": "task", "id": f"{prefix}_{i}", "label": f"Task {prefix} {i}"}
+            for i in range(tasks_per_branch)
+        ]
+
+    nested: list[dict] = tasks("leaf")
+    for level in reversed(range(depth)):
+        nested = [
+            {
+                "type": "exclusiveGateway",
+                "id": f"eg{level}",
+                "label": f"Decision {level}",
+                "has_join": True,
+                "branches": [
+                    {"condition": "Yes", "path": tasks(f"yes{level}") + nested},
+                    {"condition": "No", "path": tasks(f"no{level}")},
+                ],
+            }
+        ]
+
+    return (
+        [{"type": "startEvent", "id": "start"}]
+        + nested
+        + [{"type": "endEvent", "id": "end"}]
+    )
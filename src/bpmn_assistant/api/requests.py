@@ -7,6 +7,12 @@ from bpmn_assistant.core import MessageItem
 
 class BpmnToJsonRequest(BaseModel):
     bpmn_xml: str  # The BPMN XML to be converted to JSON
+    streaming: bool = False  # Whether to parse the XML incrementally (for large diagrams)
+
+
+class BpmnToJsonBatchRequest(BaseModel):
+    bpmn_xmls: list[str]  # The BPMN XML documents to be converted to JSON
+    streaming: bool = False  # Whether to parse the XML incrementally (for large diagrams)
 
 
 class DetermineIntentRequest(BaseModel):
@@ -18,6 +24,7 @@ class ModifyBpmnRequest(BaseModel):
     message_history: list[MessageItem]  # The message history
     process: list[dict[str, Any]] | None  # The process to be updated (if it exists)
     model: str  # The model to be used
+    layout: bool = False  # Whether to lay out the diagram (add the DI section to the XML)
 
 
 class ConversationalRequest(BaseModel):
@@ -1,21 +1,31 @@
+import itertools
+import json
+from typing import Any, Iterator
+
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from starlette.middleware.cors import CORSMiddleware
 
 from bpmn_assistant.api.requests import (
+    BpmnToJsonBatchRequest,
     BpmnToJsonRequest,
     ConversationalRequest,
     DetermineIntentRequest,
     ModifyBpmnRequest,
 )
-from bpmn_assistant.core import handle_exceptions
+from bpmn_assistant.config import settings
+from bpmn_assistant.core import ResponseCache, handle_exceptions, llm_usage_tracker
 from bpmn_assistant.core.enums import OutputMode
 from bpmn_assistant.services import (
+    BpmnBatchConverter,
     BpmnJsonGenerator,
     BpmnModelingService,
     BpmnXmlGenerator,
     ConversationalService,
-    determine_intent,
+    ConversionCache,
+    IntentClassifier,
+    determine_intent_async,
 )
 from bpmn_assistant.utils import (
     replace_reasoning_model,
@@ -33,8 +43,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-bpmn_modeling_service = BpmnModelingService()
-bpmn_xml_generator = BpmnXmlGenerator()
+# Reload the .env file (e.g. rotated API keys) on SIGHUP
+settings.install_reload_signal_handler()
+
+# Send only the changes to the process in the editing steps, with the full process every
+# EDIT_DIFF_CHECKPOINT_INTERVAL steps
+bpmn_modeling_service = BpmnModelingService.from_env()
+conversion_cache = ConversionCache.from_env()
+response_cache = ResponseCache.from_env()
+intent_classifier = IntentClassifier.from_env()
+bpmn_xml_generator = BpmnXmlGenerator(cache=conversion_cache)
+bpmn_batch_converter = BpmnBatchConverter.from_env()
 
 
 @app.post("/bpmn_to_json")
@@ -43,11 +62,71 @@ async def _bpmn_to_json(request: BpmnToJsonRequest) -> JSONResponse:
     """
     Convert the BPMN XML to its JSON representation
     """
+    bpmn_json_generator = BpmnJsonGenerator(cache=conversion_cache)
+    result = bpmn_json_generator.create_bpmn_json(
+        request.bpmn_xml, streaming=request.streaming
+    )
+    return JSONResponse(content=result)
+
+
+@app.post("/bpmn_to_json_by_process")
+@handle_exceptions
+async def _bpmn_to_json_by_process(request: BpmnToJsonRequest) -> JSONResponse:
+    """
+    Convert every process of the BPMN XML (e.g. a collaboration) to its JSON representation.
+    Returns the JSON representation of each process, keyed by process id.
+    """
     bpmn_json_generator = BpmnJsonGenerator()
-    result = bpmn_json_generator.create_bpmn_json(request.bpmn_xml)
+    result = await run_in_threadpool(
+        bpmn_json_generator.create_bpmn_json_by_process,
+        request.bpmn_xml,
+        streaming=request.streaming,
+        executor=bpmn_batch_converter.executor,
+    )
     return JSONResponse(content=result)
 
 
+@app.post("/bpmn_to_json_batch")
+@handle_exceptions
+async def _bpmn_to_json_batch(request: BpmnToJsonBatchRequest) -> JSONResponse:
+    """
+    Convert many BPMN XML documents to their JSON representation in parallel.
+    Returns a result per document (the JSON or the error), in the same order.
+    """
+    results = await bpmn_batch_converter.convert_async(
+        request.bpmn_xmls, streaming=request.streaming
+    )
+    return JSONResponse(content=results)
+
+
+@app.get("/conversion_cache_stats")
+@handle_exceptions
+async def _conversion_cache_stats() -> JSONResponse:
+    """
+    Get the hit/miss counters and the size of the conversion cache
+    """
+    return JSONResponse(content=conversion_cache.stats())
+
+
+@app.get("/response_cache_stats")
+@handle_exceptions
+async def _response_cache_stats() -> JSONResponse:
+    """
+    Get the hit/miss counters of the LLM response cache and the latency it saved
+    """
+    return JSONResponse(content=response_cache.stats())
+
+
+@app.get("/llm_usage_stats")
+@handle_exceptions
+async def _llm_usage_stats() -> JSONResponse:
+    """
+    Get the token totals of the LLM calls (cached and uncached input tokens) and their
+    average latency
+    """
+    return JSONResponse(content=llm_usage_tracker.stats())
+
+
 @app.get("/available_providers")
 @handle_exceptions
 async def _available_providers() -> JSONResponse:
@@ -66,13 +145,51 @@ async def _determine_intent(request: DetermineIntentRequest) -> JSONResponse:
     """
     model = replace_reasoning_model(request.model)
     llm_facade = get_llm_facade(model)
-    intent = determine_intent(llm_facade, request.message_history)
+    intent = await determine_intent_async(
+        llm_facade,
+        request.message_history,
+        response_cache=response_cache.for_endpoint("determine_intent"),
+        intent_classifier=intent_classifier,
+    )
     return JSONResponse(content=intent)
 
 
+def _modify_response(
+    process: list[dict[str, Any]], with_layout: bool, intent: str | None = None
+) -> StreamingResponse:
+    """
+    Stream the JSON body {"bpmn_xml": ..., "bpmn_json": ...} (preceded by the "intent" if
+    given), escaping the BPMN XML chunk by chunk. The body is identical to the one
+    JSONResponse would render.
+
+    A failure while iterating a StreamingResponse would cut the response off after its 200
+    status, so everything but the rest of the XML is built before the response is
+    returned: the process is transformed (and laid out) by `iter_bpmn_xml`, and the first
+    XML chunk (the whole XML, unless it exceeds the chunk size) and the bpmn_json are
+    serialized here. A failure is therefore still turned into an error response by
+    `handle_exceptions`.
+    """
+    bpmn_xml_chunks = bpmn_xml_generator.iter_bpmn_xml(process, with_layout=with_layout)
+    first_chunk = next(bpmn_xml_chunks, "")
+    bpmn_json = json.dumps(process, ensure_ascii=False, separators=(",", ":"))
+
+    if intent is not None:
+        head = f'{{"intent":{json.dumps(intent, ensure_ascii=False)},"bpmn_xml":"'
+    else:
+        head = '{"bpmn_xml":"'
+
+    def body() -> Iterator[str]:
+        yield head
+        for chunk in itertools.chain([first_chunk], bpmn_xml_chunks):
+            yield json.dumps(chunk, ensure_ascii=False)[1:-1]
+        yield f'","bpmn_json":{bpmn_json}}}'
+
+    return StreamingResponse(body(), media_type="application/json")
+
+
 @app.post("/modify")
 @handle_exceptions
-async def _modify(request: ModifyBpmnRequest) -> JSONResponse:
+async def _modify(request: ModifyBpmnRequest) -> StreamingResponse:
     """
     Modify the BPMN process based on the user query. If the request does not contain a BPMN JSON,
     then create a new BPMN process. Otherwise, edit the existing BPMN process.
@@ -81,17 +198,65 @@ async def _modify(request: ModifyBpmnRequest) -> JSONResponse:
     text_llm_facade = get_llm_facade(request.model, OutputMode.TEXT)
 
     if request.process:
-        process = bpmn_modeling_service.edit_bpmn(
-            llm_facade, text_llm_facade, request.process, request.message_history
+        process = await bpmn_modeling_service.edit_bpmn_async(
+            llm_facade,
+            text_llm_facade,
+            request.process,
+            request.message_history,
+            response_cache=response_cache.for_endpoint("define_change_request"),
         )
     else:
-        process = bpmn_modeling_service.create_bpmn(
+        process = await bpmn_modeling_service.create_bpmn_async(
             llm_facade,
             request.message_history,
         )
 
-    bpmn_xml_string = bpmn_xml_generator.create_bpmn_xml(process)
-    return JSONResponse(content={"bpmn_xml": bpmn_xml_string, "bpmn_json": process})
+    return _modify_response(process, request.layout)
+
+
+@app.post("/determine_intent_and_modify")
+@handle_exceptions
+async def _determine_intent_and_modify(request: ModifyBpmnRequest) -> Response:
+    """
+    Determine the intent of the user query and, if it is "modify", modify the BPMN process
+    (see /modify). If the process exists, the change request is defined while the intent is
+    being determined. Returns {"intent": "talk"} or {"intent": "modify", "bpmn_xml": ...,
+    "bpmn_json": ...}.
+    """
+    intent_llm_facade = get_llm_facade(replace_reasoning_model(request.model))
+    llm_facade = get_llm_facade(request.model)
+    text_llm_facade = get_llm_facade(request.model, OutputMode.TEXT)
+
+    # Awaited below, or by the speculative edit while it defines the change request
+    intent_determination = determine_intent_async(
+        intent_llm_facade,
+        request.message_history,
+        response_cache=response_cache.for_endpoint("determine_intent"),
+        intent_classifier=intent_classifier,
+    )
+
+    if request.process:
+        intent, process = await bpmn_modeling_service.edit_bpmn_speculatively_async(
+            llm_facade,
+            text_llm_facade,
+            request.process,
+            request.message_history,
+            intent_determination,
+            response_cache=response_cache.for_endpoint("define_change_request"),
+        )
+    else:
+        intent = await intent_determination
+        process = None
+        if intent["intent"] == "modify":
+            process = await bpmn_modeling_service.create_bpmn_async(
+                llm_facade,
+                request.message_history,
+            )
+
+    if process is None:
+        return JSONResponse(content=intent)
+
+    return _modify_response(process, request.layout, intent["intent"])
 
 
 @app.post("/talk")
@@ -100,11 +265,11 @@ async def _talk(request: ConversationalRequest) -> StreamingResponse:
     conversational_service = ConversationalService(model)
 
     if request.needs_to_be_final_comment:
-        response_generator = conversational_service.make_final_comment(
+        response_generator = conversational_service.make_final_comment_async(
             request.message_history, request.process
         )
     else:
-        response_generator = conversational_service.respond_to_query(
+        response_generator = conversational_service.respond_to_query_async(
             request.message_history, request.process
         )
 
@@ -1,6 +1,7 @@
 import logging
 
 from .log_config import setup_logger
+from .settings import Settings, settings
 
 setup_logger()
 logger = logging.getLogger(__name__)
@@ -0,0 +1,98 @@
+import os
+import signal
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from dotenv import find_dotenv, load_dotenv
+
+
+class Settings:
+    """
+    The settings of the application: the environment variables, overridden by the variables
+    of the .env file. The .env file is loaded once, and loaded again when it changes (checked
+    at most every `check_interval` seconds) or when a reload is requested (e.g. on SIGHUP),
+    so that reading a setting costs no file I/O.
+    """
+
+    def __init__(
+        self, env_file: Optional[str | Path] = None, check_interval: float = 2.0
+    ):
+        """
+        Args:
+            env_file: The .env file (defaults to the first .env file found in the parent
+                directories of the package)
+            check_interval: The minimum time between two checks of the .env file, in seconds
+        """
+        if env_file is None:
+            env_file = find_dotenv() or None
+        self.env_file = Path(env_file) if env_file else None
+        self.check_interval = check_interval
+        self.reloads = 0
+        self._mtime: Optional[float] = None
+        self._next_check = 0.0
+        self._reload_requested = True
+        self._lock = threading.Lock()
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Get the value of the setting, or the default if it is not set.
+        """
+        self._reload_if_needed()
+        return os.environ.get(name, default)
+
+    def request_reload(self) -> None:
+        """
+        Reload the .env file before the next setting is read (safe to call from a signal
+        handler).
+        """
+        self._reload_requested = True
+
+    def install_reload_signal_handler(self) -> bool:
+        """
+        Reload the .env file on SIGHUP. Only possible from the main thread, on platforms that
+        have SIGHUP.
+        Returns:
+            Whether the handler was installed
+        """
+        if not hasattr(signal, "SIGHUP"):
+            return False
+        if threading.current_thread() is not threading.main_thread():
+            return False
+
+        signal.signal(signal.SIGHUP, lambda signum, frame: self.request_reload())
+        return True
+
+    def _reload_if_needed(self) -> None:
+        with self._lock:
+            if not self._reload_requested:
+                now = time.monotonic()
+                if now < self._next_check:
+                    return
+                self._next_check = now + self.check_interval
+                if self._env_file_mtime() == self._mtime:
+                    return
+
+            self._reload()
+
+    def _reload(self) -> None:
+        self._reload_requested = False
+        self._mtime = self._env_file_mtime()
+        self._next_check = time.monotonic() + self.check_interval
+        self.reloads += 1
+
+        if self.env_file is not None:
+            load_dotenv(self.env_file, override=True)
+
+    def _env_file_mtime(self) -> Optional[float]:
+        if self.env_file is None:
+            return None
+        try:
+            return self.env_file.stat().st_mtime
+        except OSError:
+            return None
+
+
+# The settings of the process
+settings = Settings()
@@ -1,3 +1,13 @@
+from .cache import LRUCache, SQLiteCache
+from .cacheable_prompt import CacheablePrompt
+from .llm_client_registry import LLMClientRegistry, llm_client_registry
 from .llm_facade import LLMFacade
+from .llm_usage import LLMUsage, LLMUsageTracker, llm_usage_tracker
+from .response_cache import ResponseCache
+from .llm_conversation import (
+    LLMConversation,
+    run_conversation,
+    run_conversation_async,
+)
 from .schemas import *
-from .decorators import handle_exceptions
\ No newline at end of file
+from .decorators import handle_exceptions
@@ -0,0 +1,273 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+from bpmn_assistant.config import logger
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded LRU cache of string values, with an optional time-to-live and
+    optional on-disk persistence.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 128,
+        ttl: Optional[float] = None,
+        persist_dir: Optional[str | Path] = None,
+    ):
+        """
+        Args:
+            max_size: The maximum number of entries (0 disables the cache)
+            ttl: The time-to-live of the entries in seconds (None means no expiry)
+            persist_dir: A directory where the entries are mirrored, one file per entry, so that
+                they survive restarts. The keys must then be valid file names.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.persist_dir = Path(persist_dir) if persist_dir else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[Optional[float], str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        if self.persist_dir is not None:
+            self.persist_dir.mkdir(parents=True, exist_ok=True)
+            self._load_persisted_entries(self.persist_dir)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get the value cached for the key, or None if there is none (or it has expired).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and self._is_expired(entry[0]):
+                self._delete(key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Cache the value for the key, evicting the least recently used entries if needed.
+        """
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            expires_at = time.time() + self.ttl if self.ttl is not None else None
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            self._persist(key, value)
+
+            while len(self._entries) > self.max_size:
+                oldest_key = next(iter(self._entries))
+                self._delete(oldest_key)
+
+    def clear(self) -> None:
+        """
+        Remove all the entries (including the persisted ones) and reset the counters.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                self._delete(key)
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the hit/miss counters and the size of the cache.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _is_expired(self, expires_at: Optional[float]) -> bool:
+        return expires_at is not None and expires_at <= time.time()
+
+    def _delete(self, key: str) -> None:
+        del self._entries[key]
+        if self.persist_dir is not None:
+            (self.persist_dir / key).unlink(missing_ok=True)
+
+    def _persist(self, key: str, value: str) -> None:
+        if self.persist_dir is None:
+            return
+
+        # Write to a temporary file first, so that a crash never leaves a truncated entry
+        path = self.persist_dir / key
+        tmp_path = path.with_name(f".{key}.tmp")
+        try:
+            tmp_path.write_text(value, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not persist cache entry {key}: {e}")
+
+    def _load_persisted_entries(self, persist_dir: Path) -> None:
+        """
+        Load the entries persisted in the directory, oldest first, dropping the expired
+        ones.
+        """
+        paths = [
+            path
+            for path in persist_dir.iterdir()
+            if path.is_file() and not path.name.startswith(".")
+        ]
+        paths.sort(key=lambda path: path.stat().st_mtime)
+
+        for path in paths:
+            expires_at = path.stat().st_mtime + self.ttl if self.ttl is not None else None
+
+            if self._is_expired(expires_at):
+                path.unlink(missing_ok=True)
+                continue
+
+            self._entries[path.name] = (expires_at, path.read_text(encoding="utf-8"))
+
+        while len(self._entries) > self.max_size:
+            self._delete(next(iter(self._entries)))
+
+
+class SQLiteCache:
+    """
+    Thread-safe, size-bounded LRU cache of string values stored in a local SQLite database,
+    with an optional time-to-live. Same interface as LRUCache, for caches that must survive
+    restarts or be shared by the worker processes of a host.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_size: int = 1024,
+        ttl: Optional[float] = None,
+    ):
+        """
+        Args:
+            path: The database file (created if needed)
+            max_size: The maximum number of entries (0 disables the cache)
+            ttl: The time-to-live of the entries in seconds (None means no expiry)
+        """
+        self.path = Path(path)
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL, "
+            "last_used REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)"
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get the value cached for the key, or None if there is none (or it has expired).
+        """
+        with self._lock:
+            now = time.time()
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is not None and self._is_expired(row[1], now):
+                self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._connection.execute(
+                "UPDATE entries SET last_used = ? WHERE key = ?", (now, key)
+            )
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Cache the value for the key, evicting the least recently used entries if needed.
+        """
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            now = time.time()
+            expires_at = now + self.ttl if self.ttl is not None else None
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries (key, value, expires_at, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, now),
+            )
+            self._connection.execute(
+                "DELETE FROM entries WHERE key IN ("
+                "SELECT key FROM entries ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_size,),
+            )
+
+    def clear(self) -> None:
+        """
+        Remove all the entries and reset the counters.
+        """
+        with self._lock:
+            self._connection.execute("DELETE FROM entries")
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the hit/miss counters and the size of the cache.
+        """
+        size = len(self)
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": size,
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    @staticmethod
+    def _is_expired(expires_at: Optional[float], now: float) -> bool:
+        return expires_at is not None and expires_at <= now
@@ -0,0 +1,23 @@
+class CacheablePrompt(str):
+    """
+    A prompt starting with a static prefix (instructions that are identical for every call),
+    which the LLM providers can cache. It is a plain string everywhere else.
+    """
+
+    prefix_length: int
+
+    def __new__(cls, prefix: str, suffix: str) -> "CacheablePrompt":
+        prompt = super().__new__(cls, prefix + suffix)
+        prompt.prefix_length = len(prefix)
+        return prompt
+
+    @property
+    def prefix(self) -> str:
+        return str.__getitem__(self, slice(None, self.prefix_length))
+
+    @property
+    def suffix(self) -> str:
+        return str.__getitem__(self, slice(self.prefix_length, None))
+
+    def __reduce__(self):
+        return CacheablePrompt, (self.prefix, self.suffix)
@@ -12,3 +12,7 @@ class ElementAlreadyExistsError(ProcessException):
 
 class GatewayUpdateError(ProcessException):
     pass
+
+
+class LLMCallError(Exception):
+    pass
@@ -0,0 +1,111 @@
+import asyncio
+import threading
+from typing import Any, Callable, TypeVar
+from weakref import WeakKeyDictionary
+
+from bpmn_assistant.core.enums import Provider
+
+T = TypeVar("T")
+
+
+class LLMClientRegistry:
+    """
+    Registry of the LLM API clients, keyed by provider and API key, so that the requests using
+    the same credentials share one client and its pool of keep-alive connections instead of
+    opening new connections for every request. The clients hold no conversation state (the
+    message histories are kept by LLMFacade).
+    """
+
+    def __init__(self):
+        self._clients: dict[tuple[Provider, str], Any] = {}
+        # Async clients can only be used on the event loop they were first used on
+        self._async_clients: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[tuple[Provider, str], Any]
+        ] = WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    def get_client(self, provider: Provider, api_key: str, factory: Callable[[], T]) -> T:
+        """
+        Get the client registered for the provider and the API key, creating it on first use.
+        Args:
+            provider: The provider of the client
+            api_key: The API key the client was created with
+            factory: Creates the client
+        Returns:
+            The shared client
+        """
+        with self._lock:
+            return self._get_or_create(self._clients, (provider, api_key), factory)
+
+    def get_async_client(
+        self, provider: Provider, api_key: str, factory: Callable[[], T]
+    ) -> T:
+        """
+        Get the async client registered for the provider and the API key on the running
+        event loop, creating it on first use.
+        See `get_client` for the arguments.
+        """
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            clients = self._async_clients.setdefault(loop, {})
+            return self._get_or_create(clients, (provider, api_key), factory)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get the number of registered clients, and how many times clients were created and
+        reused.
+        """
+        with self._lock:
+            return {
+                "clients": len(self._clients),
+                "async_clients": sum(len(c) for c in self._async_clients.values()),
+                "created": self.created,
+                "reused": self.reused,
+            }
+
+    def close(self) -> None:
+        """
+        Close the sync clients and forget all the clients (new ones are created on next use).
+        """
+        with self._lock:
+            for client in self._clients.values():
+                close = getattr(client, "close", None)
+                if close is not None:
+                    close()
+            self._clients.clear()
+            self._async_clients.clear()
+
+    async def aclose(self) -> None:
+        """
+        Close the async clients of the running event loop and forget them.
+        """
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            clients = self._async_clients.pop(loop, {})
+
+        for client in clients.values():
+            await client.close()
+
+    def _get_or_create(
+        self,
+        clients: dict[tuple[Provider, str], Any],
+        key: tuple[Provider, str],
+        factory: Callable[[], T],
+    ) -> T:
+        client = clients.get(key)
+
+        if client is None:
+            client = clients[key] = factory()
+            self.created += 1
+        else:
+            self.reused += 1
+
+        return client
+
+
+# The process-wide registry, used by default by the providers
+llm_client_registry = LLMClientRegistry()
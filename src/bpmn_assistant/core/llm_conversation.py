@@ -0,0 +1,109 @@
+import time
+from typing import Any, Generator, Optional, TypeVar
+
+from bpmn_assistant.config import logger
+from bpmn_assistant.core.llm_facade import LLMFacade
+from bpmn_assistant.core.response_cache import ResponseCache
+
+T = TypeVar("T")
+
+# A multi-step exchange with an LLM (e.g. a call followed by retries on invalid responses),
+# written once for both the sync and the async API: the generator yields the keyword
+# arguments of each `LLMFacade.call` and receives the response, or the exception raised by
+# the call, at the yield. Its return value is the result of the conversation.
+LLMConversation = Generator[dict[str, Any], Any, T]
+
+
+def run_conversation(
+    llm_facade: LLMFacade,
+    conversation: LLMConversation[T],
+    response_cache: Optional[ResponseCache] = None,
+) -> T:
+    """
+    Run the conversation with blocking LLM calls.
+    Args:
+        llm_facade: The LLM facade used for the calls
+        conversation: The conversation
+        response_cache: A cache of the results of the conversations. On a hit, no call is
+            made (and the message history of the facade is left untouched).
+    Returns:
+        The result of the conversation
+    """
+    try:
+        call_kwargs = next(conversation)
+    except StopIteration as finished:
+        return finished.value
+
+    key, cached_result = _lookup(llm_facade, call_kwargs, response_cache)
+    if cached_result is not None:
+        conversation.close()
+        return cached_result
+
+    start = time.perf_counter()
+    try:
+        while True:
+            try:
+                response = llm_facade.call(**call_kwargs)
+            except Exception as e:
+                call_kwargs = conversation.throw(e)
+            else:
+                call_kwargs = conversation.send(response)
+    except StopIteration as finished:
+        if response_cache is not None and key is not None:
+            response_cache.set(key, finished.value, time.perf_counter() - start)
+        return finished.value
+
+
+async def run_conversation_async(
+    llm_facade: LLMFacade,
+    conversation: LLMConversation[T],
+    response_cache: Optional[ResponseCache] = None,
+) -> T:
+    """
+    Run the conversation without blocking the event loop. See `run_conversation`.
+    """
+    try:
+        call_kwargs = next(conversation)
+    except StopIteration as finished:
+        return finished.value
+
+    key, cached_result = _lookup(llm_facade, call_kwargs, response_cache)
+    if cached_result is not None:
+        conversation.close()
+        return cached_result
+
+    start = time.perf_counter()
+    try:
+        while True:
+            try:
+                response = await llm_facade.call_async(**call_kwargs)
+            except Exception as e:
+                call_kwargs = conversation.throw(e)
+            else:
+                call_kwargs = conversation.send(response)
+    except StopIteration as finished:
+        if response_cache is not None and key is not None:
+            response_cache.set(key, finished.value, time.perf_counter() - start)
+        return finished.value
+
+
+def _lookup(
+    llm_facade: LLMFacade,
+    call_kwargs: dict[str, Any],
+    response_cache: Optional[ResponseCache],
+) -> tuple[Optional[str], Optional[Any]]:
+    """
+    Look the conversation up in the response cache.
+    Returns:
+        The cache key of the conversation (None without a cache), and the cached result
+    """
+    if response_cache is None:
+        return None, None
+
+    key = response_cache.key(llm_facade.model, llm_facade.output_mode, call_kwargs)
+    cached_result = response_cache.get(key)
+
+    if cached_result is not None:
+        logger.info("Conversation result served from the response cache")
+
+    return key, cached_result
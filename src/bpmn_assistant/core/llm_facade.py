@@ -1,11 +1,13 @@
 import json
-from typing import Any, Generator
+from typing import Any, AsyncGenerator, Generator
 
 from pydantic import BaseModel
 
 from bpmn_assistant.config import logger
 from bpmn_assistant.core.enums import MessageRole, OutputMode, Provider
+from bpmn_assistant.core.llm_client_registry import LLMClientRegistry
 from bpmn_assistant.core.llm_provider import LLMProvider
+from bpmn_assistant.core.llm_usage import LLMUsage
 from bpmn_assistant.core.provider_factory import ProviderFactory
 
 
@@ -16,6 +18,7 @@ class LLMFacade:
         api_key: str,
         model: str,
         output_mode: OutputMode = OutputMode.JSON,
+        client_registry: LLMClientRegistry | None = None,
     ):
         """
         Initialize the LLM facade with the given provider, API key, model, and output mode.
@@ -24,9 +27,11 @@ class LLMFacade:
             api_key: The API key for the provider
             model: The model to use
             output_mode: The output mode (JSON or text)
+            client_registry: The registry of the API clients (defaults to the process-wide
+                one, so that the facades share their clients and connections)
         """
         self.provider: LLMProvider = ProviderFactory.get_provider(
-            provider, api_key, output_mode
+            provider, api_key, output_mode, client_registry
         )
         self.model = model
         self.output_mode = output_mode
@@ -36,6 +41,13 @@ class LLMFacade:
 
         self.messages = self.provider.get_initial_messages()
 
+    @property
+    def usage(self) -> list[LLMUsage]:
+        """
+        The tokens (cached and uncached) and the latency of every call made by the facade.
+        """
+        return self.provider.usage
+
     def call(
         self,
         prompt: str,
@@ -57,12 +69,32 @@ class LLMFacade:
             structured_output,
         )
 
-        # Append the response to the message history in case the JSON is invalid and
-        # we need to re-run the call
-        if self.output_mode == OutputMode.JSON:
-            self.provider.add_message(
-                self.messages, MessageRole.ASSISTANT, json.dumps(response)
-            )
+        self._add_response_to_history(response)
+
+        return response
+
+    async def call_async(
+        self,
+        prompt: str,
+        max_tokens: int = 1000,
+        temperature: float = 0.3,
+        structured_output: BaseModel | None = None,
+    ) -> str | dict[str, Any]:
+        """
+        Call the LLM model with the given prompt, without blocking the event loop.
+        """
+        logger.info(f"Calling LLM (async): {self.model}")
+
+        response = await self.provider.call_async(
+            self.model,
+            prompt,
+            self.messages,
+            max_tokens,
+            temperature,
+            structured_output,
+        )
+
+        self._add_response_to_history(response)
 
         return response
 
@@ -77,3 +109,24 @@ class LLMFacade:
         return self.provider.stream(
             self.model, prompt, self.messages, max_tokens, temperature
         )
+
+    def stream_async(
+        self, prompt: str, max_tokens: int = 1000, temperature: float = 0.3
+    ) -> AsyncGenerator[str, None]:
+        """
+        Call the LLM model with the given prompt and stream the response, without blocking
+        the event loop.
+        """
+        logger.info(f"Calling LLM (async streaming): {self.model}")
+
+        return self.provider.stream_async(
+            self.model, prompt, self.messages, max_tokens, temperature
+        )
+
+    def _add_response_to_history(self, response: str | dict[str, Any]) -> None:
+        # Append the response to the message history in case the JSON is invalid and
+        # we need to re-run the call
+        if self.output_mode == OutputMode.JSON:
+            self.provider.add_message(
+                self.messages, MessageRole.ASSISTANT, json.dumps(response)
+            )
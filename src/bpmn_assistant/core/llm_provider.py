@@ -1,11 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Generator, Any
+from typing import Any, AsyncGenerator, Generator
 from pydantic import BaseModel
 
+from bpmn_assistant.config import logger
 from bpmn_assistant.core.enums import MessageRole
+from bpmn_assistant.core.llm_usage import LLMUsage, llm_usage_tracker
 
 
 class LLMProvider(ABC):
+    usage: list[LLMUsage]  # The usage of the calls made through the provider
+
     @abstractmethod
     def call(
         self,
@@ -29,6 +33,29 @@ class LLMProvider(ABC):
     ) -> Generator[str, None, None]:
         pass
 
+    @abstractmethod
+    async def call_async(
+        self,
+        model: str,
+        prompt: str,
+        messages: list[dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+        structured_output: BaseModel | None = None,
+    ) -> str | dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def stream_async(
+        self,
+        model: str,
+        prompt: str,
+        messages: list[dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+    ) -> AsyncGenerator[str, None]:
+        pass
+
     @abstractmethod
     def get_initial_messages(self) -> list[dict[str, str]]:
         pass
@@ -42,3 +69,12 @@ class LLMProvider(ABC):
     @abstractmethod
     def check_model_compatibility(self, model: str) -> bool:
         pass
+
+    def _record_usage(self, usage: LLMUsage) -> None:
+        self.usage.append(usage)
+        llm_usage_tracker.record(usage)
+        logger.info(
+            f"LLM usage: {usage.input_tokens} uncached, {usage.cache_read_input_tokens} "
+            f"cached and {usage.cache_creation_input_tokens} cache-written input tokens, "
+            f"{usage.output_tokens} output tokens, {usage.latency:.2f}s"
+        )
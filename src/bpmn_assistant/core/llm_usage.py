@@ -0,0 +1,81 @@
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any
+
+
+@dataclass
+class LLMUsage:
+    """
+    The tokens and the latency of an LLM call.
+    """
+
+    model: str
+    input_tokens: int  # Input tokens neither read from nor written to the prompt cache
+    cache_read_input_tokens: int  # Input tokens read from the prompt cache
+    cache_creation_input_tokens: int  # Input tokens written to the prompt cache
+    output_tokens: int
+    latency: float  # In seconds
+
+    @property
+    def total_input_tokens(self) -> int:
+        return (
+            self.input_tokens
+            + self.cache_read_input_tokens
+            + self.cache_creation_input_tokens
+        )
+
+
+class LLMUsageTracker:
+    """
+    Thread-safe totals of the usage of the LLM calls, to follow the share of the input tokens
+    served from the prompt cache.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def record(self, usage: LLMUsage) -> None:
+        with self._lock:
+            self.calls += 1
+            self.latency += usage.latency
+            for name, value in asdict(usage).items():
+                if name in self.tokens:
+                    self.tokens[name] += value
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the number of calls, the token totals, the share of the input tokens read from the
+        prompt cache, and the average latency.
+        """
+        with self._lock:
+            total_input_tokens = (
+                self.tokens["input_tokens"]
+                + self.tokens["cache_read_input_tokens"]
+                + self.tokens["cache_creation_input_tokens"]
+            )
+            return {
+                "calls": self.calls,
+                **self.tokens,
+                "cache_hit_rate": (
+                    self.tokens["cache_read_input_tokens"] / total_input_tokens
+                    if total_input_tokens
+                    else 0.0
+                ),
+                "average_latency": self.latency / self.calls if self.calls else 0.0,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls = 0
+            self.latency = 0.0
+            self.tokens = {
+                "input_tokens": 0,
+                "cache_read_input_tokens": 0,
+                "cache_creation_input_tokens": 0,
+                "output_tokens": 0,
+            }
+
+
+# The usage of all the LLM calls of the process
+llm_usage_tracker = LLMUsageTracker()
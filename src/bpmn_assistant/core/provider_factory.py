@@ -4,18 +4,23 @@ from bpmn_assistant.core.provider_impl import (
 )
 
 from .enums import OutputMode, Provider
+from .llm_client_registry import LLMClientRegistry
 from .llm_provider import LLMProvider
 
 
 class ProviderFactory:
     @staticmethod
     def get_provider(
-        provider: Provider, api_key: str, output_mode: OutputMode = OutputMode.JSON
+        provider: Provider,
+        api_key: str,
+        output_mode: OutputMode = OutputMode.JSON,
+        client_registry: LLMClientRegistry | None = None,
     ) -> LLMProvider:
 
         if provider in [Provider.OPENAI, Provider.FIREWORKS_AI, Provider.GOOGLE]:
+            # litellm keeps its own cache of clients per API key
             return LiteLLMProvider(api_key, output_mode)
         elif provider == Provider.ANTHROPIC:
-            return AnthropicProvider(api_key, output_mode)
+            return AnthropicProvider(api_key, output_mode, client_registry)
         else:
             raise ValueError(f"Unsupported LLM provider: {provider}")
@@ -1,19 +1,53 @@
 import json
-from typing import Generator, Any
+import time
+from typing import Any, AsyncGenerator, Generator
 
-from anthropic import Anthropic
-from anthropic.types import TextBlock
+from anthropic import Anthropic, AsyncAnthropic
+from anthropic.types import Message, TextBlock
 from pydantic import BaseModel
 
 from bpmn_assistant.config import logger
-from bpmn_assistant.core.enums import AnthropicModels, OutputMode, MessageRole
+from bpmn_assistant.core.cacheable_prompt import CacheablePrompt
+from bpmn_assistant.core.enums import AnthropicModels, OutputMode, MessageRole, Provider
+from bpmn_assistant.core.llm_client_registry import LLMClientRegistry, llm_client_registry
 from bpmn_assistant.core.llm_provider import LLMProvider
+from bpmn_assistant.core.llm_usage import LLMUsage
+
+SUPPORTED_MODELS = frozenset(m.value for m in AnthropicModels)
 
 
 class AnthropicProvider(LLMProvider):
-    def __init__(self, api_key: str, output_mode: OutputMode = OutputMode.JSON):
+    def __init__(
+        self,
+        api_key: str,
+        output_mode: OutputMode = OutputMode.JSON,
+        client_registry: LLMClientRegistry | None = None,
+    ):
         self.output_mode = output_mode
-        self.client = Anthropic(api_key=api_key)
+        self.api_key = api_key
+        self.client_registry = client_registry or llm_client_registry
+        self.usage: list[LLMUsage] = []
+
+    @property
+    def client(self) -> Anthropic:
+        """
+        The client shared by all the providers with the same API key.
+        """
+        return self.client_registry.get_client(
+            Provider.ANTHROPIC, self.api_key, lambda: Anthropic(api_key=self.api_key)
+        )
+
+    @property
+    def async_client(self) -> AsyncAnthropic:
+        """
+        The async client shared by all the providers with the same API key (on the running
+        event loop).
+        """
+        return self.client_registry.get_async_client(
+            Provider.ANTHROPIC,
+            self.api_key,
+            lambda: AsyncAnthropic(api_key=self.api_key),
+        )
 
     def call(
         self,
@@ -27,50 +61,29 @@ class AnthropicProvider(LLMProvider):
         """
         Implementation of the Anthropic API call.
         """
-        messages.append({"role": "user", "content": prompt})
+        params = self._prepare_call(model, prompt, messages, max_tokens, temperature)
+        start = time.perf_counter()
+        response = self.client.messages.create(**params)
+        self._record_usage(self._usage(model, response, time.perf_counter() - start))
+        return self._process_message(response, messages)
 
-        if self.output_mode == OutputMode.JSON:
-            # We add "{" to constrain the model to output a JSON object
-            messages.append({"role": "assistant", "content": "{"})
-
-            response = self.client.messages.create(
-                model=model,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                system="You are a helpful assistant designed to output JSON.",
-                messages=messages,  # type: ignore[arg-type]
-            )
-
-            content = response.content[0]
-
-            if not isinstance(content, TextBlock):
-                raise ValueError(f"Invalid response from Anthropic: {content}")
-
-            # Remove the "{" we added from the messages
-            messages.pop()
-
-            raw_output = content.text
-
-            # Add "{" back to the raw output to make it a valid JSON object
-            raw_output = "{" + raw_output
-
-            return self._process_response(raw_output)
-        else:
-            response = self.client.messages.create(
-                model=model,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                messages=messages,  # type: ignore[arg-type]
-            )
-
-            content = response.content[0]
-
-            if not isinstance(content, TextBlock):
-                raise ValueError(f"Invalid response from Anthropic: {content}")
-
-            raw_output = content.text
-
-            return self._process_response(raw_output)
+    async def call_async(
+        self,
+        model: str,
+        prompt: str,
+        messages: list[dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+        structured_output: BaseModel | None = None,
+    ) -> str | dict[str, Any]:
+        """
+        Implementation of the Anthropic API call, without blocking the event loop.
+        """
+        params = self._prepare_call(model, prompt, messages, max_tokens, temperature)
+        start = time.perf_counter()
+        response = await self.async_client.messages.create(**params)
+        self._record_usage(self._usage(model, response, time.perf_counter() - start))
+        return self._process_message(response, messages)
 
     def stream(
         self,
@@ -81,10 +94,12 @@ class AnthropicProvider(LLMProvider):
         temperature: float,
     ) -> Generator[str, None, None]:
         """
-        Implementation of the Anthropic API stream.
+        Implementation of the Anthropic API stream. The usage is recorded once the stream is
+        consumed.
         """
         messages.append({"role": "user", "content": prompt})
 
+        start = time.perf_counter()
         response = self.client.messages.stream(
             model=model,
             max_tokens=max_tokens,
@@ -96,6 +111,139 @@ class AnthropicProvider(LLMProvider):
             for text in stream.text_stream:
                 yield text
 
+            final_message = stream.get_final_message()
+            self._record_usage(
+                self._usage(model, final_message, time.perf_counter() - start)
+            )
+
+    async def stream_async(
+        self,
+        model: str,
+        prompt: str,
+        messages: list[dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Implementation of the Anthropic API stream, without blocking the event loop. The
+        usage is recorded once the stream is consumed.
+        """
+        messages.append({"role": "user", "content": prompt})
+
+        start = time.perf_counter()
+        response = self.async_client.messages.stream(
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            messages=messages,  # type: ignore[arg-type]
+        )
+
+        async with response as stream:
+            async for text in stream.text_stream:
+                yield text
+
+            final_message = await stream.get_final_message()
+            self._record_usage(
+                self._usage(model, final_message, time.perf_counter() - start)
+            )
+
+    def _prepare_call(
+        self,
+        model: str,
+        prompt: str,
+        messages: list[dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+    ) -> dict[str, Any]:
+        """
+        Add the prompt to the messages and build the parameters of the API call.
+        """
+        messages.append({"role": "user", "content": prompt})
+
+        params: dict[str, Any] = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+
+        if self.output_mode == OutputMode.JSON:
+            # We add "{" to constrain the model to output a JSON object
+            messages.append({"role": "assistant", "content": "{"})
+            params["system"] = "You are a helpful assistant designed to output JSON."
+
+        params["messages"] = self._with_cache_breakpoints(messages)
+
+        return params
+
+    @staticmethod
+    def _with_cache_breakpoints(messages: list[dict[str, str]]) -> list[dict[str, Any]]:
+        """
+        Mark the prompt cache breakpoints of the messages: after the static prefix of the
+        cacheable prompts, and, from the second user message on, after the last user message,
+        so that the next call of the conversation reads the previous turns from the cache.
+        """
+        user_indexes = [i for i, m in enumerate(messages) if m["role"] == "user"]
+        last_user_index = user_indexes[-1] if len(user_indexes) > 1 else None
+
+        api_messages: list[dict[str, Any]] = []
+
+        for index, message in enumerate(messages):
+            content = message["content"]
+
+            if isinstance(content, CacheablePrompt) and content.prefix:
+                blocks = [
+                    {
+                        "type": "text",
+                        "text": content.prefix,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ]
+                if content.suffix:
+                    blocks.append({"type": "text", "text": content.suffix})
+            elif index == last_user_index:
+                blocks = [{"type": "text", "text": content}]
+            else:
+                api_messages.append(message)
+                continue
+
+            if index == last_user_index:
+                blocks[-1]["cache_control"] = {"type": "ephemeral"}
+
+            api_messages.append({"role": message["role"], "content": blocks})
+
+        return api_messages
+
+    @staticmethod
+    def _usage(model: str, response: Message, latency: float) -> LLMUsage:
+        usage = response.usage
+        return LLMUsage(
+            model=model,
+            input_tokens=usage.input_tokens,
+            cache_read_input_tokens=usage.cache_read_input_tokens or 0,
+            cache_creation_input_tokens=usage.cache_creation_input_tokens or 0,
+            output_tokens=usage.output_tokens,
+            latency=latency,
+        )
+
+    def _process_message(
+        self, response: Message, messages: list[dict[str, str]]
+    ) -> str | dict[str, Any]:
+        content = response.content[0]
+
+        if not isinstance(content, TextBlock):
+            raise ValueError(f"Invalid response from Anthropic: {content}")
+
+        raw_output = content.text
+
+        if self.output_mode == OutputMode.JSON:
+            # Remove the "{" we added from the messages
+            messages.pop()
+
+            # Add "{" back to the raw output to make it a valid JSON object
+            raw_output = "{" + raw_output
+
+        return self._process_response(raw_output)
+
     def get_initial_messages(self) -> list[dict[str, str]]:
         return []
 
@@ -106,7 +254,7 @@ class AnthropicProvider(LLMProvider):
         messages.append({"role": message_role, "content": content})
 
     def check_model_compatibility(self, model: str) -> bool:
-        return model in [m.value for m in AnthropicModels]
+        return model in SUPPORTED_MODELS
 
     def _process_response(self, raw_output: str) -> str | dict[str, Any]:
         """
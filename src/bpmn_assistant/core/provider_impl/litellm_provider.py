@@ -1,9 +1,9 @@
 import json
-import os
 import re
-from typing import Any, Generator
+import time
+from typing import Any, AsyncGenerator, Generator
 
-from litellm import completion
+from litellm import acompletion, completion
 from pydantic import BaseModel
 
 from bpmn_assistant.config import logger
@@ -11,14 +11,21 @@ from bpmn_assistant.core.enums.message_roles import MessageRole
 from bpmn_assistant.core.enums.models import FireworksAIModels, GoogleModels, OpenAIModels
 from bpmn_assistant.core.enums.output_modes import OutputMode
 from bpmn_assistant.core.llm_provider import LLMProvider
+from bpmn_assistant.core.llm_usage import LLMUsage
+
+GOOGLE_MODELS = frozenset(m.value for m in GoogleModels)
+SUPPORTED_MODELS = frozenset(
+    m.value for models in (FireworksAIModels, OpenAIModels, GoogleModels) for m in models
+)
 
 
 class LiteLLMProvider(LLMProvider):
     def __init__(self, api_key: str, output_mode: OutputMode = OutputMode.JSON):
         self.output_mode = output_mode
-        os.environ["FIREWORKS_AI_API_KEY"] = api_key
-        os.environ["OPENAI_API_KEY"] = api_key
-        os.environ["GEMINI_API_KEY"] = api_key
+        # Passed to every call rather than set in the environment, so that providers with
+        # different API keys can be used concurrently
+        self.api_key = api_key
+        self.usage: list[LLMUsage] = []
 
     def call(
         self,
@@ -29,15 +36,97 @@ class LiteLLMProvider(LLMProvider):
         temperature: float,
         structured_output: BaseModel | None = None,
     ) -> str | dict[str, Any]:
+        params = self._prepare_call(
+            model, prompt, messages, max_tokens, temperature, structured_output
+        )
+        start = time.perf_counter()
+        response = completion(**params)
+        self._record_usage(self._usage(model, response, time.perf_counter() - start))
+        return self._process_completion(model, response)
+
+    async def call_async(
+        self,
+        model: str,
+        prompt: str,
+        messages: list[dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+        structured_output: BaseModel | None = None,
+    ) -> str | dict[str, Any]:
+        params = self._prepare_call(
+            model, prompt, messages, max_tokens, temperature, structured_output
+        )
+        start = time.perf_counter()
+        response = await acompletion(**params)
+        self._record_usage(self._usage(model, response, time.perf_counter() - start))
+        return self._process_completion(model, response)
+
+    def stream(
+        self,
+        model: str,
+        prompt: str,
+        messages: list[dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+    ) -> Generator[str, None, None]:
+        messages.append({"role": "user", "content": prompt})
+
+        response = completion(
+            model=model,
+            messages=messages,
+            api_key=self.api_key,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True,
+        )
+
+        for chunk in response:
+            yield chunk.choices[0].delta.content or ""
+
+    async def stream_async(
+        self,
+        model: str,
+        prompt: str,
+        messages: list[dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+    ) -> AsyncGenerator[str, None]:
+        messages.append({"role": "user", "content": prompt})
+
+        response = await acompletion(
+            model=model,
+            messages=messages,
+            api_key=self.api_key,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True,
+        )
+
+        async for chunk in response:
+            yield chunk.choices[0].delta.content or ""
+
+    def _prepare_call(
+        self,
+        model: str,
+        prompt: str,
+        messages: list[dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+        structured_output: BaseModel | None,
+    ) -> dict[str, Any]:
+        """
+        Add the prompt to the messages and build the parameters of the completion call.
+        """
         messages.append({"role": "user", "content": prompt})
 
         params: dict[str, Any] = {
             "model": model,
             "messages": messages,
+            "api_key": self.api_key,
         }
 
         # Google's structured output does not support type unions
-        if structured_output is not None and model not in [m.value for m in GoogleModels]:
+        if structured_output is not None and model not in GOOGLE_MODELS:
             params["response_format"] = structured_output
         elif self.output_mode == OutputMode.JSON:
             params["response_format"] = {"type": "json_object"}
@@ -46,8 +135,29 @@ class LiteLLMProvider(LLMProvider):
             params["max_tokens"] = max_tokens
             params["temperature"] = temperature
 
-        response = completion(**params)
+        return params
+
+    @staticmethod
+    def _usage(model: str, response: Any, latency: float) -> LLMUsage:
+        """
+        The OpenAI-compatible providers cache long prompt prefixes automatically, and report
+        the cached tokens among the prompt tokens.
+        """
+        usage = getattr(response, "usage", None)
+        prompt_tokens = getattr(usage, "prompt_tokens", None) or 0
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None) or 0
+
+        return LLMUsage(
+            model=model,
+            input_tokens=max(prompt_tokens - cached_tokens, 0),
+            cache_read_input_tokens=cached_tokens,
+            cache_creation_input_tokens=0,
+            output_tokens=getattr(usage, "completion_tokens", None) or 0,
+            latency=latency,
+        )
 
+    def _process_completion(self, model: str, response: Any) -> str | dict[str, Any]:
         raw_output = response.choices[0].message.content
 
         if model == FireworksAIModels.DEEPSEEK_R1.value:
@@ -64,27 +174,6 @@ class LiteLLMProvider(LLMProvider):
 
         return self._process_response(raw_output)
 
-    def stream(
-        self,
-        model: str,
-        prompt: str,
-        messages: list[dict[str, str]],
-        max_tokens: int,
-        temperature: float,
-    ) -> Generator[str, None, None]:
-        messages.append({"role": "user", "content": prompt})
-
-        response = completion(
-            model=model,
-            messages=messages,
-            max_tokens=max_tokens,
-            temperature=temperature,
-            stream=True,
-        )
-
-        for chunk in response:
-            yield chunk.choices[0].delta.content or ""
-
     def get_initial_messages(self) -> list[dict[str, str]]:
         return (
             [
@@ -104,7 +193,7 @@ class LiteLLMProvider(LLMProvider):
         messages.append({"role": message_role, "content": content})
 
     def check_model_compatibility(self, model: str) -> bool:
-        return model in [m.value for m in FireworksAIModels] or model in [m.value for m in OpenAIModels] or model in [m.value for m in GoogleModels]
+        return model in SUPPORTED_MODELS
 
     def _process_response(self, raw_output: str) -> str | dict[str, Any]:
         """
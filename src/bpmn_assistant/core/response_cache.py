@@ -0,0 +1,147 @@
+import hashlib
+import json
+import threading
+from typing import Any, Iterable, Optional, Protocol
+
+from bpmn_assistant.config import settings
+from bpmn_assistant.core.cache import LRUCache, SQLiteCache
+from bpmn_assistant.core.enums import OutputMode
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> Optional[str]: ...
+
+    def set(self, key: str, value: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def __len__(self) -> int: ...
+
+
+class ResponseCache:
+    """
+    Cache of the results of LLM conversations (e.g. the intent determined for a message
+    history), keyed by the model, the output mode and the first call of the conversation
+    (rendered prompt, temperature, max tokens). Only the results of the conversations that
+    completed are cached, so a response rejected by the validation is never served again.
+    """
+
+    def __init__(
+        self, backend: Optional[CacheBackend] = None, endpoints: Iterable[str] = ()
+    ):
+        """
+        Args:
+            backend: Where the results are stored (defaults to an in-memory LRU cache)
+            endpoints: The endpoints that opted in to the cache (see `for_endpoint`)
+        """
+        self.backend = backend if backend is not None else LRUCache(max_size=1024)
+        self.endpoints = frozenset(endpoints)
+        self.hits = 0
+        self.misses = 0
+        self.latency_saved = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "ResponseCache":
+        """
+        Create the cache configured by the settings:
+        - RESPONSE_CACHE_ENDPOINTS: the endpoints that use the cache, comma-separated
+          (determine_intent, define_change_request), none by default
+        - RESPONSE_CACHE_BACKEND: "memory" (default) or "sqlite"
+        - RESPONSE_CACHE_PATH: the SQLite database (default: cache/responses.sqlite3)
+        - RESPONSE_CACHE_MAX_SIZE: the maximum number of cached results (default: 1024)
+        - RESPONSE_CACHE_TTL: the time-to-live of the cached results in seconds (default:
+          1 hour)
+        """
+        endpoints = settings.get("RESPONSE_CACHE_ENDPOINTS") or ""
+        max_size = int(settings.get("RESPONSE_CACHE_MAX_SIZE") or 1024)
+        ttl = float(settings.get("RESPONSE_CACHE_TTL") or 3600)
+
+        if (settings.get("RESPONSE_CACHE_BACKEND") or "memory") == "sqlite":
+            backend: CacheBackend = SQLiteCache(
+                settings.get("RESPONSE_CACHE_PATH") or "cache/responses.sqlite3",
+                max_size=max_size,
+                ttl=ttl,
+            )
+        else:
+            backend = LRUCache(max_size=max_size, ttl=ttl)
+
+        return cls(
+            backend,
+            endpoints=[e.strip() for e in endpoints.split(",") if e.strip()],
+        )
+
+    def for_endpoint(self, endpoint: str) -> Optional["ResponseCache"]:
+        """
+        Get the cache if the endpoint opted in to it, otherwise None.
+        """
+        return self if endpoint in self.endpoints else None
+
+    @staticmethod
+    def key(model: str, output_mode: OutputMode, call_kwargs: dict[str, Any]) -> str:
+        """
+        Compute the key of a conversation from its model, its output mode and the keyword
+        arguments of its first call. The whitespace of the prompt is normalized, so that
+        near-identical message histories (e.g. differing by a trailing newline) share a key.
+        """
+        call_kwargs = dict(call_kwargs)
+        if isinstance(call_kwargs.get("prompt"), str):
+            call_kwargs["prompt"] = " ".join(call_kwargs["prompt"].split())
+
+        canonical = json.dumps(
+            {"model": model, "output_mode": output_mode.value, "call": call_kwargs},
+            sort_keys=True,
+            # The structured output is a model class
+            default=lambda value: getattr(value, "__name__", repr(value)),
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get the result cached for the key (a new copy on every call), or None.
+        """
+        value = self.backend.get(key)
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+
+            entry = json.loads(value)
+            self.hits += 1
+            self.latency_saved += entry["latency"]
+            return entry["result"]
+
+    def set(self, key: str, result: Any, latency: float) -> None:
+        """
+        Cache the result of a conversation.
+        Args:
+            key: The key of the conversation
+            result: The result (must be JSON-serializable)
+            latency: The time the conversation took, saved by every hit on the result
+        """
+        self.backend.set(key, json.dumps({"result": result, "latency": latency}))
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the hit/miss counters, the size of the cache and the LLM latency the hits saved
+        (in seconds).
+        """
+        size = len(self.backend)
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "endpoints": sorted(self.endpoints),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": size,
+                "latency_saved": self.latency_saved,
+            }
+
+    def clear(self) -> None:
+        self.backend.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.latency_saved = 0.0
@@ -99,6 +99,18 @@ class EditProposal(BaseModel):
     arguments: dict
 
 
+class EditProposalBatch(BaseModel):
+    """
+    Represents an ordered list of edit proposals for a BPMN process, applied atomically
+    (either all of them or none).
+    """
+
+    operations: List[EditProposal]
+
+
+InitialEditProposal = RootModel[Union[EditProposal, EditProposalBatch]]
+
+
 class StopSignal(BaseModel):
     """
     Represents a stop signal for the BPMN editing process.
@@ -106,4 +118,4 @@ class StopSignal(BaseModel):
 
     stop: Literal[True]
 
-IntermediateEditProposal = RootModel[Union[EditProposal, StopSignal]]
\ No newline at end of file
+IntermediateEditProposal = RootModel[Union[EditProposal, EditProposalBatch, StopSignal]]
\ No newline at end of file
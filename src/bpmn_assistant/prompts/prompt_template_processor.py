@@ -2,6 +2,11 @@ import os
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
+from bpmn_assistant.core.cacheable_prompt import CacheablePrompt
+
+# Marks the end of the static prefix of a template ({{ cache_breakpoint }})
+CACHE_BREAKPOINT = "\x00cache-breakpoint\x00"
+
 
 class PromptTemplateProcessor:
     def __init__(self, prompts_dir=os.path.dirname(os.path.abspath(__file__))):
@@ -17,6 +22,7 @@ class PromptTemplateProcessor:
             trim_blocks=True,
             lstrip_blocks=True,
         )
+        self.env.globals["cache_breakpoint"] = CACHE_BREAKPOINT
 
     def render_template(self, template_name, **kwargs):
         """
@@ -27,10 +33,17 @@ class PromptTemplateProcessor:
             **kwargs: Variables to pass to the template
 
         Returns:
-            str: Rendered template string
+            str: Rendered template string (a CacheablePrompt if the template marks the end of
+                its static prefix)
         """
         template = self.env.get_template(template_name)
-        return template.render(**kwargs)
+        rendered = template.render(**kwargs)
+
+        prefix, breakpoint, suffix = rendered.partition(CACHE_BREAKPOINT)
+        if not breakpoint:
+            return rendered
+
+        return CacheablePrompt(prefix, suffix)
 
 
 if __name__ == "__main__":
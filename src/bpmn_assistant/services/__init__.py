@@ -1,15 +1,27 @@
+from .bpmn_batch_converter import BpmnBatchConverter
 from .bpmn_json_generator import BpmnJsonGenerator
+from .bpmn_layout import BpmnLayout
 from .bpmn_modeling_service import BpmnModelingService
 from .bpmn_process_transformer import BpmnProcessTransformer
 from .bpmn_xml_generator import BpmnXmlGenerator
 from .conversational_service import ConversationalService
-from .determine_intent import determine_intent
+from .conversion_cache import ConversionCache
+from .determine_intent import determine_intent, determine_intent_async
+from .intent_classifier import IntentClassifier
+from .process_outline import outline_to_process, process_to_outline
 
 __all__ = [
+    "BpmnBatchConverter",
     "BpmnJsonGenerator",
+    "BpmnLayout",
     "BpmnModelingService",
     "BpmnProcessTransformer",
     "BpmnXmlGenerator",
     "ConversationalService",
+    "ConversionCache",
     "determine_intent",
+    "determine_intent_async",
+    "IntentClassifier",
+    "outline_to_process",
+    "process_to_outline",
 ]
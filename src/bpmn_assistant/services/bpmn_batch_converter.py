@@ -0,0 +1,167 @@
+import asyncio
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Optional
+
+from bpmn_assistant.config import logger, settings
+from bpmn_assistant.services.bpmn_json_generator import BpmnJsonGenerator
+
+
+def _convert_documents(bpmn_xmls: list[str], streaming: bool) -> list[dict[str, Any]]:
+    """
+    Convert a chunk of BPMN XML documents to JSON (runs in a worker process).
+    Errors are captured per document, so that one invalid document does not fail the others.
+    """
+    results: list[dict[str, Any]] = []
+
+    for bpmn_xml in bpmn_xmls:
+        try:
+            bpmn_json = BpmnJsonGenerator().create_bpmn_json(
+                bpmn_xml, streaming=streaming
+            )
+            results.append({"bpmn_json": bpmn_json, "error": None})
+        except Exception as e:
+            results.append({"bpmn_json": None, "error": f"{type(e).__name__}: {e}"})
+
+    return results
+
+
+class BpmnBatchConverter:
+    """
+    Class to convert many BPMN XML documents to their JSON representation in parallel,
+    on a pool of worker processes.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, chunk_size: int = 8):
+        """
+        Args:
+            max_workers: The number of worker processes (defaults to the number of CPUs)
+            chunk_size: The number of documents sent to a worker process at once
+        Raises:
+            ValueError: If max_workers is less than 1
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @classmethod
+    def from_env(cls) -> "BpmnBatchConverter":
+        """
+        Create the converter configured by the setting BPMN_BATCH_MAX_WORKERS. An invalid
+        value (not a positive integer) is logged and ignored, so that it does not prevent the
+        application from starting. The setting is read once: a reload of the settings does
+        not resize the existing pool.
+        """
+        value = settings.get("BPMN_BATCH_MAX_WORKERS")
+        max_workers = None
+
+        if value:
+            try:
+                max_workers = int(value)
+            except ValueError:
+                logger.warning(
+                    f"Ignoring BPMN_BATCH_MAX_WORKERS={value!r}: not an integer"
+                )
+            else:
+                if max_workers < 1:
+                    logger.warning(
+                        f"Ignoring BPMN_BATCH_MAX_WORKERS={value!r}: must be at least 1"
+                    )
+                    max_workers = None
+
+        return cls(max_workers=max_workers)
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """
+        The process pool, created on first use.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def convert(
+        self, bpmn_xmls: list[str], streaming: bool = False
+    ) -> list[dict[str, Any]]:
+        """
+        Convert the BPMN XML documents to JSON.
+        Args:
+            bpmn_xmls: The BPMN XML documents
+            streaming: Whether to parse the documents incrementally
+        Returns:
+            A result per document, in the same order: {"bpmn_json": ..., "error": None} if the
+            conversion succeeded, or {"bpmn_json": None, "error": "..."} if it failed.
+        """
+        futures = self._submit(bpmn_xmls, streaming)
+
+        results = []
+        for future, chunk in futures:
+            try:
+                results.extend(future.result())
+            except Exception as e:
+                results.extend(self._handle_chunk_failure(e, chunk))
+
+        return results
+
+    async def convert_async(
+        self, bpmn_xmls: list[str], streaming: bool = False
+    ) -> list[dict[str, Any]]:
+        """
+        Convert the BPMN XML documents to JSON without blocking the event loop.
+        See `convert` for the arguments and the results.
+        """
+        futures = self._submit(bpmn_xmls, streaming)
+
+        chunk_results = await asyncio.gather(
+            *(asyncio.wrap_future(future) for future, _ in futures),
+            return_exceptions=True,
+        )
+
+        results = []
+        for chunk_result, (_, chunk) in zip(chunk_results, futures):
+            if isinstance(chunk_result, BaseException):
+                results.extend(self._handle_chunk_failure(chunk_result, chunk))
+            else:
+                results.extend(chunk_result)
+
+        return results
+
+    def shutdown(self) -> None:
+        """
+        Shut down the process pool (a new one is created if the converter is used again).
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _submit(
+        self, bpmn_xmls: list[str], streaming: bool
+    ) -> list[tuple[Future, list[str]]]:
+        chunks = [
+            bpmn_xmls[start : start + self.chunk_size]
+            for start in range(0, len(bpmn_xmls), self.chunk_size)
+        ]
+
+        return [
+            (self.executor.submit(_convert_documents, chunk, streaming), chunk)
+            for chunk in chunks
+        ]
+
+    def _handle_chunk_failure(
+        self, error: BaseException, chunk: list[str]
+    ) -> list[dict[str, Any]]:
+        """
+        Turn the failure of a whole chunk (e.g. a crashed worker process) into an error
+        result for each of its documents.
+        """
+        logger.error(f"Batch conversion of {len(chunk)} documents failed: {error}")
+
+        if isinstance(error, BrokenProcessPool):
+            # A worker process died, the next batch will start a new pool
+            self._executor = None
+
+        message = f"{type(error).__name__}: {error}"
+        return [{"bpmn_json": None, "error": message} for _ in chunk]
@@ -1,8 +1,16 @@
 import xml.etree.ElementTree as ET
 from collections import deque
-from typing import Any, Optional
+from concurrent.futures import Executor
+from typing import IO, Any, Generator, Iterable, Optional
 
 from bpmn_assistant.core.enums import BPMNElementType
+from bpmn_assistant.services.conversion_cache import ConversionCache
+
+# The builder of a sequence structure: it yields the arguments of the nested sequences it
+# needs (start ID, stop ID, visited set), receives their structure, and returns its own
+SequenceBuilder = Generator[
+    tuple[str, Optional[str], set], list[dict[str, Any]], list[dict[str, Any]]
+]
 
 
 class BpmnJsonGenerator:
@@ -10,144 +18,368 @@ class BpmnJsonGenerator:
     Class to generate the JSON representation of a BPMN process from the BPMN XML.
     """
 
-    def __init__(self):
+    def __init__(self, cache: Optional[ConversionCache] = None):
+        """
+        Args:
+            cache: A cache of the conversions. On a cache hit, only `process` is set.
+        """
+        self.cache = cache
         self.elements: dict[str, dict[str, Any]] = {}
         self.flows: dict[str, dict[str, Any]] = {}
+        self.outgoing_flows: dict[str, list[dict[str, Any]]] = {}
+        self.post_dominators: dict[str, Optional[str]] = {}
+        # The elements from which a loop can be reached, and the common branch endpoints
+        # of the gateways among them (found by tracing their paths)
+        self.loop_reaching: set[str] = set()
+        self._traced_endpoints: dict[str, Optional[str]] = {}
         self.process: list[dict[str, Any]] = []
 
+    @staticmethod
+    def _is_process_element(elem: ET.Element) -> bool:
+        return elem.tag.endswith("process")
+
     def _find_process_element(self, root: ET.Element) -> ET.Element:
         for elem in root.iter():
-            if elem.tag.endswith("process"):
+            if self._is_process_element(elem):
                 return elem
         raise ValueError("No process element found in the BPMN XML")
 
-    def create_bpmn_json(self, bpmn_xml: str) -> list[dict[str, Any]]:
+    def _find_process_elements(self, root: ET.Element) -> list[ET.Element]:
+        process_elements = [
+            elem for elem in root.iter() if self._is_process_element(elem)
+        ]
+        if not process_elements:
+            raise ValueError("No process element found in the BPMN XML")
+        return process_elements
+
+    def _iter_process_children(
+        self,
+        bpmn_xml: str | IO,
+        all_processes: bool = False,
+        chunk_size: int = 64 * 1024,
+    ) -> Generator[tuple[str, ET.Element], None, None]:
+        """
+        Parse the BPMN XML incrementally and yield the direct children of the process
+        elements. Every element is detached from its parent as soon as it has been read, so
+        neither the processes nor the diagram (DI) section are ever fully held in memory.
+        Args:
+            bpmn_xml: The BPMN XML string, or a file object (text or binary) containing it.
+            all_processes: Whether to yield the children of every process in the document,
+                or only those of the first one.
+            chunk_size: The size of the chunks fed to the parser.
+        Yields:
+            The process id and an element of that process (flow node or sequence flow).
+        """
+        parser: ET.XMLPullParser[ET.Element] = ET.XMLPullParser(
+            events=("start", "end")
+        )
+        open_elements: list[ET.Element] = []
+        process_depth: Optional[int] = None
+        process_id = ""
+        process_found = False
+
+        if isinstance(bpmn_xml, str):
+            chunks: Iterable[str | bytes] = (
+                bpmn_xml[start : start + chunk_size]
+                for start in range(0, len(bpmn_xml), chunk_size)
+            )
+        else:
+            chunks = iter(lambda: bpmn_xml.read(chunk_size), bpmn_xml.read(0))
+
+        for chunk in chunks:
+            parser.feed(chunk)
+
+            for event, elem in parser.read_events():  # type: ignore[misc]
+                if not isinstance(elem, ET.Element):
+                    continue  # Only element events are requested, this narrows the type
+
+                if event == "start":
+                    if (
+                        process_depth is None
+                        and (all_processes or not process_found)
+                        and self._is_process_element(elem)
+                    ):
+                        process_found = True
+                        process_depth = len(open_elements)
+                        process_id = elem.get("id", "")
+                    open_elements.append(elem)
+                    continue
+
+                open_elements.pop()
+
+                if process_depth is not None:
+                    if len(open_elements) == process_depth + 1:
+                        yield process_id, elem
+                    elif len(open_elements) == process_depth:
+                        process_depth = None  # The end of the process
+
+                if open_elements:
+                    open_elements[-1].remove(elem)
+
+        parser.close()
+
+        if not process_found:
+            raise ValueError("No process element found in the BPMN XML")
+
+    def create_bpmn_json(
+        self, bpmn_xml: str | IO, streaming: bool = False
+    ) -> list[dict[str, Any]]:
         """
         Create the JSON representation of the process from the BPMN XML
+        Args:
+            bpmn_xml: The BPMN XML string (or a file object containing it)
+            streaming: Whether to parse the XML incrementally, keeping only the process
+                elements and sequence flows in memory. Recommended for large diagrams.
         Constraints:
             - Supported elements: task, userTask, serviceTask, startEvent, endEvent, exclusiveGateway, parallelGateway
             - The process must have only one start event
             - The process must not contain pools or lanes
             - Parallel gateways must have a corresponding join gateway
         """
-        root = ET.fromstring(bpmn_xml)
-        process_element = self._find_process_element(root)
-        self._get_elements_and_flows(process_element)
+        # The cache is keyed by the XML string (a file object is not read ahead for it)
+        xml_string = bpmn_xml if isinstance(bpmn_xml, str) else None
+
+        if self.cache is not None and xml_string is not None:
+            cached_process = self.cache.get_json(xml_string)
+            if cached_process is not None:
+                self.process = cached_process
+                return self.process
+
+        if streaming:
+            self._get_elements_and_flows(
+                elem for _, elem in self._iter_process_children(bpmn_xml)
+            )
+        else:
+            root = self._parse(bpmn_xml)
+            process_element = self._find_process_element(root)
+            self._get_elements_and_flows(process_element)
+
         self._build_process_structure()
+
+        if self.cache is not None and xml_string is not None:
+            self.cache.set_json(xml_string, self.process)
+
         return self.process
 
+    def create_bpmn_json_by_process(
+        self,
+        bpmn_xml: str | IO,
+        streaming: bool = False,
+        executor: Optional[Executor] = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Create the JSON representation of every process in the BPMN XML (e.g. the processes
+        of the participants of a collaboration). The document is parsed only once.
+        Args:
+            bpmn_xml: The BPMN XML string (or a file object containing it)
+            streaming: Whether to parse the XML incrementally (see `create_bpmn_json`)
+            executor: An executor to build the processes concurrently. A process pool only
+                pays off for large processes, since every process is sent to a worker.
+        Returns:
+            The JSON representation of each process, keyed by process id. Processes without
+            any flow elements (e.g. the empty processes of black-box pools) are skipped.
+        """
+        generators: dict[str, BpmnJsonGenerator] = {}
+
+        if streaming:
+            process_elements: dict[str, list[ET.Element]] = {}
+            for process_id, elem in self._iter_process_children(
+                bpmn_xml, all_processes=True
+            ):
+                process_elements.setdefault(process_id, []).append(elem)
+            for process_id, elements in process_elements.items():
+                generators[process_id] = BpmnJsonGenerator()
+                generators[process_id]._get_elements_and_flows(elements)
+        else:
+            root = self._parse(bpmn_xml)
+            for process_element in self._find_process_elements(root):
+                process_id = process_element.get("id", "")
+                generators[process_id] = BpmnJsonGenerator()
+                generators[process_id]._get_elements_and_flows(process_element)
+
+        generators = {
+            process_id: generator
+            for process_id, generator in generators.items()
+            if generator.elements
+        }
+
+        if executor is None:
+            processes = {
+                process_id: _build_process(generator)
+                for process_id, generator in generators.items()
+            }
+        else:
+            futures = {
+                process_id: executor.submit(_build_process, generator)
+                for process_id, generator in generators.items()
+            }
+            processes = {
+                process_id: future.result() for process_id, future in futures.items()
+            }
+
+        return processes
+
+    @staticmethod
+    def _parse(bpmn_xml: str | IO) -> ET.Element:
+        if isinstance(bpmn_xml, str):
+            return ET.fromstring(bpmn_xml)
+        return ET.parse(bpmn_xml).getroot()
+
     def _build_process_structure(self):
+        self._compute_post_dominators()
+
         start_event = next(
-            elem
-            for elem in self.elements.values()
-            if elem["type"] == BPMNElementType.START_EVENT.value
+            (
+                elem
+                for elem in self.elements.values()
+                if elem["type"] == BPMNElementType.START_EVENT.value
+            ),
+            None,
         )
+        if start_event is None:
+            raise ValueError("No start event found in the process")
 
-        # Start building the process structure recursively from the start event
-        self.process = self._build_structure_recursive(start_event["id"])
+        # Start building the process structure from the start event
+        self.process = self._build_structure(start_event["id"])
 
-    def _build_structure_recursive(
+    def _build_structure(
         self,
-        current_id: str,
+        start_id: str,
         stop_at: Optional[str] = None,
         visited: Optional[set] = None,
     ) -> list[dict[str, Any]]:
+        """
+        Build the structure of the sequence starting at the given element.
+        The nested sequences (gateway branches) are built with an explicit stack of
+        sequence builders instead of recursion, so neither long sequences nor deeply
+        nested gateways are limited by the interpreter's recursion limit.
+        Args:
+            start_id: The ID of the first element of the sequence.
+            stop_at: The ID of the element at which the sequence ends (exclusive).
+            visited: The IDs of the elements that have already been added.
+        Returns:
+            The list of elements of the sequence.
+        """
         if visited is None:
             visited = set()
 
-        if current_id in visited or current_id == stop_at:
-            return []
+        stack = [self._build_sequence(start_id, stop_at, visited)]
+        sub_sequence: Optional[list[dict[str, Any]]] = None
+
+        while True:
+            try:
+                # Resume the innermost builder (with the structure of the nested sequence it
+                # requested, if any), which either requests the structure of a nested
+                # sequence or finishes with its own structure
+                if sub_sequence is None:
+                    request = next(stack[-1])
+                else:
+                    request = stack[-1].send(sub_sequence)
+            except StopIteration as finished:
+                stack.pop()
+                if not stack:
+                    return finished.value
+                sub_sequence = finished.value
+            else:
+                stack.append(self._build_sequence(*request))
+                sub_sequence = None
+
+    def _build_sequence(
+        self,
+        current_id: Optional[str],
+        stop_at: Optional[str],
+        visited: set,
+    ) -> SequenceBuilder:
+        """
+        Build the structure of a sequence, element by element.
+        Every nested sequence is requested from the caller by yielding its arguments
+        (start ID, stop ID, visited set), and its structure is received back from the yield.
+        Returns:
+            The list of elements of the sequence.
+        """
+        result: list[dict[str, Any]] = []
+
+        while current_id and current_id not in visited and current_id != stop_at:
+            visited.add(current_id)
 
-        visited.add(current_id)
+            current_element = self.elements[current_id]
+            outgoing_flows = self._get_outgoing_flows(current_id)
+            next_element: Optional[str] = None
 
-        current_element = self.elements[current_id]
-        result = [current_element]
+            if current_element["type"] == BPMNElementType.EXCLUSIVE_GATEWAY.value:
+                gateway = current_element.copy()
+                gateway["branches"] = []
+                gateway["has_join"] = False
 
-        outgoing_flows = self._get_outgoing_flows(current_id)
+                common_branch_endpoint = self._find_common_branch_endpoint(current_id)
 
-        if current_element["type"] == BPMNElementType.EXCLUSIVE_GATEWAY.value:
-            gateway = current_element.copy()
-            gateway["branches"] = []
-            gateway["has_join"] = False
+                # If the common endpoint is an exclusive gateway, is means this gateway has a join
+                if common_branch_endpoint and self._is_exclusive_gateway(
+                    common_branch_endpoint
+                ):
+                    gateway["has_join"] = True
 
-            common_branch_endpoint = self._find_common_branch_endpoint(current_id)
-            next_element = None
+                    # Retrieve outgoing flows to determine the next element after the join
+                    join_outgoing_flows = self._get_outgoing_flows(
+                        common_branch_endpoint
+                    )
 
-            # If the common endpoint is an exclusive gateway, is means this gateway has a join
-            if common_branch_endpoint and self._is_exclusive_gateway(
-                common_branch_endpoint
-            ):
-                gateway["has_join"] = True
+                    # Validate that the join gateway has exactly one outgoing flow
+                    if len(join_outgoing_flows) != 1:
+                        raise ValueError(
+                            "Join gateway should have exactly one outgoing flow"
+                        )
 
-                # Retrieve outgoing flows to determine the next element after the join
-                join_outgoing_flows = self._get_outgoing_flows(common_branch_endpoint)
+                    next_element = join_outgoing_flows[0]["target"]
+                else:
+                    next_element = common_branch_endpoint
 
-                # Validate that the join gateway has exactly one outgoing flow
-                if len(join_outgoing_flows) != 1:
-                    raise ValueError(
-                        "Join gateway should have exactly one outgoing flow"
+                # Build the branches of the exclusive gateway
+                for flow in outgoing_flows:
+                    branch_path = yield flow["target"], common_branch_endpoint, visited
+
+                    branch = self._build_eg_branch(
+                        branch_path, common_branch_endpoint, flow
                     )
 
-                next_element = join_outgoing_flows[0]["target"]
-            else:
-                next_element = common_branch_endpoint
+                    gateway["branches"].append(branch)
 
-            # Build the branches of the exclusive gateway
-            for flow in outgoing_flows:
-                branch_path = self._build_structure_recursive(
-                    flow["target"],
-                    stop_at=common_branch_endpoint,
-                    visited=visited,
-                )
+                result.append(gateway)
 
-                branch = self._build_eg_branch(
-                    branch_path, common_branch_endpoint, flow
-                )
+            elif current_element["type"] == BPMNElementType.PARALLEL_GATEWAY.value:
+                gateway = current_element.copy()
+                gateway["branches"] = []
 
-                gateway["branches"].append(branch)
+                join_element = self._find_common_branch_endpoint(current_id)
 
-            result = [gateway]
+                if (
+                    not join_element
+                    or not self._is_parallel_gateway(join_element)
+                    or len(self._get_outgoing_flows(join_element)) != 1
+                ):
+                    raise ValueError(
+                        "Parallel gateway must have a corresponding join gateway"
+                    )
 
-            # Continue building the structure from the element after the gateway
-            if next_element:
-                result.extend(
-                    self._build_structure_recursive(next_element, stop_at, visited)
-                )
+                # Build the branches of the parallel gateway up to the join gateway
+                for flow in outgoing_flows:
+                    branch_path = yield flow["target"], join_element, visited.copy()
+                    gateway["branches"].append(branch_path)
 
-        elif current_element["type"] == BPMNElementType.PARALLEL_GATEWAY.value:
-            gateway = current_element.copy()
-            gateway["branches"] = []
+                result.append(gateway)
 
-            join_element = self._find_common_branch_endpoint(current_id)
+                # Continue building the process from the element after the join gateway
+                join_outgoing_flows = self._get_outgoing_flows(join_element)
+                next_element = join_outgoing_flows[0]["target"]
 
-            if (
-                not join_element
-                or not self._is_parallel_gateway(join_element)
-                or len(self._get_outgoing_flows(join_element)) != 1
-            ):
-                raise ValueError(
-                    "Parallel gateway must have a corresponding join gateway"
-                )
+            else:
+                result.append(current_element)
 
-            # Build the branches of the parallel gateway up to the join gateway
-            for flow in outgoing_flows:
-                branch = self._build_structure_recursive(
-                    flow["target"], stop_at=join_element, visited=visited.copy()
-                )
-                gateway["branches"].append(branch)
-
-            result = [gateway]
-
-            # Continue building the process from the element after the join gateway
-            join_outgoing_flows = self._get_outgoing_flows(join_element)
-            next_element = join_outgoing_flows[0]["target"]
-            result.extend(
-                self._build_structure_recursive(next_element, stop_at, visited)
-            )
+                if len(outgoing_flows) == 1:
+                    next_element = outgoing_flows[0]["target"]
 
-        elif len(outgoing_flows) == 1:
-            next_id = outgoing_flows[0]["target"]
-            result.extend(self._build_structure_recursive(next_id, stop_at, visited))
+            # Continue building the structure from the next element
+            current_id = next_element
 
         return result
 
@@ -166,16 +398,26 @@ class BpmnJsonGenerator:
         Returns:
             The branch structure ("condition", "path", "next").
         """
-        branch = {
+        branch: dict[str, Any] = {
             "condition": flow["condition"],
             "path": branch_path,
         }
 
-        if not branch_path:
-            if flow["target"] != common_branch_endpoint:
-                branch["next"] = flow["target"]
-        else:
-            last_element = branch_path[-1]
+        # Branches (with their flows) that still need their 'next' to be determined. The
+        # branches of a nested gateway without a join are added to the list instead of
+        # being handled recursively.
+        pending: list[tuple[dict[str, Any], dict[str, str]]] = [(branch, flow)]
+
+        while pending:
+            current_branch, current_flow = pending.pop()
+            current_path = current_branch["path"]
+
+            if not current_path:
+                if current_flow["target"] != common_branch_endpoint:
+                    current_branch["next"] = current_flow["target"]
+                continue
+
+            last_element = current_path[-1]
             last_element_outgoing_flows = self._get_outgoing_flows(last_element["id"])
 
             if last_element["type"] == BPMNElementType.EXCLUSIVE_GATEWAY.value:
@@ -187,10 +429,7 @@ class BpmnJsonGenerator:
                             for flow in last_element_outgoing_flows
                             if flow["condition"] == sub_branch["condition"]
                         )
-                        sub_branch_result = self._build_eg_branch(
-                            sub_branch["path"], common_branch_endpoint, sub_flow
-                        )
-                        sub_branch.update(sub_branch_result)
+                        pending.append((sub_branch, sub_flow))
                 else:
                     join_id = self._find_common_branch_endpoint(last_element["id"])
 
@@ -204,7 +443,7 @@ class BpmnJsonGenerator:
 
                     join_target = join_outgoing_flows[0]["target"]
                     if join_target != common_branch_endpoint:
-                        branch["next"] = join_target
+                        current_branch["next"] = join_target
 
             elif last_element["type"] == BPMNElementType.PARALLEL_GATEWAY.value:
                 join_id = self._find_common_branch_endpoint(last_element["id"])
@@ -219,13 +458,13 @@ class BpmnJsonGenerator:
 
                 join_target = join_outgoing_flows[0]["target"]
                 if join_target != common_branch_endpoint:
-                    branch["next"] = join_target
+                    current_branch["next"] = join_target
 
             elif (
                 len(last_element_outgoing_flows) == 1
                 and last_element_outgoing_flows[0]["target"] != common_branch_endpoint
             ):
-                branch["next"] = last_element_outgoing_flows[0]["target"]
+                current_branch["next"] = last_element_outgoing_flows[0]["target"]
 
         return branch
 
@@ -240,23 +479,35 @@ class BpmnJsonGenerator:
         )
 
     def _get_outgoing_flows(self, element_id: str) -> list[dict[str, str]]:
-        return [flow for flow in self.flows.values() if flow["source"] == element_id]
+        return self.outgoing_flows.get(element_id, [])
 
     def _find_common_branch_endpoint(self, gateway_id: str) -> Optional[str]:
         """
-        Find the common endpoint for the branches of a gateway.
+        Find the common endpoint for the branches of a gateway: its immediate
+        post-dominator, unless a loop can be reached from the gateway. The branches of such
+        a gateway are traced path by path instead, since a loop that jumps back into the
+        middle of a branch ends that branch where it re-enters it, which the
+        post-dominator tree does not reflect.
         Args:
             gateway_id: The ID of the gateway element.
         Returns:
             The ID of the common endpoint, or None if no common endpoint is found.
         """
-        paths = self._trace_paths(gateway_id)
-
-        for element_id in paths[0]:
-            if all(element_id in path for path in paths[1:]):
-                return element_id
+        if gateway_id not in self.loop_reaching:
+            return self.post_dominators.get(gateway_id)
+
+        if gateway_id not in self._traced_endpoints:
+            paths = self._trace_paths(gateway_id)
+            self._traced_endpoints[gateway_id] = next(
+                (
+                    element_id
+                    for element_id in paths[0]
+                    if all(element_id in path for path in paths[1:])
+                ),
+                None,
+            )
 
-        return None
+        return self._traced_endpoints[gateway_id]
 
     def _trace_paths(self, gateway_id: str) -> list[list[str]]:
         """
@@ -283,20 +534,133 @@ class BpmnJsonGenerator:
             for flow in outgoing_flows:
                 next_id = flow["target"]
                 if next_id not in visited:
-                    new_path = current_path + [next_id]
-                    new_visited = visited.copy()
-                    new_visited.add(next_id)
-                    queue.append((next_id, new_path, new_visited))
+                    queue.append((next_id, current_path + [next_id], visited | {next_id}))
                 else:
                     # We've encountered a loop, add this path to the results
                     paths.append(current_path + [next_id])
 
         # Remove the starting gateway from the paths
-        paths = [path[1:] for path in paths]
+        return [path[1:] for path in paths]
+
+    def _compute_post_dominators(self):
+        """
+        Compute the immediate post-dominator of every node in the sequence flow graph. The
+        immediate post-dominator of a gateway is the first element that all of its branches
+        pass through, i.e. the common endpoint of the branches.
+
+        Loops are handled by redirecting the back edges found by a depth-first search from
+        the start event to the virtual exit node. The resulting graph is acyclic, which
+        allows to compute the tree in a single pass over the DFS post-order (successors are
+        always finished first). The elements from which a back edge (hence a loop) can be
+        reached are collected in `loop_reaching`, as their gateways are traced path by path
+        (see `_find_common_branch_endpoint`).
+        """
+        successors: dict[str, list[str]] = {}
+        for node_id in self.elements:
+            successors[node_id] = []
+        for flow in self.flows.values():
+            successors.setdefault(flow["source"], [])
+            successors.setdefault(flow["target"], [])
+
+        start_events = [
+            elem["id"]
+            for elem in self.elements.values()
+            if elem["type"] == BPMNElementType.START_EVENT.value
+        ]
+
+        # Iterative DFS collecting the post-order and the edges that are not back edges
+        on_stack: set[str] = set()
+        finished: set[str] = set()
+        forward_successors: dict[str, list[Optional[str]]] = {}
+        post_order: list[str] = []
+        loop_sources: list[str] = []
+
+        for root in start_events + list(successors):
+            if root in finished:
+                continue
 
-        return paths
+            on_stack.add(root)
+            forward_successors[root] = []
+            stack = [
+                (root, iter([flow["target"] for flow in self._get_outgoing_flows(root)]))
+            ]
+
+            while stack:
+                node_id, targets = stack[-1]
+
+                for target in targets:
+                    if target in on_stack:
+                        # A back edge closes a loop: the branch ends here, so it is
+                        # connected to the virtual exit node instead
+                        forward_successors[node_id].append(None)
+                        loop_sources.append(node_id)
+                        continue
+
+                    forward_successors[node_id].append(target)
+
+                    if target not in finished:
+                        on_stack.add(target)
+                        forward_successors[target] = []
+                        stack.append(
+                            (
+                                target,
+                                iter(
+                                    [
+                                        flow["target"]
+                                        for flow in self._get_outgoing_flows(target)
+                                    ]
+                                ),
+                            )
+                        )
+                        break
+                else:
+                    stack.pop()
+                    on_stack.remove(node_id)
+                    finished.add(node_id)
+                    post_order.append(node_id)
+
+        # None stands for the virtual exit node that follows every element without
+        # outgoing flows
+        post_dominators: dict[str, Optional[str]] = {}
+        depths: dict[Optional[str], int] = {None: 0}
+
+        def intersect(first: Optional[str], second: Optional[str]) -> Optional[str]:
+            while first != second:
+                if depths[first] >= depths[second]:
+                    first = post_dominators[first]  # type: ignore[index]
+                else:
+                    second = post_dominators[second]  # type: ignore[index]
+            return first
 
-    def _get_elements_and_flows(self, process: ET.Element):
+        for node_id in post_order:
+            node_successors = forward_successors[node_id]
+
+            common: Optional[str] = node_successors[0] if node_successors else None
+            for successor in node_successors[1:]:
+                common = intersect(common, successor)
+
+            post_dominators[node_id] = common
+            depths[node_id] = depths[common] + 1
+
+        self.post_dominators = post_dominators
+
+        # Walk the flows backwards from the sources of the back edges
+        predecessors: dict[str, list[str]] = {}
+        for flow in self.flows.values():
+            predecessors.setdefault(flow["target"], []).append(flow["source"])
+
+        loop_reaching = set(loop_sources)
+        pending = list(loop_sources)
+        while pending:
+            for source in predecessors.get(pending.pop(), []):
+                if source not in loop_reaching:
+                    loop_reaching.add(source)
+                    pending.append(source)
+
+        self.loop_reaching = loop_reaching
+        self._traced_endpoints = {}
+
+    def _get_elements_and_flows(self, process: Iterable[ET.Element]):
         labeled_elements = {
             BPMNElementType.TASK.value,
             BPMNElementType.USER_TASK.value,
@@ -306,11 +670,13 @@ class BpmnJsonGenerator:
             BPMNElementType.END_EVENT.value,
         }
 
+        supported_elements = {element.value for element in BPMNElementType}
+
         for elem in process:
             tag = elem.tag.split("}")[-1]  # Remove namespace
             elem_id = elem.get("id")
 
-            if tag in [element.value for element in BPMNElementType]:
+            if tag in supported_elements:
                 self.elements[elem_id] = {
                     "type": tag,
                     "id": elem_id,
@@ -326,3 +692,17 @@ class BpmnJsonGenerator:
                     "target": elem.get("targetRef"),
                     "condition": elem.get("name"),
                 }
+
+        # Index the flows by source once, so that every lookup during the structure
+        # building is a dictionary access instead of a scan over all flows
+        for flow in self.flows.values():
+            self.outgoing_flows.setdefault(flow["source"], []).append(flow)
+
+
+def _build_process(generator: BpmnJsonGenerator) -> list[dict[str, Any]]:
+    """
+    Build the JSON process structure of a generator whose elements and flows have been
+    read (a module-level function, so that it can run in a worker process).
+    """
+    generator._build_process_structure()
+    return generator.process
@@ -0,0 +1,232 @@
+from dataclasses import dataclass, field
+
+from bpmn_assistant.core.enums import BPMNElementType
+
+# The size of the grid cells, and of the shapes placed in them
+CELL_WIDTH = 150
+CELL_HEIGHT = 130
+MARGIN = 100
+TASK_SIZE = (100, 80)
+EVENT_SIZE = (36, 36)
+GATEWAY_SIZE = (50, 50)
+
+
+@dataclass
+class Bounds:
+    x: int
+    y: int
+    width: int
+    height: int
+
+    @property
+    def center_x(self) -> int:
+        return self.x + self.width // 2
+
+    @property
+    def center_y(self) -> int:
+        return self.y + self.height // 2
+
+    @property
+    def right(self) -> int:
+        return self.x + self.width
+
+    @property
+    def bottom(self) -> int:
+        return self.y + self.height
+
+
+@dataclass
+class DiagramLayout:
+    shapes: dict[str, Bounds] = field(default_factory=dict)  # Element id -> bounds
+    edges: dict[str, list[tuple[int, int]]] = field(
+        default_factory=dict
+    )  # Flow id -> waypoints
+
+
+class BpmnLayout:
+    """
+    Class to lay out a BPMN process on a grid of layers (columns), using the gateway/branch
+    nesting of its JSON representation: every element of a sequence goes one column to the
+    right of the previous one, and the branches of a gateway are stacked in rows below each
+    other, between the gateway and its join.
+    """
+
+    def layout(self, process: list[dict], transformed_process: dict) -> DiagramLayout:
+        """
+        Compute the shapes and edges of the process.
+        Args:
+            process: The BPMN process structure (JSON representation)
+            transformed_process: The process transformed by BpmnProcessTransformer
+        Returns:
+            The bounds of every element and the waypoints of every flow
+        """
+        cells: dict[str, tuple[int, int]] = {}
+        _, rows = self._place_sequence(process, 0, 0, cells)
+
+        diagram_layout = DiagramLayout()
+
+        elements = {}
+        unplaced = 0
+        for element in transformed_process["elements"]:
+            elements[element["id"]] = element
+            if element["id"] not in cells:
+                # Elements outside the nesting (should not happen) go to a row of their
+                # own, below the process
+                cells[element["id"]] = (unplaced, rows)
+                unplaced += 1
+            column, row = cells[element["id"]]
+            diagram_layout.shapes[element["id"]] = self._bounds(
+                element["type"], column, row
+            )
+
+        for flow in transformed_process["flows"]:
+            source = diagram_layout.shapes.get(flow["sourceRef"])
+            target = diagram_layout.shapes.get(flow["targetRef"])
+            if source is None or target is None:
+                continue
+            diagram_layout.edges[flow["id"]] = self._waypoints(
+                source,
+                target,
+                is_split=len(elements[flow["sourceRef"]]["outgoing"]) > 1,
+                is_join=len(elements[flow["targetRef"]]["incoming"]) > 1,
+            )
+
+        return diagram_layout
+
+    def _place_sequence(
+        self,
+        sequence: list[dict],
+        column: int,
+        row: int,
+        cells: dict[str, tuple[int, int]],
+    ) -> tuple[int, int]:
+        """
+        Place the elements of the sequence, starting at the given cell.
+        Returns:
+            The first column after the sequence, and the number of rows it spans
+        """
+        rows = 1
+
+        for element in sequence:
+            cells.setdefault(element["id"], (column, row))
+
+            if element["type"] == BPMNElementType.EXCLUSIVE_GATEWAY.value:
+                paths = [branch.get("path", []) for branch in element["branches"]]
+                has_join = element.get("has_join", False)
+            elif element["type"] == BPMNElementType.PARALLEL_GATEWAY.value:
+                paths = element["branches"]
+                has_join = True
+            else:
+                column += 1
+                continue
+
+            end_column, branch_rows = self._place_branches(
+                paths, column + 1, row, cells
+            )
+            rows = max(rows, branch_rows)
+
+            if has_join:
+                cells.setdefault(f"{element['id']}-join", (end_column, row))
+                end_column += 1
+            column = end_column
+
+        return column, rows
+
+    def _place_branches(
+        self,
+        paths: list[list[dict]],
+        column: int,
+        row: int,
+        cells: dict[str, tuple[int, int]],
+    ) -> tuple[int, int]:
+        """
+        Place the branches of a gateway below each other, starting at the given cell.
+        Returns:
+            The first column after the longest branch, and the number of rows they span
+        """
+        end_column = column
+        branch_row = row
+
+        for path in paths:
+            path_end_column, path_rows = self._place_sequence(
+                path, column, branch_row, cells
+            )
+            end_column = max(end_column, path_end_column)
+            branch_row += path_rows
+
+        return end_column, max(branch_row - row, 1)
+
+    @staticmethod
+    def _is_gateway(element_type: str) -> bool:
+        return element_type in (
+            BPMNElementType.EXCLUSIVE_GATEWAY.value,
+            BPMNElementType.PARALLEL_GATEWAY.value,
+        )
+
+    def _bounds(self, element_type: str, column: int, row: int) -> Bounds:
+        if self._is_gateway(element_type):
+            width, height = GATEWAY_SIZE
+        elif element_type in (
+            BPMNElementType.START_EVENT.value,
+            BPMNElementType.END_EVENT.value,
+        ):
+            width, height = EVENT_SIZE
+        else:
+            width, height = TASK_SIZE
+
+        return Bounds(
+            x=MARGIN + column * CELL_WIDTH + (CELL_WIDTH - width) // 2,
+            y=MARGIN + row * CELL_HEIGHT + (CELL_HEIGHT - height) // 2,
+            width=width,
+            height=height,
+        )
+
+    def _waypoints(
+        self, source: Bounds, target: Bounds, is_split: bool, is_join: bool
+    ) -> list[tuple[int, int]]:
+        """
+        Route a flow with horizontal and vertical segments.
+        Args:
+            source: The bounds of the source element
+            target: The bounds of the target element
+            is_split: Whether the source element has several outgoing flows
+            is_join: Whether the target element has several incoming flows
+        """
+        if source.center_y == target.center_y and source.right <= target.x:
+            return [(source.right, source.center_y), (target.x, target.center_y)]
+
+        if target.x < source.right:
+            # A flow going back (or to the same column): route it below both shapes
+            below = max(source.bottom, target.bottom) + (CELL_HEIGHT - TASK_SIZE[1]) // 2
+            return [
+                (source.center_x, source.bottom),
+                (source.center_x, below),
+                (target.center_x, below),
+                (target.center_x, target.bottom),
+            ]
+
+        if is_split:
+            # Leave the split from its top or bottom, towards the branch
+            source_y = source.bottom if target.center_y > source.center_y else source.y
+            return [
+                (source.center_x, source_y),
+                (source.center_x, target.center_y),
+                (target.x, target.center_y),
+            ]
+
+        if is_join:
+            # Enter the join from its top or bottom
+            target_y = target.bottom if source.center_y > target.center_y else target.y
+            return [
+                (source.right, source.center_y),
+                (target.center_x, source.center_y),
+                (target.center_x, target_y),
+            ]
+
+        middle_x = (source.right + target.x) // 2
+        return [
+            (source.right, source.center_y),
+            (middle_x, source.center_y),
+            (middle_x, target.center_y),
+            (target.x, target.center_y),
+        ]
@@ -1,12 +1,23 @@
+import asyncio
 import json
 import traceback
+from typing import Awaitable
 
-from bpmn_assistant.config import logger
-from bpmn_assistant.core import LLMFacade, MessageItem
+from bpmn_assistant.config import logger, settings
+from bpmn_assistant.core import (
+    LLMConversation,
+    LLMFacade,
+    MessageItem,
+    ResponseCache,
+    run_conversation,
+    run_conversation_async,
+)
+from bpmn_assistant.core.exceptions import LLMCallError
 from bpmn_assistant.prompts import PromptTemplateProcessor
 from bpmn_assistant.services.process_editing import (
     BpmnEditingService,
     define_change_request,
+    define_change_request_async,
 )
 from bpmn_assistant.utils import message_history_to_string
 
@@ -18,8 +29,48 @@ class BpmnModelingService:
     Service for creating and editing BPMN processes.
     """
 
-    def __init__(self):
+    def __init__(
+        self, diff_checkpoint_interval: int | None = None, max_edit_attempts: int = 2
+    ):
+        """
+        Args:
+            diff_checkpoint_interval: Enables the diff-based prompts of the editing steps
+                (see `BpmnEditingService`)
+            max_edit_attempts: The maximum number of attempts of an editing session. A
+                session interrupted by a failed LLM call is resumed from the edits it
+                already applied, if any, within the iterations it has left. The other
+                failures (e.g. the max number of iterations reached) are raised.
+        """
         self.prompt_processor = PromptTemplateProcessor()
+        self.diff_checkpoint_interval = diff_checkpoint_interval
+        self.max_edit_attempts = max_edit_attempts
+
+    @classmethod
+    def from_env(cls) -> "BpmnModelingService":
+        """
+        Create the service configured by the setting EDIT_DIFF_CHECKPOINT_INTERVAL (the diff
+        mode is off if it is unset or 0). An invalid value (not a non-negative integer) is
+        logged and ignored, so that it does not prevent the application from starting.
+        """
+        value = settings.get("EDIT_DIFF_CHECKPOINT_INTERVAL")
+        diff_checkpoint_interval = None
+
+        if value:
+            try:
+                diff_checkpoint_interval = int(value) or None
+            except ValueError:
+                logger.warning(
+                    f"Ignoring EDIT_DIFF_CHECKPOINT_INTERVAL={value!r}: not an integer"
+                )
+            else:
+                if diff_checkpoint_interval is not None and diff_checkpoint_interval < 0:
+                    logger.warning(
+                        f"Ignoring EDIT_DIFF_CHECKPOINT_INTERVAL={value!r}: "
+                        "must not be negative"
+                    )
+                    diff_checkpoint_interval = None
+
+        return cls(diff_checkpoint_interval=diff_checkpoint_interval)
 
     def create_bpmn(
         self,
@@ -36,7 +87,184 @@ class BpmnModelingService:
         Returns:
             list: The BPMN process.
         """
+        return run_conversation(
+            llm_facade, self._create_bpmn_conversation(message_history, max_retries)
+        )
+
+    async def create_bpmn_async(
+        self,
+        llm_facade: LLMFacade,
+        message_history: list[MessageItem],
+        max_retries: int = 3,
+    ) -> list:
+        """
+        Create a BPMN process without blocking the event loop. See `create_bpmn`.
+        """
+        return await run_conversation_async(
+            llm_facade, self._create_bpmn_conversation(message_history, max_retries)
+        )
+
+    def edit_bpmn(
+        self,
+        llm_facade: LLMFacade,
+        text_llm_facade: LLMFacade,
+        process: list[dict],
+        message_history: list[MessageItem],
+        response_cache: ResponseCache | None = None,
+    ) -> list:
+        """
+        Edit a BPMN process. If an LLM call fails after some edits were applied, the
+        editing is resumed from them (see `max_edit_attempts`).
+        Args:
+            llm_facade: The LLMFacade object.
+            text_llm_facade: The LLMFacade object for text output.
+            process: The BPMN process.
+            message_history: The message history.
+            response_cache: The cache of the change requests.
+        Returns:
+            list: The edited BPMN process.
+        """
+        change_request = define_change_request(
+            text_llm_facade, process, message_history, response_cache
+        )
+
+        bpmn_editor_service = BpmnEditingService(
+            llm_facade, process, change_request, self.diff_checkpoint_interval
+        )
+
+        return self._edit(bpmn_editor_service)
+
+    async def edit_bpmn_async(
+        self,
+        llm_facade: LLMFacade,
+        text_llm_facade: LLMFacade,
+        process: list[dict],
+        message_history: list[MessageItem],
+        response_cache: ResponseCache | None = None,
+    ) -> list:
+        """
+        Edit a BPMN process without blocking the event loop. See `edit_bpmn`.
+        """
+        change_request = await define_change_request_async(
+            text_llm_facade, process, message_history, response_cache
+        )
 
+        bpmn_editor_service = BpmnEditingService(
+            llm_facade, process, change_request, self.diff_checkpoint_interval
+        )
+
+        return await self._edit_async(bpmn_editor_service)
+
+    async def edit_bpmn_speculatively_async(
+        self,
+        llm_facade: LLMFacade,
+        text_llm_facade: LLMFacade,
+        process: list[dict],
+        message_history: list[MessageItem],
+        intent: Awaitable[dict],
+        response_cache: ResponseCache | None = None,
+    ) -> tuple[dict, list | None]:
+        """
+        Edit a BPMN process if the user intends to modify it. The change request is defined
+        while the intent is being determined, then used if the intent is "modify" or
+        cancelled otherwise, which saves the latency of one LLM call on every edit.
+        Args:
+            llm_facade: The LLMFacade object.
+            text_llm_facade: The LLMFacade object for text output.
+            process: The BPMN process.
+            message_history: The message history.
+            intent: The determination of the intent (e.g. a `determine_intent_async`
+                coroutine). It must not share its LLM facade with the edit.
+            response_cache: The cache of the change requests.
+        Returns:
+            The intent, and the edited BPMN process (None if the intent is not "modify").
+        """
+        change_request_task = asyncio.create_task(
+            define_change_request_async(
+                text_llm_facade, process, message_history, response_cache
+            )
+        )
+
+        try:
+            intent_response = await intent
+        except BaseException:
+            await self._cancel(change_request_task)
+            raise
+
+        if intent_response["intent"] != "modify":
+            logger.info("Speculative change request cancelled")
+            await self._cancel(change_request_task)
+            return intent_response, None
+
+        change_request = await change_request_task
+
+        bpmn_editor_service = BpmnEditingService(
+            llm_facade, process, change_request, self.diff_checkpoint_interval
+        )
+
+        return intent_response, await self._edit_async(bpmn_editor_service)
+
+    def _edit(self, bpmn_editor_service: BpmnEditingService) -> list:
+        """
+        Run the editing session, resuming it after a failure. See `edit_bpmn`.
+        """
+        attempt = 1
+        while True:
+            try:
+                return bpmn_editor_service.edit_bpmn()
+            except Exception as e:
+                if not self._should_resume(bpmn_editor_service, attempt, e):
+                    raise
+                attempt += 1
+
+    async def _edit_async(self, bpmn_editor_service: BpmnEditingService) -> list:
+        """
+        Run the editing session without blocking the event loop. See `_edit`.
+        """
+        attempt = 1
+        while True:
+            try:
+                return await bpmn_editor_service.edit_bpmn_async()
+            except Exception as e:
+                if not self._should_resume(bpmn_editor_service, attempt, e):
+                    raise
+                attempt += 1
+
+    def _should_resume(
+        self, bpmn_editor_service: BpmnEditingService, attempt: int, error: Exception
+    ) -> bool:
+        """
+        Whether to resume the failed editing session: only if an LLM call failed (the
+        limits of the editing are final), the session applied some edits (there is nothing
+        to resume from otherwise) and the attempts are not exhausted.
+        """
+        applied_edits = len(bpmn_editor_service.edit_log.entries)
+        if (
+            not isinstance(error, LLMCallError)
+            or not applied_edits
+            or attempt >= self.max_edit_attempts
+        ):
+            return False
+
+        logger.warning(
+            f"Editing failed after {applied_edits} edit(s), resuming "
+            f"(attempt {attempt + 1}/{self.max_edit_attempts}): {error}"
+        )
+        return True
+
+    @staticmethod
+    async def _cancel(task: asyncio.Task) -> None:
+        """
+        Cancel the task and wait for it to finish, discarding its outcome.
+        """
+        task.cancel()
+        await asyncio.wait([task])
+        if not task.cancelled():
+            task.exception()  # Mark a failure as retrieved
+
+    def _create_bpmn_conversation(
+        self, message_history: list[MessageItem], max_retries: int
+    ) -> LLMConversation[list]:
         prompt = self.prompt_processor.render_template(
             "create_bpmn.jinja2",
             message_history=message_history_to_string(message_history),
@@ -47,7 +275,7 @@ class BpmnModelingService:
         while attempts < max_retries:
             attempts += 1
             try:
-                response = llm_facade.call(prompt)
+                response = yield dict(prompt=prompt)
                 process = response["process"]
                 validate_bpmn(process)
                 logger.debug(
@@ -64,18 +292,3 @@ class BpmnModelingService:
         raise Exception(
             "Max number of retries reached. Could not create the BPMN process."
         )
-
-    def edit_bpmn(
-        self,
-        llm_facade: LLMFacade,
-        text_llm_facade: LLMFacade,
-        process: list[dict],
-        message_history: list[MessageItem],
-    ) -> list:
-        change_request = define_change_request(
-            text_llm_facade, process, message_history
-        )
-
-        bpmn_editor_service = BpmnEditingService(llm_facade, process, change_request)
-
-        return bpmn_editor_service.edit_bpmn()
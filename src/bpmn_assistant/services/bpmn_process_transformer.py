@@ -37,14 +37,16 @@ class BpmnProcessTransformer:
 
         elements: list[dict] = []
         flows: list[dict] = []
+        flow_keys: set[tuple[str, str]] = set()
+        incoming: dict[str, list[str]] = {}
+        outgoing: dict[str, list[str]] = {}
 
         def add_flow(source_ref, target_ref, flow_id=None, condition=None):
             """
-            Helper function to append a flow to the flows list.
+            Helper function to append a flow to the flows list, unless the elements are already connected.
             """
-            for flow in flows:
-                if flow["sourceRef"] == source_ref and flow["targetRef"] == target_ref:
-                    return
+            if (source_ref, target_ref) in flow_keys:
+                return
 
             flow_id = flow_id or f"{source_ref}-{target_ref}"
             flows.append(
@@ -55,6 +57,9 @@ class BpmnProcessTransformer:
                     "condition": condition,
                 }
             )
+            flow_keys.add((source_ref, target_ref))
+            incoming.setdefault(target_ref, []).append(flow_id)
+            outgoing.setdefault(source_ref, []).append(flow_id)
 
         def handle_exclusive_gateway(
             element: dict, next_element_id: Optional[str] = None
@@ -86,27 +91,20 @@ class BpmnProcessTransformer:
                     continue  # Skip further processing for empty branches
 
                 branch_next = branch.get("next")
+                branch_start = len(elements)
 
                 if branch_next:
-                    branch_structure = self.transform(branch["path"], branch_next)
+                    transform_sequence(branch["path"], branch_next)
                 else:
-                    branch_structure = self.transform(
+                    transform_sequence(
                         branch["path"], join_gateway_id or next_element_id
                     )
 
-                elements.extend(branch_structure["elements"])
-                flows.extend(branch_structure["flows"])
-
                 # Add the flow from the exclusive gateway to the first element in the branch
-                first_element = (
-                    branch_structure["elements"][0]
-                    if branch_structure["elements"]
-                    else None
-                )
-                if first_element:
+                if len(elements) > branch_start:
                     add_flow(
                         element["id"],
-                        first_element["id"],
+                        elements[branch_start]["id"],
                         condition=branch["condition"],
                     )
 
@@ -124,58 +122,63 @@ class BpmnProcessTransformer:
             )
 
             for branch in element["branches"]:
-                branch_structure = self.transform(branch, join_gateway_id)
-                elements.extend(branch_structure["elements"])
-                flows.extend(branch_structure["flows"])
+                branch_start = len(elements)
+                transform_sequence(branch, join_gateway_id)
 
                 # Add the flow from the parallel gateway to the first element in the branch
-                first_element = branch_structure["elements"][0]
+                first_element = elements[branch_start]
                 add_flow(element["id"], first_element["id"])
 
                 # Add the flow from the last element in the branch to the join gateway
-                last_element = branch_structure["elements"][-1]
+                last_element = elements[-1]
                 add_flow(last_element["id"], join_gateway_id)
 
             return join_gateway_id
 
-        for index, element in enumerate(process):
-            next_element_id = (
-                process[index + 1]["id"]
-                if index < len(process) - 1
-                else parent_next_element_id
-            )
+        def transform_sequence(
+            sequence: list[dict], sequence_next_element_id: Optional[str]
+        ) -> None:
+            """
+            Add the elements and flows of the sequence (and of its gateway branches) to the
+            elements and flows of the whole process.
+            """
+            for index, element in enumerate(sequence):
+                next_element_id = (
+                    sequence[index + 1]["id"]
+                    if index < len(sequence) - 1
+                    else sequence_next_element_id
+                )
 
-            elements.append(
-                {
-                    "id": element["id"],
-                    "type": element["type"],
-                    "label": element.get("label", None),
-                }
-            )
+                elements.append(
+                    {
+                        "id": element["id"],
+                        "type": element["type"],
+                        "label": element.get("label", None),
+                    }
+                )
+
+                if element["type"] == "exclusiveGateway":
+                    join_gateway_id = handle_exclusive_gateway(element, next_element_id)
 
-            if element["type"] == "exclusiveGateway":
-                join_gateway_id = handle_exclusive_gateway(element, next_element_id)
+                    # Connect the join gateway to the next element in the process
+                    if join_gateway_id and next_element_id:
+                        add_flow(join_gateway_id, next_element_id)
+                elif element["type"] == "parallelGateway":
+                    join_gateway_id = handle_parallel_gateway(element)
 
-                # Connect the join gateway to the next element in the process
-                if join_gateway_id and next_element_id:
-                    add_flow(join_gateway_id, next_element_id)
-            elif element["type"] == "parallelGateway":
-                join_gateway_id = handle_parallel_gateway(element)
+                    # Connect the join gateway to the next element in the process
+                    if next_element_id:
+                        add_flow(join_gateway_id, next_element_id)
+                elif next_element_id and element["type"] != "endEvent":
+                    # Add the flow between the current element and the next element in the process
+                    add_flow(element["id"], next_element_id)
 
-                # Connect the join gateway to the next element in the process
-                if next_element_id:
-                    add_flow(join_gateway_id, next_element_id)
-            elif next_element_id and element["type"] != "endEvent":
-                # Add the flow between the current element and the next element in the process
-                add_flow(element["id"], next_element_id)
+        # The whole process tree is written into the same elements and flows, and the
+        # incoming and outgoing flows are indexed as the flows are added
+        transform_sequence(process, parent_next_element_id)
 
-        # Add incoming and outgoing flows to each element
         for element in elements:
-            element["incoming"] = [
-                flow["id"] for flow in flows if flow["targetRef"] == element["id"]
-            ]
-            element["outgoing"] = [
-                flow["id"] for flow in flows if flow["sourceRef"] == element["id"]
-            ]
+            element["incoming"] = list(incoming.get(element["id"], []))
+            element["outgoing"] = list(outgoing.get(element["id"], []))
 
         return {"elements": elements, "flows": flows}
@@ -1,8 +1,27 @@
 import json
-import xml.etree.ElementTree as ET
+import logging
+import os
+from typing import IO, Iterator, Optional, Sequence
 
 from bpmn_assistant.config import logger
 from bpmn_assistant.services import BpmnProcessTransformer
+from bpmn_assistant.services.bpmn_layout import BpmnLayout, DiagramLayout
+from bpmn_assistant.services.conversion_cache import ConversionCache
+
+# The characters escaped by ElementTree in the text and in the attribute values, so that
+# the output is identical to `ET.tostring`
+TEXT_ENTITIES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+ATTRIBUTE_ENTITIES = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "\r": "&#13;",
+        "\n": "&#10;",
+        "\t": "&#09;",
+    }
+)
 
 
 class BpmnXmlGenerator:
@@ -10,61 +29,267 @@ class BpmnXmlGenerator:
     Class to generate BPMN XML from the BPMN process data in JSON format.
     """
 
-    def __init__(self):
+    def __init__(self, cache: Optional[ConversionCache] = None):
+        """
+        Args:
+            cache: A cache of the conversions
+        """
         self.transformer = BpmnProcessTransformer()
+        self.layout = BpmnLayout()
+        self.cache = cache
 
-    def create_bpmn_xml(self, process: list[dict]) -> str:
+    def create_bpmn_xml(self, process: list[dict], with_layout: bool = False) -> str:
         """
         Create BPMN XML from the process data.
         Args:
             process: BPMN process structure generated by the LLM.
+            with_layout: Whether to lay out the process and add the diagram (DI) section.
+        Returns:
             The BPMN XML string.
         """
+        if self.cache is not None:
+            cached_xml = self.cache.get_xml(process, with_layout=with_layout)
+            if cached_xml is not None:
+                return cached_xml
+
+        xml_string = "".join(self._iter_xml(*self._transform(process, with_layout)))
+
+        if self.cache is not None:
+            self.cache.set_xml(process, xml_string, with_layout=with_layout)
+
+        return xml_string
+
+    def iter_bpmn_xml(
+        self,
+        process: list[dict],
+        with_layout: bool = False,
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[str]:
+        """
+        Create BPMN XML from the process data, as chunks of text written straight from the
+        transformed process (without building the document tree). The chunks add up to the
+        same string as `create_bpmn_xml`. The process is transformed before this method
+        returns, so invalid processes raise here rather than while iterating.
+        Args:
+            process: BPMN process structure generated by the LLM.
+            with_layout: Whether to lay out the process and add the diagram (DI) section.
+            chunk_size: The approximate size of the chunks (in characters).
+        Returns:
+            An iterator over the chunks of the BPMN XML string.
+        """
+        if self.cache is not None:
+            cached_xml = self.cache.get_xml(process, with_layout=with_layout)
+            if cached_xml is not None:
+                return iter([cached_xml])
+
+        chunks = self._iter_chunks(
+            self._iter_xml(*self._transform(process, with_layout)), chunk_size
+        )
 
+        if self.cache is None:
+            return chunks
+        return self._cache_chunks(process, with_layout, chunks)
+
+    def write_bpmn_xml(
+        self,
+        process: list[dict],
+        file: str | os.PathLike | IO[str],
+        with_layout: bool = False,
+    ) -> None:
+        """
+        Write the BPMN XML of the process data to a file, chunk by chunk.
+        Args:
+            process: BPMN process structure generated by the LLM.
+            file: The path of the file, or a text file object.
+            with_layout: Whether to lay out the process and add the diagram (DI) section.
+        """
+        chunks = self.iter_bpmn_xml(process, with_layout=with_layout)
+
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "w", encoding="utf-8") as f:
+                f.writelines(chunks)
+        else:
+            file.writelines(chunks)
+
+    def _transform(
+        self, process: list[dict], with_layout: bool
+    ) -> tuple[dict, Optional[DiagramLayout]]:
         transformed_process = self.transformer.transform(process)
-        logger.debug(
-            f"Transformed process:\n{json.dumps(transformed_process, indent=2)}"
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Transformed process:\n{json.dumps(transformed_process, indent=2)}"
+            )
+
+        diagram_layout = None
+        if with_layout:
+            diagram_layout = self.layout.layout(process, transformed_process)
+
+        return transformed_process, diagram_layout
+
+    def _cache_chunks(
+        self, process: list[dict], with_layout: bool, chunks: Iterator[str]
+    ) -> Iterator[str]:
+        """
+        Pass the chunks through, and cache the whole XML once they have all been consumed.
+        """
+        collected_chunks = []
+        for chunk in chunks:
+            collected_chunks.append(chunk)
+            yield chunk
+
+        if self.cache is not None:
+            self.cache.set_xml(
+                process, "".join(collected_chunks), with_layout=with_layout
+            )
+
+    def _iter_chunks(self, fragments: Iterator[str], chunk_size: int) -> Iterator[str]:
+        """
+        Group the XML fragments into chunks of about chunk_size characters.
+        """
+        buffer: list[str] = []
+        buffered_size = 0
+
+        for fragment in fragments:
+            buffer.append(fragment)
+            buffered_size += len(fragment)
+            if buffered_size >= chunk_size:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered_size = 0
+
+        if buffer:
+            yield "".join(buffer)
+
+    def _iter_xml(
+        self,
+        transformed_process: dict,
+        diagram_layout: Optional[DiagramLayout] = None,
+    ) -> Iterator[str]:
+        """
+        Serialize the transformed process exactly like `ET.tostring(root, encoding="unicode")`
+        would serialize the equivalent element tree.
+        """
+        yield (
+            '<definitions xmlns="http://www.omg.org/spec/BPMN/20100524/MODEL"'
+            ' xmlns:bpmndi="http://www.omg.org/spec/BPMN/20100524/DI"'
+            ' xmlns:dc="http://www.omg.org/spec/DD/20100524/DC"'
+            ' xmlns:di="http://www.omg.org/spec/DD/20100524/DI"'
+            ' id="definitions_1">'
         )
 
-        # Create the root element (definitions)
-        root = ET.Element("definitions")
-        root.set("xmlns", "http://www.omg.org/spec/BPMN/20100524/MODEL")
-        root.set("xmlns:bpmndi", "http://www.omg.org/spec/BPMN/20100524/DI")
-        root.set("xmlns:dc", "http://www.omg.org/spec/DD/20100524/DC")
-        root.set("xmlns:di", "http://www.omg.org/spec/DD/20100524/DI")
-        root.set("id", "definitions_1")
+        elements = transformed_process["elements"]
+        flows = transformed_process["flows"]
+
+        if not elements and not flows:
+            yield '<process id="Process_1" isExecutable="false" />'
+            if diagram_layout is not None:
+                yield from self._iter_diagram_xml(diagram_layout, elements)
+            yield "</definitions>"
+            return
 
-        # Create the process element
-        process_element = ET.SubElement(root, "process")
-        process_element.set("id", "Process_1")
-        process_element.set("isExecutable", "false")
+        yield '<process id="Process_1" isExecutable="false">'
 
         # Add elements
-        for element in transformed_process["elements"]:
-            elem = ET.SubElement(process_element, element["type"])
-            elem.set("id", element["id"])
+        for element in elements:
+            attributes = {"id": element["id"]}
 
             # Add label if it exists
             if element["label"]:
-                elem.set("name", element["label"])
+                attributes["name"] = element["label"]
 
             # Add incoming and outgoing flows as child elements
-            for incoming in element["incoming"]:
-                ET.SubElement(elem, "incoming").text = incoming
-            for outgoing in element["outgoing"]:
-                ET.SubElement(elem, "outgoing").text = outgoing
+            children = [("incoming", flow_id) for flow_id in element["incoming"]]
+            children += [("outgoing", flow_id) for flow_id in element["outgoing"]]
+
+            yield _xml_element(element["type"], attributes, children)
 
         # Add flows
-        for flow in transformed_process["flows"]:
-            seq_flow = ET.SubElement(process_element, "sequenceFlow")
-            seq_flow.set("id", flow["id"])
-            seq_flow.set("sourceRef", flow["sourceRef"])
-            seq_flow.set("targetRef", flow["targetRef"])
+        for flow in flows:
+            attributes = {
+                "id": flow["id"],
+                "sourceRef": flow["sourceRef"],
+                "targetRef": flow["targetRef"],
+            }
 
             # Add condition if it exists
             if flow["condition"]:
-                seq_flow.set("name", flow["condition"])
+                attributes["name"] = flow["condition"]
 
-        xml_string = ET.tostring(root, encoding="unicode")
+            yield _xml_element("sequenceFlow", attributes)
 
-        return xml_string
+        yield "</process>"
+
+        if diagram_layout is not None:
+            yield from self._iter_diagram_xml(diagram_layout, elements)
+
+        yield "</definitions>"
+
+    def _iter_diagram_xml(
+        self, diagram_layout: DiagramLayout, elements: list[dict]
+    ) -> Iterator[str]:
+        """
+        Serialize the diagram (DI) section: a shape per element and an edge per flow.
+        """
+        yield (
+            '<bpmndi:BPMNDiagram id="BPMNDiagram_1">'
+            '<bpmndi:BPMNPlane id="BPMNPlane_1" bpmnElement="Process_1">'
+        )
+
+        exclusive_gateway_ids = {
+            element["id"] for element in elements if element["type"] == "exclusiveGateway"
+        }
+
+        for element_id, bounds in diagram_layout.shapes.items():
+            marker = ' isMarkerVisible="true"' if element_id in exclusive_gateway_ids else ""
+            element_id = _escape(element_id, ATTRIBUTE_ENTITIES)
+            yield (
+                f'<bpmndi:BPMNShape id="{element_id}_di" bpmnElement="{element_id}"{marker}>'
+                f'<dc:Bounds x="{bounds.x}" y="{bounds.y}"'
+                f' width="{bounds.width}" height="{bounds.height}" />'
+                "</bpmndi:BPMNShape>"
+            )
+
+        for flow_id, waypoints in diagram_layout.edges.items():
+            flow_id = _escape(flow_id, ATTRIBUTE_ENTITIES)
+            yield (
+                f'<bpmndi:BPMNEdge id="{flow_id}_di" bpmnElement="{flow_id}">'
+                + "".join(f'<di:waypoint x="{x}" y="{y}" />' for x, y in waypoints)
+                + "</bpmndi:BPMNEdge>"
+            )
+
+        yield "</bpmndi:BPMNPlane></bpmndi:BPMNDiagram>"
+
+
+def _xml_element(
+    tag: str, attributes: dict[str, str], children: Sequence[tuple[str, str]] = ()
+) -> str:
+    """
+    Serialize an element (with text-only children) the way ElementTree does.
+    """
+    start_tag = "<" + tag + "".join(
+        f' {name}="{_escape(value, ATTRIBUTE_ENTITIES)}"'
+        for name, value in attributes.items()
+    )
+    if not children:
+        return start_tag + " />"
+
+    parts = [start_tag, ">"]
+    for child_tag, text in children:
+        if text:
+            parts.append(f"<{child_tag}>{_escape(text, TEXT_ENTITIES)}</{child_tag}>")
+        else:
+            parts.append(f"<{child_tag} />")
+    parts.append(f"</{tag}>")
+    return "".join(parts)
+
+
+def _escape(value: str, entities: dict[int, str]) -> str:
+    """
+    Escape a text or an attribute value with the given entities (see `TEXT_ENTITIES` and
+    `ATTRIBUTE_ENTITIES`).
+    Raises:
+        TypeError: If the value is not a string (as ElementTree does)
+    """
+    if not isinstance(value, str):
+        raise TypeError(f"cannot serialize {value!r} (type {type(value).__name__})")
+    return value.translate(entities)
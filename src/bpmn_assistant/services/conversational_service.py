@@ -1,8 +1,9 @@
-from typing import Any, Generator, Optional
+from typing import Any, AsyncGenerator, Generator, Optional
 
 from bpmn_assistant.core import MessageItem
 from bpmn_assistant.core.enums import OutputMode
 from bpmn_assistant.prompts import PromptTemplateProcessor
+from bpmn_assistant.services.process_outline import process_to_outline
 from bpmn_assistant.utils import get_llm_facade, message_history_to_string
 
 
@@ -24,16 +25,22 @@ class ConversationalService:
         Returns:
             Generator: A generator that yields the response
         """
-        template_vars = {"message_history": message_history_to_string(message_history)}
+        prompt = self._respond_to_query_prompt(message_history, process)
 
-        if process:
-            template_vars["process"] = str(process)
+        yield from self.llm_facade.stream(prompt, max_tokens=500, temperature=0.5)
 
-        prompt = self.prompt_processor.render_template(
-            "respond_to_query.jinja2", **template_vars
-        )
+    async def respond_to_query_async(
+        self, message_history: list[MessageItem], process: Optional[list[dict[str, Any]]]
+    ) -> AsyncGenerator[str, None]:
+        """
+        Respond to the user query without blocking the event loop. See `respond_to_query`.
+        """
+        prompt = self._respond_to_query_prompt(message_history, process)
 
-        yield from self.llm_facade.stream(prompt, max_tokens=500, temperature=0.5)
+        async for text in self.llm_facade.stream_async(
+            prompt, max_tokens=500, temperature=0.5
+        ):
+            yield text
 
     def make_final_comment(
         self, message_history: list[MessageItem], process: Optional[list[dict[str, Any]]]
@@ -46,10 +53,43 @@ class ConversationalService:
         Returns:
             Generator: A generator that yields the final comment
         """
-        prompt = self.prompt_processor.render_template(
-            "make_final_comment.jinja2",
-            message_history=message_history_to_string(message_history),
-            process=str(process),
-        )
+        prompt = self._make_final_comment_prompt(message_history, process)
 
         yield from self.llm_facade.stream(prompt, max_tokens=200, temperature=0.5)
+
+    async def make_final_comment_async(
+        self, message_history: list[MessageItem], process: Optional[list[dict[str, Any]]]
+    ) -> AsyncGenerator[str, None]:
+        """
+        Make a final comment without blocking the event loop. See `make_final_comment`.
+        """
+        prompt = self._make_final_comment_prompt(message_history, process)
+
+        async for text in self.llm_facade.stream_async(
+            prompt, max_tokens=200, temperature=0.5
+        ):
+            yield text
+
+    def _respond_to_query_prompt(
+        self, message_history: list[MessageItem], process: Optional[list[dict[str, Any]]]
+    ) -> str:
+        template_vars = {"message_history": message_history_to_string(message_history)}
+
+        if process:
+            template_vars["process"] = process_to_outline(process)
+
+        return self.prompt_processor.render_template(
+            "respond_to_query.jinja2", **template_vars
+        )
+
+    def _make_final_comment_prompt(
+        self, message_history: list[MessageItem], process: Optional[list[dict[str, Any]]]
+    ) -> str:
+        template_vars = {"message_history": message_history_to_string(message_history)}
+
+        if process:
+            template_vars["process"] = process_to_outline(process)
+
+        return self.prompt_processor.render_template(
+            "make_final_comment.jinja2", **template_vars
+        )
@@ -0,0 +1,93 @@
+import hashlib
+import json
+import re
+from typing import Any, Optional
+
+from bpmn_assistant.config import settings
+from bpmn_assistant.core.cache import LRUCache
+
+# Whitespace between tags, which does not change the converted process
+_INTER_TAG_WHITESPACE = re.compile(r">\s+<")
+_XML_DECLARATION = re.compile(r"^\s*<\?xml[^>]*\?>")
+
+
+class ConversionCache:
+    """
+    Cache of the BPMN XML -> JSON and JSON -> BPMN XML conversions, keyed by a hash of the
+    canonicalized input.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        ttl: Optional[float] = None,
+        persist_dir: Optional[str] = None,
+    ):
+        """
+        Args:
+            max_size: The maximum number of cached conversions (0 disables the cache)
+            ttl: The time-to-live of the cached conversions in seconds (None means no expiry)
+            persist_dir: A directory where the cached conversions are persisted
+        """
+        self._cache = LRUCache(max_size=max_size, ttl=ttl, persist_dir=persist_dir)
+
+    @classmethod
+    def from_env(cls) -> "ConversionCache":
+        """
+        Create the cache configured by the settings BPMN_CACHE_MAX_SIZE, BPMN_CACHE_TTL (in
+        seconds) and BPMN_CACHE_DIR. They are read once: a reload of the settings does not
+        resize the existing cache.
+        """
+        ttl = settings.get("BPMN_CACHE_TTL")
+        return cls(
+            max_size=int(settings.get("BPMN_CACHE_MAX_SIZE") or 256),
+            ttl=float(ttl) if ttl else None,
+            persist_dir=settings.get("BPMN_CACHE_DIR") or None,
+        )
+
+    def get_json(self, bpmn_xml: str) -> Optional[list[dict[str, Any]]]:
+        """
+        Get the JSON representation cached for the BPMN XML (a new copy on every call).
+        """
+        value = self._cache.get(self._xml_key(bpmn_xml))
+        return json.loads(value) if value is not None else None
+
+    def set_json(self, bpmn_xml: str, process: list[dict[str, Any]]) -> None:
+        self._cache.set(self._xml_key(bpmn_xml), json.dumps(process))
+
+    def get_xml(
+        self, process: list[dict[str, Any]], with_layout: bool = False
+    ) -> Optional[str]:
+        """
+        Get the BPMN XML cached for the JSON representation of the process (with or without
+        the diagram layout).
+        """
+        return self._cache.get(self._json_key(process, with_layout))
+
+    def set_xml(
+        self, process: list[dict[str, Any]], bpmn_xml: str, with_layout: bool = False
+    ) -> None:
+        self._cache.set(self._json_key(process, with_layout), bpmn_xml)
+
+    def stats(self) -> dict[str, Any]:
+        return self._cache.stats()
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    @staticmethod
+    def _xml_key(bpmn_xml: str) -> str:
+        """
+        Hash the BPMN XML, ignoring the XML declaration, the line endings and the whitespace
+        between tags. (A full C14N canonicalization costs more than the conversion itself.)
+        """
+        canonical = _XML_DECLARATION.sub("", bpmn_xml.replace("\r\n", "\n"))
+        canonical = _INTER_TAG_WHITESPACE.sub("><", canonical.strip())
+        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        return f"json-{digest}"
+
+    @staticmethod
+    def _json_key(process: list[dict[str, Any]], with_layout: bool) -> str:
+        canonical = json.dumps(process, sort_keys=True, separators=(",", ":"))
+        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        return f"xml-di-{digest}" if with_layout else f"xml-{digest}"
@@ -3,8 +3,16 @@ import traceback
 from pydantic import BaseModel
 
 from bpmn_assistant.config import logger
-from bpmn_assistant.core import LLMFacade, MessageItem
+from bpmn_assistant.core import (
+    LLMConversation,
+    LLMFacade,
+    MessageItem,
+    ResponseCache,
+    run_conversation,
+    run_conversation_async,
+)
 from bpmn_assistant.prompts import PromptTemplateProcessor
+from bpmn_assistant.services.intent_classifier import IntentClassifier
 from bpmn_assistant.utils import message_history_to_string
 
 
@@ -31,6 +39,8 @@ def determine_intent(
     llm_facade: LLMFacade,
     message_history: list[MessageItem],
     max_retries: int = 3,
+    response_cache: ResponseCache | None = None,
+    intent_classifier: IntentClassifier | None = None,
 ) -> dict:
     """
     Determine the intent of the user based on the message history.
@@ -39,9 +49,60 @@ def determine_intent(
         llm_facade: The LLM facade
         message_history: The message history
         max_retries: The maximum number of retries in case of failure
+        response_cache: The cache of the intents determined for the message histories
+        intent_classifier: A local classifier, which answers instead of the LLM when it is
+            confident enough (and logs the decisions of the LLM)
     Returns:
         dict: The response containing the intent
     """
+    if intent_classifier is not None:
+        local_intent = intent_classifier.classify(message_history)
+        if local_intent is not None:
+            return local_intent
+
+    intent = run_conversation(
+        llm_facade,
+        _determine_intent_conversation(message_history, max_retries),
+        response_cache,
+    )
+
+    if intent_classifier is not None:
+        intent_classifier.log_decision(message_history, intent["intent"])
+
+    return intent
+
+
+async def determine_intent_async(
+    llm_facade: LLMFacade,
+    message_history: list[MessageItem],
+    max_retries: int = 3,
+    response_cache: ResponseCache | None = None,
+    intent_classifier: IntentClassifier | None = None,
+) -> dict:
+    """
+    Determine the intent of the user based on the message history, without blocking the
+    event loop. See `determine_intent`.
+    """
+    if intent_classifier is not None:
+        local_intent = intent_classifier.classify(message_history)
+        if local_intent is not None:
+            return local_intent
+
+    intent = await run_conversation_async(
+        llm_facade,
+        _determine_intent_conversation(message_history, max_retries),
+        response_cache,
+    )
+
+    if intent_classifier is not None:
+        intent_classifier.log_decision(message_history, intent["intent"])
+
+    return intent
+
+
+def _determine_intent_conversation(
+    message_history: list[MessageItem], max_retries: int
+) -> LLMConversation[dict]:
     prompt_processor = PromptTemplateProcessor()
 
     prompt = prompt_processor.render_template(
@@ -56,8 +117,8 @@ def determine_intent(
         attempts += 1
 
         try:
-            json_object = llm_facade.call(
-                prompt,
+            json_object = yield dict(
+                prompt=prompt,
                 max_tokens=20,
                 temperature=0.3,
                 structured_output=DetermineIntentResponse,
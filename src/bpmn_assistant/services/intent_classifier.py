@@ -0,0 +1,259 @@
+import json
+import math
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from bpmn_assistant.config import logger, settings
+from bpmn_assistant.core import MessageItem
+
+INTENTS = ("modify", "talk")
+
+# Keyword rules: each match adds (modify) or subtracts (talk) RULE_WEIGHT to the log-odds
+# of "modify"
+MODIFY_RULES = [
+    re.compile(
+        r"\b(add|insert|include|append|create|make|build|generate|design|draw|model)\b"
+    ),
+    re.compile(r"\b(remove|delete|drop|get rid of|eliminate)\b"),
+    re.compile(
+        r"\b(change|modify|update|edit|rename|replace|move|swap|reorder|connect|"
+        r"redirect|split|merge|combine)\b"
+    ),
+]
+TALK_RULES = [
+    re.compile(
+        r"^\s*(what|why|how|which|who|where|when|explain|describe|tell me|summarize|"
+        r"is|are|does|do)\b"
+    ),
+    re.compile(r"\b(thanks|thank you|hello|hi|hey|bye)\b"),
+    re.compile(r"\?\s*$"),
+]
+RULE_WEIGHT = 1.5
+
+_TOKEN = re.compile(r"[a-z0-9']+")
+
+
+def _features(text: str) -> list[str]:
+    """
+    The unigrams and bigrams of the text.
+    """
+    tokens = _TOKEN.findall(text.lower())
+    return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+
+class NaiveBayesIntentModel:
+    """
+    Multinomial naive Bayes model over the unigrams and bigrams of the last user message,
+    small enough to be trained on the box from the logged intent decisions.
+    """
+
+    def __init__(
+        self,
+        class_counts: Optional[dict[str, int]] = None,
+        feature_counts: Optional[dict[str, dict[str, int]]] = None,
+    ):
+        self.class_counts = class_counts or {intent: 0 for intent in INTENTS}
+        self.feature_counts = feature_counts or {intent: {} for intent in INTENTS}
+        self._prepare()
+
+    @classmethod
+    def train(cls, examples: Iterable[tuple[str, str]]) -> "NaiveBayesIntentModel":
+        """
+        Train the model.
+        Args:
+            examples: The (last user message, intent) pairs
+        """
+        class_counts: Counter = Counter()
+        feature_counts: dict[str, Counter] = {intent: Counter() for intent in INTENTS}
+
+        for text, intent in examples:
+            class_counts[intent] += 1
+            feature_counts[intent].update(_features(text))
+
+        return cls(
+            {intent: class_counts[intent] for intent in INTENTS},
+            {intent: dict(feature_counts[intent]) for intent in INTENTS},
+        )
+
+    def log_odds(self, text: str) -> float:
+        """
+        The log-odds of "modify" against "talk" for the text (0 for an untrained model).
+        """
+        if not all(self.class_counts.values()):
+            return 0.0
+
+        modify, talk = INTENTS
+        score = self._prior_log_odds
+        for feature in _features(text):
+            if feature in self._vocabulary:
+                score += self._log_likelihood(modify, feature) - self._log_likelihood(
+                    talk, feature
+                )
+        return score
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"class_counts": self.class_counts, "feature_counts": self.feature_counts}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "NaiveBayesIntentModel":
+        return cls(data["class_counts"], data["feature_counts"])
+
+    def _prepare(self) -> None:
+        """
+        Precompute the totals used by the predictions.
+        """
+        modify, talk = INTENTS
+        self._vocabulary = set().union(*self.feature_counts.values())
+        self._totals = {
+            intent: sum(counts.values()) + len(self._vocabulary)
+            for intent, counts in self.feature_counts.items()
+        }
+        self._prior_log_odds = (
+            math.log(self.class_counts[modify] / self.class_counts[talk])
+            if all(self.class_counts.values())
+            else 0.0
+        )
+
+    def _log_likelihood(self, intent: str, feature: str) -> float:
+        # Laplace smoothing
+        count = self.feature_counts[intent].get(feature, 0)
+        return math.log((count + 1) / self._totals[intent])
+
+
+class IntentClassifier:
+    """
+    Local classifier of the intent of the last user message ("modify" or "talk"), in front of
+    the LLM: keyword rules plus a naive Bayes model trained from the logged decisions. It only
+    answers when its confidence reaches the threshold, otherwise the LLM decides.
+    """
+
+    def __init__(
+        self,
+        threshold: Optional[float] = 0.9,
+        model: Optional[NaiveBayesIntentModel] = None,
+        decisions_log: Optional[str | Path] = None,
+    ):
+        """
+        Args:
+            threshold: The minimum confidence (between 0.5 and 1) for answering locally
+                (None never answers, e.g. to only log decisions)
+            model: The scoring model (the rules are used alone without it)
+            decisions_log: A JSONL file where the decisions of the LLM are logged, to train
+                the model
+        """
+        self.threshold = threshold
+        self.model = model
+        self.decisions_log = Path(decisions_log) if decisions_log else None
+        self._log_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "IntentClassifier":
+        """
+        Create the classifier configured by the settings INTENT_CLASSIFIER_THRESHOLD (the
+        classifier never answers if it is not set), INTENT_CLASSIFIER_MODEL (a model saved
+        by `save_model`) and INTENT_DECISIONS_LOG.
+        """
+        threshold = settings.get("INTENT_CLASSIFIER_THRESHOLD")
+        model_path = settings.get("INTENT_CLASSIFIER_MODEL")
+
+        return cls(
+            threshold=float(threshold) if threshold else None,
+            model=cls.load_model(model_path) if model_path else None,
+            decisions_log=settings.get("INTENT_DECISIONS_LOG") or None,
+        )
+
+    def predict(self, message_history: list[MessageItem]) -> tuple[str, float]:
+        """
+        Predict the intent of the last user message.
+        Returns:
+            The most likely intent and its probability
+        """
+        text = self.last_user_message(message_history).lower()
+
+        score = self.model.log_odds(text) if self.model is not None else 0.0
+        score += RULE_WEIGHT * sum(1 for rule in MODIFY_RULES if rule.search(text))
+        score -= RULE_WEIGHT * sum(1 for rule in TALK_RULES if rule.search(text))
+
+        probability = 1 / (1 + math.exp(-max(min(score, 50.0), -50.0)))
+        if probability >= 0.5:
+            return "modify", probability
+        return "talk", 1 - probability
+
+    def classify(self, message_history: list[MessageItem]) -> Optional[dict]:
+        """
+        Classify the intent if the classifier is confident enough.
+        Returns:
+            The intent response ({"intent": ...}), or None if the LLM must decide
+        """
+        if self.threshold is None or not message_history:
+            return None
+
+        intent, confidence = self.predict(message_history)
+
+        if confidence < self.threshold:
+            return None
+
+        logger.info(f"Intent (local, confidence {confidence:.2f}): {intent}")
+        return {"intent": intent}
+
+    def log_decision(self, message_history: list[MessageItem], intent: str) -> None:
+        """
+        Log a decision of the LLM, to train the model later.
+        """
+        if self.decisions_log is None or not message_history:
+            return
+
+        record = {
+            "message_history": [message.model_dump() for message in message_history],
+            "intent": intent,
+        }
+        with self._log_lock:
+            try:
+                self.decisions_log.parent.mkdir(parents=True, exist_ok=True)
+                with self.decisions_log.open("a", encoding="utf-8") as file:
+                    file.write(json.dumps(record) + "\n")
+            except OSError as e:
+                logger.warning(f"Could not log the intent decision: {e}")
+
+    @staticmethod
+    def last_user_message(message_history: list[MessageItem]) -> str:
+        for message in reversed(message_history):
+            if message.role == "user":
+                return message.content
+        return ""
+
+    @staticmethod
+    def load_decisions(path: str | Path) -> list[tuple[list[MessageItem], str]]:
+        """
+        Load the logged (or recorded) decisions: one JSON object per line, with the
+        "message_history" and the "intent".
+        """
+        decisions = []
+        with Path(path).open(encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    record = json.loads(line)
+                    history = [MessageItem(**m) for m in record["message_history"]]
+                    decisions.append((history, record["intent"]))
+        return decisions
+
+    @classmethod
+    def train_model(
+        cls, decisions: Iterable[tuple[list[MessageItem], str]]
+    ) -> NaiveBayesIntentModel:
+        return NaiveBayesIntentModel.train(
+            (cls.last_user_message(history), intent) for history, intent in decisions
+        )
+
+    @staticmethod
+    def save_model(model: NaiveBayesIntentModel, path: str | Path) -> None:
+        Path(path).write_text(json.dumps(model.to_dict()), encoding="utf-8")
+
+    @staticmethod
+    def load_model(path: str | Path) -> NaiveBayesIntentModel:
+        return NaiveBayesIntentModel.from_dict(
+            json.loads(Path(path).read_text(encoding="utf-8"))
+        )
@@ -1,3 +1,5 @@
+from .process_index import ProcessIndex
 from .functions import *
+from .edit_log import EditLog, EditLogEntry
 from .bpmn_editing_service import *
 from .define_change_request import *
@@ -1,36 +1,100 @@
+from typing import Any
+
 from bpmn_assistant.config import logger
-from bpmn_assistant.core import EditProposal, IntermediateEditProposal, LLMFacade
-from bpmn_assistant.core.exceptions import ProcessException
+from bpmn_assistant.core import (
+    InitialEditProposal,
+    IntermediateEditProposal,
+    LLMConversation,
+    LLMFacade,
+    LLMUsage,
+    run_conversation,
+    run_conversation_async,
+)
+from bpmn_assistant.core.exceptions import LLMCallError, ProcessException
 from bpmn_assistant.prompts import PromptTemplateProcessor
-from bpmn_assistant.services.process_editing import (
-    add_element,
-    delete_element,
-    move_element,
-    redirect_branch,
-    update_element,
+from bpmn_assistant.services.process_editing.edit_log import EditLog
+from bpmn_assistant.services.process_editing.process_diff import diff_processes
+from bpmn_assistant.services.process_outline import (
+    outline_to_process,
+    process_to_outline,
 )
 from bpmn_assistant.services.validate_bpmn import validate_element
 
 
 class BpmnEditingService:
-    def __init__(self, llm_facade: LLMFacade, process: list, change_request: str):
+    def __init__(
+        self,
+        llm_facade: LLMFacade,
+        process: list,
+        change_request: str,
+        diff_checkpoint_interval: int | None = None,
+    ):
+        """
+        Args:
+            llm_facade: The LLM facade
+            process: The BPMN process to edit
+            change_request: The change request
+            diff_checkpoint_interval: If set, the prompts of the intermediate steps only
+                contain the changes to the process since the previous step, and the full
+                process (a checkpoint) is sent again after this many diffs. By default, every
+                prompt contains the full process.
+        """
         self.llm_facade = llm_facade
         self.process = process
         self.change_request = change_request
+        self.diff_checkpoint_interval = diff_checkpoint_interval
         self.prompt_processor = PromptTemplateProcessor()
+        self.edit_log = EditLog(process)
+        # The last version of the process shown to the LLM, and the diffs sent since
+        self._shown_process = process
+        self._diffs_since_checkpoint = 0
+        # The intermediate iterations completed, over all the runs of the editing
+        self._completed_iterations = 0
+        self._first_call = len(llm_facade.usage)
+
+    @property
+    def usage(self) -> list[LLMUsage]:
+        """
+        The tokens and the latency of the LLM calls of the editing session.
+        """
+        return self.llm_facade.usage[self._first_call :]
 
     def edit_bpmn(self) -> list:
         """
-        Edit a BPMN process based on a change request.
+        Edit a BPMN process based on a change request. If an LLM call fails (an
+        `LLMCallError`), the edits applied so far are kept in the edit log, and calling this
+        method again on the same service resumes the editing from them, within the
+        iterations left (instead of starting over), as `BpmnModelingService` does.
+        Returns:
+            The updated BPMN process
+        Raises:
+            LLMCallError: If an LLM call fails
+            Exception: If the max number of retries or iterations is reached
+        """
+        process = run_conversation(self.llm_facade, self._edit_bpmn_conversation())
+        self._log_usage()
+        return process
+
+    async def edit_bpmn_async(self) -> list:
+        """
+        Edit a BPMN process based on a change request, without blocking the event loop.
+        See `edit_bpmn`.
         Returns:
             The updated BPMN process
         """
-        updated_process = self._apply_initial_edit()
-        updated_process = self._apply_intermediate_edits(updated_process)
+        process = await run_conversation_async(
+            self.llm_facade, self._edit_bpmn_conversation()
+        )
+        self._log_usage()
+        return process
+
+    def _edit_bpmn_conversation(self) -> LLMConversation[list]:
+        if not self.edit_log.entries:
+            yield from self._apply_initial_edit()
 
-        return updated_process
+        return (yield from self._apply_intermediate_edits())
 
-    def _apply_initial_edit(self, max_retries: int = 4) -> list:
+    def _apply_initial_edit(self, max_retries: int = 4) -> LLMConversation[list]:
         """
         Apply the initial edit to the process.
         Args:
@@ -42,7 +106,7 @@ class BpmnEditingService:
 
         prompt = self.prompt_processor.render_template(
             "edit_bpmn.jinja2",
-            process=str(self.process),
+            process=process_to_outline(self.process),
             change_request=self.change_request,
         )
 
@@ -51,16 +115,13 @@ class BpmnEditingService:
 
             # Get initial edit proposal
             try:
-                edit_proposal: EditProposal = self.llm_facade.call(
-                    prompt, structured_output=EditProposal
-                )
+                edit_proposal = yield from self._propose_edit(prompt, InitialEditProposal)
                 logger.info(f"Edit proposal: {edit_proposal}")
                 self._validate_edit_proposal(edit_proposal)
 
                 # Update process based on the edit proposal
                 try:
-                    updated_process = self._update_process(self.process, edit_proposal)
-                    return updated_process
+                    return self.edit_log.apply(edit_proposal)
                 except ProcessException as e:
                     logger.warning(f"Validation error (attempt {attempts}): {str(e)}")
                     prompt = f"Error: {str(e)}. Try again. Change request: {self.change_request}"
@@ -72,46 +133,41 @@ class BpmnEditingService:
 
     def _apply_intermediate_edits(
         self,
-        updated_process: list,
         max_retries: int = 4,
         max_num_of_iterations: int = 7,
-    ) -> list:
+    ) -> LLMConversation[list]:
         """
-        Apply intermediate edits to the process.
+        Apply intermediate edits to the process (after the edits already in the log).
         Args:
-            updated_process: The updated process after the initial edit
             max_retries: The maximum number of retries to perform if the response is invalid
-            max_num_of_iterations: The maximum number of iterations to perform
+            max_num_of_iterations: The maximum number of iterations to perform, including
+                those of the previous runs of a resumed editing
         Returns:
             The updated process
         Raises:
             Exception: If the max number of retries or iterations is reached
         """
-        for iteration_index in range(max_num_of_iterations):
+        for iteration_index in range(self._completed_iterations, max_num_of_iterations):
             attempts = 0
 
-            prompt = self.prompt_processor.render_template(
-                "edit_bpmn_intermediate_step.jinja2",
-                process=str(updated_process),
-            )
+            prompt = self._render_intermediate_step_prompt()
 
             while attempts < max_retries:
                 attempts += 1
 
                 try:
-                    edit_proposal: IntermediateEditProposal = self.llm_facade.call(
-                        prompt, structured_output=IntermediateEditProposal
+                    edit_proposal = yield from self._propose_edit(
+                        prompt, IntermediateEditProposal
                     )
                     logger.info(f"Intermediate edit proposal: {edit_proposal}")
                     self._validate_edit_proposal(edit_proposal, is_first_edit=False)
 
                     if "stop" in edit_proposal:
                         logger.info("Edit process stopped.")
-                        return updated_process
+                        return self.edit_log.process
 
-                    updated_process = self._update_process(
-                        updated_process, edit_proposal
-                    )
+                    self.edit_log.apply(edit_proposal)
+                    self._completed_iterations += 1
 
                     break
 
@@ -126,30 +182,57 @@ class BpmnEditingService:
 
         raise Exception("Max number of editing iterations reached.")
 
-    def _update_process(self, process: list, edit_proposal: dict) -> list:
+    @staticmethod
+    def _propose_edit(prompt: str, structured_output: Any) -> LLMConversation[Any]:
         """
-        Update the process based on the edit proposal.
-        Args:
-            process: The BPMN process to be edited
-            edit_proposal: The edit proposal from the LLM (function and args)
-        Returns:
-            The updated process
-        Raises:
-            ProcessException: If the edit proposal is invalid
+        Ask the LLM for an edit proposal. A failure of the call itself (e.g. a network
+        error) is raised as an `LLMCallError`, after which the editing can be resumed; an
+        invalid response (a ValueError) is left to the retries of the caller.
         """
-        edit_functions = {
-            "delete_element": delete_element,
-            "redirect_branch": redirect_branch,
-            "add_element": add_element,
-            "move_element": move_element,
-            "update_element": update_element,
-        }
-
-        function_to_call = edit_proposal["function"]
-        args = edit_proposal["arguments"]
+        try:
+            return (yield dict(prompt=prompt, structured_output=structured_output))
+        except ValueError:
+            raise
+        except Exception as e:
+            raise LLMCallError(f"LLM call failed: {str(e)}") from e
+
+    def _render_intermediate_step_prompt(self) -> str:
+        """
+        Render the prompt of an intermediate step with the full process or, in the diff
+        mode, with its changes since the last version shown to the LLM. The full process is
+        sent instead if the checkpoint interval is reached, or if the changes are not
+        shorter.
+        """
+        process = self.edit_log.process
+        outline = process_to_outline(process)
+        changes = None
+
+        if (
+            self.diff_checkpoint_interval
+            and self._diffs_since_checkpoint < self.diff_checkpoint_interval
+        ):
+            diff = "\n".join(diff_processes(self._shown_process, process))
+            if diff and len(diff) < len(outline):
+                changes = diff
+
+        self._shown_process = process
+        self._diffs_since_checkpoint = self._diffs_since_checkpoint + 1 if changes else 0
+
+        return self.prompt_processor.render_template(
+            "edit_bpmn_intermediate_step.jinja2",
+            process=outline,
+            changes=changes,
+        )
 
-        res = edit_functions[function_to_call](process, **args)
-        return res["process"]
+    def _log_usage(self) -> None:
+        usage = self.usage
+        logger.info(
+            f"Editing session: {len(usage)} LLM calls, "
+            f"{sum(u.total_input_tokens for u in usage)} input tokens "
+            f"({sum(u.cache_read_input_tokens for u in usage)} cached), "
+            f"{sum(u.output_tokens for u in usage)} output tokens, "
+            f"{sum(u.latency for u in usage):.2f}s"
+        )
 
     def _validate_edit_proposal(
         self, edit_proposal: dict, is_first_edit: bool = True
@@ -170,13 +253,39 @@ class BpmnEditingService:
                 )
             return
 
-        if "function" not in edit_proposal or "arguments" not in edit_proposal:
+        if "operations" in edit_proposal:
+            operations = edit_proposal["operations"]
+            if len(edit_proposal) > 1:
+                raise ValueError(
+                    "If 'operations' key is present, no other key should be provided."
+                )
+            if not isinstance(operations, list) or not operations:
+                raise ValueError("'operations' should be a non-empty list.")
+            for index, operation in enumerate(operations, start=1):
+                try:
+                    self._validate_operation(operation)
+                except ValueError as e:
+                    raise ValueError(f"Invalid operation {index}: {str(e)}") from e
+            return
+
+        self._validate_operation(edit_proposal)
+
+    def _validate_operation(self, operation: dict) -> None:
+        """
+        Validate a single edit operation (function and args).
+        Raises:
+            ValueError: If the operation is invalid
+        """
+        if not isinstance(operation, dict):
+            raise ValueError("Function call should be a JSON object.")
+
+        if "function" not in operation or "arguments" not in operation:
             raise ValueError(
                 "Function call should contain 'function' and 'arguments' keys."
             )
 
-        function_to_call = edit_proposal["function"]
-        args = edit_proposal["arguments"]
+        function_to_call = operation["function"]
+        args = operation["arguments"]
 
         if function_to_call == "delete_element":
             self._validate_delete_element(args)
@@ -196,6 +305,7 @@ class BpmnEditingService:
             raise ValueError("Arguments should contain 'new_element' key.")
         elif len(args) > 1:
             raise ValueError("Arguments should contain only 'new_element' key.")
+        args["new_element"] = self._decode_element(args["new_element"])
         validate_element(args["new_element"])
 
     def _validate_move_element(self, args):
@@ -225,8 +335,28 @@ class BpmnEditingService:
             raise ValueError(
                 "Arguments should contain only 'element' and either 'before_id' or 'after_id' keys."
             )
+        args["element"] = self._decode_element(args["element"])
         validate_element(args["element"])
 
+    @staticmethod
+    def _decode_element(element: dict | str) -> dict:
+        """
+        Decode an element given as an outline (the notation of the process in the prompts),
+        which the LLM may use for a gateway with branches.
+        Raises:
+            ValueError: If the outline is malformed or does not hold exactly one element
+        """
+        if not isinstance(element, str):
+            return element
+
+        elements = outline_to_process(element)
+        if len(elements) != 1:
+            raise ValueError(
+                "The outline of an element should hold exactly one element (with its "
+                f"branches), not {len(elements)}."
+            )
+        return elements[0]
+
     def _validate_redirect_branch(self, args):
         if "branch_condition" not in args or "next_id" not in args:
             raise ValueError(
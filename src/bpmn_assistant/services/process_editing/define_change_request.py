@@ -1,6 +1,14 @@
 from bpmn_assistant.config import logger
-from bpmn_assistant.core import LLMFacade, MessageItem
+from bpmn_assistant.core import (
+    LLMConversation,
+    LLMFacade,
+    MessageItem,
+    ResponseCache,
+    run_conversation,
+    run_conversation_async,
+)
 from bpmn_assistant.prompts import PromptTemplateProcessor
+from bpmn_assistant.services.process_outline import process_to_outline
 from bpmn_assistant.utils import message_history_to_string
 
 
@@ -8,6 +16,7 @@ def define_change_request(
     text_llm_facade: LLMFacade,
     process: list[dict],
     message_history: list[MessageItem],
+    response_cache: ResponseCache | None = None,
 ) -> str:
     """
     Defines the change to be made in the BPMN process based on the message history.
@@ -15,17 +24,46 @@ def define_change_request(
         text_llm_facade: The LLMFacade object for text output.
         process: The BPMN process
         message_history: The message history
+        response_cache: The cache of the change requests defined for the processes and
+            message histories
     Returns:
         str: The change request
     """
+    return run_conversation(
+        text_llm_facade,
+        _define_change_request_conversation(process, message_history),
+        response_cache,
+    )
+
+
+async def define_change_request_async(
+    text_llm_facade: LLMFacade,
+    process: list[dict],
+    message_history: list[MessageItem],
+    response_cache: ResponseCache | None = None,
+) -> str:
+    """
+    Defines the change to be made in the BPMN process based on the message history, without
+    blocking the event loop. See `define_change_request`.
+    """
+    return await run_conversation_async(
+        text_llm_facade,
+        _define_change_request_conversation(process, message_history),
+        response_cache,
+    )
+
+
+def _define_change_request_conversation(
+    process: list[dict], message_history: list[MessageItem]
+) -> LLMConversation[str]:
     prompt_processor = PromptTemplateProcessor()
 
     prompt = prompt_processor.render_template(
         "define_change_request.jinja2",
-        process=str(process),
+        process=process_to_outline(process),
         message_history=message_history_to_string(message_history),
     )
 
-    change_request = text_llm_facade.call(prompt, max_tokens=3000, temperature=0.4)
+    change_request = yield dict(prompt=prompt, max_tokens=3000, temperature=0.4)
     logger.info(f"Change request: {change_request}")
     return change_request
@@ -0,0 +1,129 @@
+from dataclasses import dataclass
+from typing import Callable
+
+from bpmn_assistant.core.exceptions import ProcessException
+from bpmn_assistant.services.process_editing.functions import (
+    add_element,
+    delete_element,
+    move_element,
+    redirect_branch,
+    update_element,
+)
+from bpmn_assistant.services.process_editing.process_index import ProcessIndex
+
+EDIT_FUNCTIONS: dict[str, Callable[..., dict]] = {
+    "delete_element": delete_element,
+    "redirect_branch": redirect_branch,
+    "add_element": add_element,
+    "move_element": move_element,
+    "update_element": update_element,
+}
+
+
+@dataclass(frozen=True)
+class EditLogEntry:
+    """
+    An edit applied to the process: the edit proposal (a function call, or a batch of
+    them under "operations") and the process it produced.
+    """
+
+    edit_proposal: dict
+    process: list
+
+
+class EditLog:
+    """
+    Log of the edits applied to a process, from which a failed editing session resumes.
+
+    The editing functions copy only the path to the edited element (the rest of the
+    process is shared with the previous version), so every entry keeps the process it
+    produced as a snapshot, for the size of the changed path.
+    """
+
+    def __init__(self, process: list):
+        """
+        Args:
+            process: The process before the edits
+        """
+        self.initial_process = process
+        self._entries: list[EditLogEntry] = []
+        # The index of the last edited process, shared by the successive edits
+        self._process_index: ProcessIndex | None = None
+        self._indexed_process: list | None = None
+
+    @property
+    def process(self) -> list:
+        """
+        The current process (with the applied edits).
+        """
+        if not self._entries:
+            return self.initial_process
+        return self._entries[-1].process
+
+    @property
+    def entries(self) -> list[EditLogEntry]:
+        """
+        The applied edits, in order.
+        """
+        return list(self._entries)
+
+    def apply(self, edit_proposal: dict) -> list:
+        """
+        Apply an edit proposal to the current process. The operations of a batch are
+        applied in order, each to the result of the previous one, and the edit is only
+        logged if all of them succeed.
+        Args:
+            edit_proposal: The edit proposal (function and args, or a batch of them under
+                "operations")
+        Returns:
+            The updated process
+        Raises:
+            ProcessException, ValueError: If the edit proposal cannot be applied (the log is
+                left unchanged)
+        """
+        process = self.process
+
+        if "operations" not in edit_proposal:
+            updated_process = self._apply_operation(process, edit_proposal)
+        else:
+            operations = edit_proposal["operations"]
+            updated_process = process
+
+            for index, operation in enumerate(operations, start=1):
+                try:
+                    updated_process = self._apply_operation(updated_process, operation)
+                except (ProcessException, ValueError) as e:
+                    raise type(e)(
+                        f"Operation {index} of {len(operations)} "
+                        f"({operation['function']}) failed: {str(e)}. "
+                        "None of the operations were applied."
+                    ) from e
+
+        self._entries.append(EditLogEntry(edit_proposal, updated_process))
+
+        return updated_process
+
+    def _apply_operation(self, process: list, operation: dict) -> list:
+        """
+        Apply a single edit operation (function and args) to the process.
+        Returns:
+            The updated process (a new one, the given process is left untouched)
+        """
+        function_to_call = operation["function"]
+        args = operation["arguments"]
+
+        if self._indexed_process is process:
+            process_index = self._process_index
+        else:
+            process_index = ProcessIndex(process)
+
+        # A failed edit may leave the index partially updated
+        self._indexed_process = None
+
+        res = EDIT_FUNCTIONS[function_to_call](
+            process, **args, process_index=process_index
+        )
+
+        self._process_index = process_index
+        self._indexed_process = res["process"]
+        return res["process"]
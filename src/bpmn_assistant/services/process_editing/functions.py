@@ -1,5 +1,4 @@
-from copy import deepcopy
-from typing import Optional
+from typing import Container, Optional
 
 from bpmn_assistant.core.exceptions import (
     ElementAlreadyExistsError,
@@ -7,50 +6,52 @@ from bpmn_assistant.core.exceptions import (
     GatewayUpdateError,
 )
 
-from .helpers import find_branch_position, find_position, get_all_ids
+from .helpers import copy_path
+from .process_index import ProcessIndex
 
+# Every editing function takes an optional `process_index`: the index of the process,
+# which the function updates to match the returned process, so that a sequence of edits
+# shares one index. Without it, the function indexes the process itself.
 
-def delete_element(process: list[dict], element_id: str) -> dict:
-    ids = get_all_ids(process)
 
-    if element_id not in ids:
-        raise ElementNotFoundException(f"Element with id {element_id} does not exist")
-
-    process_copy = deepcopy(process)
-
-    position = find_position(process_copy, before_id=element_id)
+def delete_element(
+    process: list[dict],
+    element_id: str,
+    process_index: Optional[ProcessIndex] = None,
+) -> dict:
+    if process_index is None:
+        process_index = ProcessIndex(process)
 
-    current = process_copy
+    position = process_index.position(element_id)
 
-    for path_element in position.path[:-1]:
-        current = current[path_element]
+    process_copy, target_list = copy_path(process, position.path)
 
-    if position.path:
-        removed_element = current[position.path[-1]].pop(position.index)
-    else:
-        removed_element = current.pop(position.index)
+    removed_element = target_list.pop(position.index)
 
     if removed_element is None:
         raise ElementNotFoundException("Could not find the element to remove")
 
+    process_index.element_removed(process_copy, position, removed_element)
+
     return {
         "process": process_copy,
         "removed_element": removed_element,
     }
 
 
-def redirect_branch(process: list[dict], branch_condition: str, next_id: str) -> dict:
-    # FIXME: Two branches can have the same condition in different gateways
-    position = find_branch_position(process, branch_condition)
-
-    process_copy = deepcopy(process)
-
-    current = process_copy
+def redirect_branch(
+    process: list[dict],
+    branch_condition: str,
+    next_id: str,
+    process_index: Optional[ProcessIndex] = None,
+) -> dict:
+    if process_index is None:
+        process_index = ProcessIndex(process)
 
-    for path_element in position.path:
-        current = current[path_element]
+    # FIXME: Two branches can have the same condition in different gateways
+    position = process_index.branch_position(branch_condition)
 
-    branch = current[position.index]
+    process_copy, branch = copy_path(process, position.path + [position.index])
 
     branch["next"] = next_id
 
@@ -60,7 +61,9 @@ def redirect_branch(process: list[dict], branch_condition: str, next_id: str) ->
     }
 
 
-def validate_params(ids: list[str], before_id: Optional[str], after_id: Optional[str]):
+def validate_params(
+    ids: Container[str], before_id: Optional[str], after_id: Optional[str]
+):
     """
     Validate the parameters for placing an element within the process.
     """
@@ -79,32 +82,26 @@ def add_element(
     element: dict,
     before_id: Optional[str] = None,
     after_id: Optional[str] = None,
+    process_index: Optional[ProcessIndex] = None,
 ) -> dict:
-    ids = get_all_ids(process)
+    if process_index is None:
+        process_index = ProcessIndex(process)
 
-    if element["id"] in ids:
+    if element["id"] in process_index:
         raise ElementAlreadyExistsError(
             f"Element with id {element['id']} already exists"
         )
 
-    validate_params(ids, before_id, after_id)
-
-    position = find_position(process, before_id=before_id, after_id=after_id)
-
-    process_copy = deepcopy(process)
+    validate_params(process_index, before_id, after_id)
 
-    current = process_copy
+    position = process_index.insertion_position(before_id, after_id)
 
-    for path_element in position.path[:-1]:
-        current = current[path_element]
-
-    if position.path:
-        target_list = current[position.path[-1]]
-    else:
-        target_list = current
+    process_copy, target_list = copy_path(process, position.path)
 
     target_list.insert(position.index, element)
 
+    process_index.element_added(process_copy, position)
+
     return {
         "process": process_copy,
         "added_element": element,
@@ -116,18 +113,28 @@ def move_element(
     element_id: str,
     before_id: Optional[str] = None,
     after_id: Optional[str] = None,
+    process_index: Optional[ProcessIndex] = None,
 ) -> dict:
-    ids = get_all_ids(process)
+    if process_index is None:
+        process_index = ProcessIndex(process)
 
-    if element_id not in ids:
+    if element_id not in process_index:
         raise ElementNotFoundException(f"Element with id {element_id} does not exist")
 
-    validate_params(ids, before_id, after_id)
+    validate_params(process_index, before_id, after_id)
+
+    # The element cannot be moved next to itself or inside itself (checked before the
+    # delete, so that a failed move leaves the index untouched)
+    target_id = before_id if before_id is not None else after_id
+    if target_id is not None and process_index.is_inside(target_id, element_id):
+        raise ElementNotFoundException(f"Element with id {target_id} does not exist")
 
-    process_copy, removed_element = delete_element(process, element_id).values()
+    process_copy, removed_element = delete_element(
+        process, element_id, process_index
+    ).values()
 
     process_copy, added_element = add_element(
-        process_copy, removed_element, before_id, after_id
+        process_copy, removed_element, before_id, after_id, process_index
     ).values()
 
     return {
@@ -136,10 +143,15 @@ def move_element(
     }
 
 
-def update_element(process: list[dict], new_element: dict) -> dict:
-    ids = get_all_ids(process)
+def update_element(
+    process: list[dict],
+    new_element: dict,
+    process_index: Optional[ProcessIndex] = None,
+) -> dict:
+    if process_index is None:
+        process_index = ProcessIndex(process)
 
-    if new_element["id"] not in ids:
+    if new_element["id"] not in process_index:
         raise ElementNotFoundException(
             f"Element with id {new_element['id']} does not exist"
         )
@@ -149,21 +161,15 @@ def update_element(process: list[dict], new_element: dict) -> dict:
     ]:
         raise GatewayUpdateError("Cannot update a gateway element")
 
-    position = find_position(process, before_id=new_element["id"])
+    position = process_index.position(new_element["id"])
 
-    process_copy = deepcopy(process)
-
-    current = process_copy
-    for path_element in position.path[:-1]:
-        current = current[path_element]
-
-    if position.path:
-        target_list = current[position.path[-1]]
-    else:
-        target_list = current
+    process_copy, target_list = copy_path(process, position.path)
 
+    replaced_element = target_list[position.index]
     target_list[position.index] = new_element
 
+    process_index.element_replaced(process_copy, position, replaced_element)
+
     return {
         "process": process_copy,
         "updated_element": new_element,
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Optional
 
 from bpmn_assistant.core.enums import BPMNElementType
 from bpmn_assistant.core.exceptions import ProcessException
@@ -25,6 +25,30 @@ def get_all_ids(process: list[dict]):
     return ids
 
 
+def copy_path(process: list[dict], path: list) -> tuple[list[dict], Any]:
+    """
+    Copy the containers (lists and dicts) on the path from the root of the process to its
+    end, and nothing else: the new process shares every other element with the original
+    one (structural sharing). The original process is left untouched, as long as only the
+    returned container is modified.
+    Args:
+        process: The process.
+        path: The path to a container in the process (e.g. [0, "branches", 1, "path"]).
+    Returns:
+        tuple: The new process, and the copy of the container at the end of the path.
+    """
+    process_copy = list(process)
+
+    current: Any = process_copy
+    for path_element in path:
+        child = current[path_element]
+        child = list(child) if isinstance(child, list) else dict(child)
+        current[path_element] = child
+        current = child
+
+    return process_copy, current
+
+
 def _find_position_in_process(
     process: list[dict],
     target_id: str,
@@ -0,0 +1,165 @@
+from difflib import SequenceMatcher
+from typing import Optional
+
+from bpmn_assistant.core.enums import BPMNElementType
+from bpmn_assistant.services.process_outline import INDENT, process_to_outline
+
+# A sequence of the process: () for the top level, (gateway id, branch index) for a branch
+SequenceKey = tuple
+
+
+class _FlatProcess:
+    """
+    The elements of a process by id, with the sequence holding each of them.
+    """
+
+    def __init__(self, process: list[dict]):
+        self.elements: dict[str, dict] = {}
+        self.parents: dict[str, Optional[str]] = {}  # Element id -> gateway id
+        self.sequence_of: dict[str, SequenceKey] = {}
+        self.sequences: dict[SequenceKey, list[str]] = {}
+        self.sequence_names: dict[SequenceKey, str] = {(): "the process"}
+        self._add_sequence(process, (), None)
+
+    def _add_sequence(
+        self, sequence: list[dict], key: SequenceKey, parent: Optional[str]
+    ) -> None:
+        self.sequences[key] = [element["id"] for element in sequence]
+
+        for element in sequence:
+            self.elements[element["id"]] = element
+            self.parents[element["id"]] = parent
+            self.sequence_of[element["id"]] = key
+
+            if element["type"] == BPMNElementType.EXCLUSIVE_GATEWAY.value:
+                for index, branch in enumerate(element["branches"]):
+                    branch_key = (element["id"], index)
+                    self.sequence_names[branch_key] = (
+                        f"the branch '{branch['condition']}' of '{element['id']}'"
+                    )
+                    self._add_sequence(branch["path"], branch_key, element["id"])
+            elif element["type"] == BPMNElementType.PARALLEL_GATEWAY.value:
+                for index, branch in enumerate(element["branches"]):
+                    branch_key = (element["id"], index)
+                    self.sequence_names[branch_key] = (
+                        f"the branch {index + 1} of '{element['id']}'"
+                    )
+                    self._add_sequence(branch, branch_key, element["id"])
+
+    def location(self, element_id: str) -> str:
+        """
+        Describe where the element is: after its predecessor, or at the start of its
+        sequence.
+        """
+        key = self.sequence_of[element_id]
+        index = self.sequences[key].index(element_id)
+
+        if index > 0:
+            return f"after '{self.sequences[key][index - 1]}'"
+        return f"at the start of {self.sequence_names[key]}"
+
+
+def _summary(element: dict) -> dict:
+    """
+    The element without the elements of its branches (the conditions and the "next" of
+    the branches of an exclusive gateway are kept).
+    """
+    if element["type"] == BPMNElementType.EXCLUSIVE_GATEWAY.value:
+        return {
+            **element,
+            "branches": [{**branch, "path": []} for branch in element["branches"]],
+        }
+    elif element["type"] == BPMNElementType.PARALLEL_GATEWAY.value:
+        return {**element, "branches": []}
+    return element
+
+
+def _describe(change: str, element: dict, location: str = "") -> str:
+    """
+    Describe a change with the outline of the element: its line, followed by the location,
+    and the lines of its branches indented below.
+    """
+    first_line, *branch_lines = process_to_outline([element]).split("\n")
+    return "\n".join(
+        [f"- {change} {first_line}{location}"]
+        + [INDENT + line for line in branch_lines]
+    )
+
+
+def _moved_ids(old: _FlatProcess, new: _FlatProcess) -> set[str]:
+    """
+    The elements found in both processes whose sequence changed, or which changed places
+    within their sequence (the ones outside a longest common subsequence).
+    """
+    moved: set[str] = set()
+
+    for key, new_sequence in new.sequences.items():
+        new_ids = [
+            element_id
+            for element_id in new_sequence
+            if element_id in old.elements and old.sequence_of[element_id] == key
+        ]
+        old_ids = [
+            element_id
+            for element_id in old.sequences.get(key, [])
+            if new.sequence_of.get(element_id) == key
+        ]
+
+        matcher = SequenceMatcher(None, old_ids, new_ids, autojunk=False)
+        kept = set()
+        for block in matcher.get_matching_blocks():
+            kept.update(new_ids[block.b : block.b + block.size])
+
+        moved.update(element_id for element_id in new_ids if element_id not in kept)
+        moved.update(
+            element_id
+            for element_id in new_sequence
+            if element_id in old.elements and old.sequence_of[element_id] != key
+        )
+
+    return moved
+
+
+def diff_processes(old_process: list[dict], new_process: list[dict]) -> list[str]:
+    """
+    Describe the changes between two versions of a process, compactly: the elements
+    removed, added (with their outline and location), moved (with their new location) and
+    updated (with their new outline, without the elements of their branches).
+    Args:
+        old_process: The previous version of the process
+        new_process: The new version of the process
+    Returns:
+        list: One entry per change, in the order of the new process (an empty list if the
+            processes are identical)
+    """
+    old = _FlatProcess(old_process)
+    new = _FlatProcess(new_process)
+    moved = _moved_ids(old, new)
+
+    changes = [
+        f"- Removed '{element_id}'"
+        for element_id in old.elements
+        if element_id not in new.elements
+        # The elements of a removed gateway are removed with it
+        and (old.parents[element_id] is None or old.parents[element_id] in new.elements)
+    ]
+
+    for element_id, element in new.elements.items():
+        parent = new.parents[element_id]
+
+        if element_id not in old.elements:
+            # The elements of an added gateway are added with it
+            if parent is None or parent in old.elements:
+                changes.append(
+                    _describe("Added", element, f" {new.location(element_id)}")
+                )
+            continue
+
+        if element_id in moved:
+            changes.append(f"- Moved '{element_id}' {new.location(element_id)}")
+
+        summary = _summary(element)
+        if summary != _summary(old.elements[element_id]):
+            changes.append(_describe("Updated", summary))
+
+    return changes
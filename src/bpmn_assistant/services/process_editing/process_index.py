@@ -0,0 +1,179 @@
+from typing import Optional
+
+from bpmn_assistant.core.enums import BPMNElementType
+from bpmn_assistant.core.exceptions import ElementNotFoundException, ProcessException
+from bpmn_assistant.services.process_editing.position import Position
+
+
+class ProcessIndex:
+    """
+    Index of a process: the position of every element by id, and the exclusive gateway
+    branches by condition. It is built with one traversal of the process, then maintained
+    incrementally by the editing functions: an edit only re-indexes the elements it shifted
+    (the ones after the edited element in its sequence), so the lookups of the next edits
+    need no traversal.
+    """
+
+    def __init__(self, process: list[dict]):
+        self._positions: dict[str, Position] = {}
+        # Condition -> {exclusive gateway id: branch index}
+        self._branches: dict[str, dict[str, int]] = {}
+        self._index_sequence(process, [], 0)
+
+    def __contains__(self, element_id: object) -> bool:
+        return element_id in self._positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def position(self, element_id: str) -> Position:
+        """
+        Get the position of an element.
+        Raises:
+            ElementNotFoundException: If the element does not exist
+        """
+        try:
+            return self._positions[element_id]
+        except KeyError:
+            raise ElementNotFoundException(
+                f"Element with id {element_id} does not exist"
+            ) from None
+
+    def is_inside(self, element_id: str, ancestor_id: str) -> bool:
+        """
+        Check whether the element is the ancestor or one of its descendants (the elements
+        in the branches of a gateway).
+        """
+        if element_id not in self._positions or ancestor_id not in self._positions:
+            return False
+
+        element_path = self._document_order(element_id)
+        ancestor_path = self._document_order(ancestor_id)
+        return element_path[: len(ancestor_path)] == ancestor_path
+
+    def insertion_position(
+        self, before_id: Optional[str] = None, after_id: Optional[str] = None
+    ) -> Position:
+        """
+        Get the position to insert a new element based on the before_id or after_id (see
+        `find_position`).
+        """
+        if before_id is None and after_id is None:
+            raise ProcessException("Both before_id and after_id cannot be None")
+        elif before_id is not None and after_id is not None:
+            raise ProcessException("Only one of before_id and after_id can be specified")
+
+        target_id = before_id if before_id is not None else after_id
+        if target_id not in self._positions:
+            raise ProcessException(f"Element with id {target_id} does not exist")
+
+        position = self._positions[target_id]
+        if after_id is not None:
+            return Position(position.index + 1, position.path)
+        return position
+
+    def branch_position(self, condition: str) -> Position:
+        """
+        Get the position of the exclusive gateway branch with the condition (the first one
+        in the process if several branches have it, see `find_branch_position`).
+        """
+        gateways = self._branches.get(condition)
+
+        if not gateways:
+            raise ProcessException(f"Branch with condition '{condition}' does not exist")
+
+        gateway_id = min(gateways, key=self._document_order)
+        gateway_position = self._positions[gateway_id]
+        return Position(
+            gateways[gateway_id],
+            gateway_position.path + [gateway_position.index, "branches"],
+        )
+
+    def element_added(self, process: list[dict], position: Position) -> None:
+        """
+        Update the index after an element was inserted at the position.
+        Args:
+            process: The updated process
+            position: The position of the new element
+        """
+        self._index_sequence(process, position.path, position.index)
+
+    def element_removed(
+        self, process: list[dict], position: Position, element: dict
+    ) -> None:
+        """
+        Update the index after the element was removed from the position.
+        Args:
+            process: The updated process
+            position: The former position of the element
+            element: The removed element
+        """
+        self._unindex_element(element)
+        self._index_sequence(process, position.path, position.index)
+
+    def element_replaced(
+        self, process: list[dict], position: Position, element: dict
+    ) -> None:
+        """
+        Update the index after the element at the position was replaced.
+        Args:
+            process: The updated process
+            position: The position of the new element
+            element: The replaced element
+        """
+        self._unindex_element(element)
+        self._index_sequence(process, position.path, position.index, position.index + 1)
+
+    def _index_sequence(
+        self,
+        process: list[dict],
+        path: list,
+        start: int,
+        stop: Optional[int] = None,
+    ) -> None:
+        """
+        Index the elements of the sequence at the path, from the start index on.
+        """
+        sequence = process
+        for path_element in path:
+            sequence = sequence[path_element]
+
+        for index in range(start, len(sequence) if stop is None else stop):
+            self._index_element(sequence[index], path, index)
+
+    def _index_element(self, element: dict, path: list, index: int) -> None:
+        self._positions[element["id"]] = Position(index, path)
+
+        if element["type"] == BPMNElementType.EXCLUSIVE_GATEWAY.value:
+            for branch_index, branch in enumerate(element["branches"]):
+                self._branches.setdefault(branch["condition"], {})[
+                    element["id"]
+                ] = branch_index
+                branch_path = path + [index, "branches", branch_index, "path"]
+                for element_index, branch_element in enumerate(branch["path"]):
+                    self._index_element(branch_element, branch_path, element_index)
+        elif element["type"] == BPMNElementType.PARALLEL_GATEWAY.value:
+            for branch_index, branch in enumerate(element["branches"]):
+                branch_path = path + [index, "branches", branch_index]
+                for element_index, branch_element in enumerate(branch):
+                    self._index_element(branch_element, branch_path, element_index)
+
+    def _unindex_element(self, element: dict) -> None:
+        self._positions.pop(element["id"], None)
+
+        if element["type"] == BPMNElementType.EXCLUSIVE_GATEWAY.value:
+            for branch in element["branches"]:
+                gateways = self._branches.get(branch["condition"], {})
+                gateways.pop(element["id"], None)
+                if not gateways:
+                    self._branches.pop(branch["condition"], None)
+                for branch_element in branch["path"]:
+                    self._unindex_element(branch_element)
+        elif element["type"] == BPMNElementType.PARALLEL_GATEWAY.value:
+            for branch in element["branches"]:
+                for branch_element in branch:
+                    self._unindex_element(branch_element)
+
+    def _document_order(self, element_id: str) -> tuple:
+        position = self._positions[element_id]
+        return tuple(position.path) + (position.index,)
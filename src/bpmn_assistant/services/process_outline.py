@@ -0,0 +1,281 @@
+import json
+import re
+from typing import Any, Iterator, Optional
+
+from bpmn_assistant.core.enums import BPMNElementType
+
+INDENT = "  "
+
+# Markers of the outline: the start of an exclusive gateway branch, of a parallel gateway
+# branch, the "next" element of a branch, and the join of an exclusive gateway
+EXCLUSIVE_BRANCH = "?"
+PARALLEL_BRANCH = "|"
+NEXT = "->"
+JOIN = "join"
+
+# The keys written positionally (the others are written as a JSON object ending the line)
+ELEMENT_KEYS = {"type", "id", "label", "has_join", "branches"}
+BRANCH_KEYS = {"condition", "path", "next"}
+
+ELEMENT_TYPES = {element_type.value for element_type in BPMNElementType}
+
+# A token of a line: its kind ("word", "string" or "object") and its value
+Token = tuple[str, Any]
+
+_BARE_WORD = re.compile(r"[^\s\"{]\S*")
+
+
+def process_to_outline(process: list[dict]) -> str:
+    """
+    Encode a process as a compact outline, for the prompts: one element per line
+    (`type id "label"`), in the order of execution, with the branches of the gateways
+    indented below them. A branch of an exclusive gateway starts with `? "condition"`
+    (`?` alone for a branch without a condition, e.g. an unnamed sequence flow, and
+    followed by `-> id` if it has a "next" element), a branch of a parallel gateway with
+    `|`, and `join` marks an exclusive gateway with a join element.
+
+    Example:
+        startEvent start1
+        userTask task1 "Review the order"
+        exclusiveGateway exclusive1 "Order approved?" join
+          ? "Yes"
+            serviceTask task2 "Ship the order"
+          ? "No" -> task1
+        endEvent end1
+
+    Args:
+        process: The process (the BPMN JSON representation)
+    Returns:
+        str: The outline (see `outline_to_process` to decode it)
+    """
+    return "\n".join(_sequence_lines(process, 0))
+
+
+def outline_to_process(outline: str) -> list[dict]:
+    """
+    Decode an outline written by `process_to_outline` (or by the LLM, in the same format).
+    Args:
+        outline: The outline
+    Returns:
+        list: The process (the BPMN JSON representation)
+    Raises:
+        ValueError: If the outline is malformed
+    """
+    lines = []
+    for number, line in enumerate(outline.splitlines(), start=1):
+        if not line.strip():
+            continue
+
+        content = line.lstrip(" ")
+        indent = len(line) - len(content)
+        if indent % len(INDENT):
+            raise ValueError(f"Line {number}: the indentation is not a multiple of 2")
+        lines.append((number, indent // len(INDENT), content.rstrip()))
+
+    return _OutlineParser(lines).parse_sequence(0)
+
+
+def _sequence_lines(sequence: list[dict], depth: int) -> Iterator[str]:
+    for element in sequence:
+        yield from _element_lines(element, depth)
+
+
+def _element_lines(element: dict, depth: int) -> Iterator[str]:
+    tokens = [element["type"], _encode_id(element["id"])]
+
+    if isinstance(element.get("label"), str):
+        tokens.append(_encode_string(element["label"]))
+
+    if element["type"] == BPMNElementType.EXCLUSIVE_GATEWAY.value:
+        if element.get("has_join"):
+            tokens.append(JOIN)
+        yield _line(depth, tokens, element, ELEMENT_KEYS)
+
+        for branch in element["branches"]:
+            branch_tokens = [EXCLUSIVE_BRANCH]
+            if isinstance(branch.get("condition"), str):
+                branch_tokens.append(_encode_string(branch["condition"]))
+            if branch.get("next") is not None:
+                branch_tokens += [NEXT, _encode_id(branch["next"])]
+            yield _line(depth + 1, branch_tokens, branch, BRANCH_KEYS)
+            yield from _sequence_lines(branch["path"], depth + 2)
+
+    elif element["type"] == BPMNElementType.PARALLEL_GATEWAY.value:
+        yield _line(depth, tokens, element, ELEMENT_KEYS)
+
+        for branch in element["branches"]:
+            yield INDENT * (depth + 1) + PARALLEL_BRANCH
+            yield from _sequence_lines(branch, depth + 2)
+
+    else:
+        yield _line(depth, tokens, element, ELEMENT_KEYS)
+
+
+def _line(depth: int, tokens: list[str], item: dict, keys: set[str]) -> str:
+    """
+    Join the tokens of a line, followed by the keys of the item that are not written
+    positionally (e.g. a label that is not a string), as a JSON object. A None condition
+    is left out (the branch line is `?` alone).
+    """
+    extra = {
+        key: value
+        for key, value in item.items()
+        if key not in keys
+        or (key == "label" and not isinstance(value, str))
+        or (key == "condition" and value is not None and not isinstance(value, str))
+    }
+    if extra:
+        tokens = tokens + [json.dumps(extra, ensure_ascii=False)]
+
+    return INDENT * depth + " ".join(tokens)
+
+
+def _encode_string(value: str) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _encode_id(element_id: str) -> str:
+    # Ids are written bare, unless they could be mistaken for another token
+    if _BARE_WORD.fullmatch(element_id) and element_id not in (NEXT, JOIN):
+        return element_id
+    return _encode_string(element_id)
+
+
+def _tokenize(content: str, number: int) -> list[Token]:
+    """
+    Split a line into its tokens: bare words, and JSON strings and objects (decoded).
+    """
+    decoder = json.JSONDecoder()
+    tokens: list[Token] = []
+    index = 0
+
+    while index < len(content):
+        if content[index].isspace():
+            index += 1
+        elif content[index] in '"{':
+            try:
+                value, index = decoder.raw_decode(content, index)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Line {number}: {e.msg}") from None
+            tokens.append(("string" if isinstance(value, str) else "object", value))
+        else:
+            word = content[index:].split(maxsplit=1)[0]
+            tokens.append(("word", word))
+            index += len(word)
+
+    return tokens
+
+
+class _OutlineParser:
+    """
+    Recursive descent over the (line number, depth, content) of the lines of an outline.
+    """
+
+    def __init__(self, lines: list[tuple[int, int, str]]):
+        self.lines = lines
+        self.position = 0
+
+    def parse_sequence(self, depth: int) -> list[dict]:
+        sequence = []
+
+        while self._next_depth() == depth:
+            number, _, content = self.lines[self.position]
+            tokens = _tokenize(content, number)
+
+            if tokens[0] in (("word", EXCLUSIVE_BRANCH), ("word", PARALLEL_BRANCH)):
+                # The end of the branch: the next one of the same gateway
+                if depth == 0:
+                    raise ValueError(f"Line {number}: a branch outside of a gateway")
+                break
+
+            self.position += 1
+            sequence.append(self._parse_element(tokens, number, depth))
+
+        next_depth = self._next_depth()
+        if next_depth is not None and next_depth > depth:
+            number = self.lines[self.position][0]
+            raise ValueError(f"Line {number}: unexpected indentation")
+
+        return sequence
+
+    def _parse_element(self, tokens: list[Token], number: int, depth: int) -> dict:
+        (kind, element_type), *tokens = tokens
+        if kind != "word" or element_type not in ELEMENT_TYPES:
+            raise ValueError(f"Line {number}: unknown element type {element_type!r}")
+        if not tokens or tokens[0][0] == "object":
+            raise ValueError(f"Line {number}: the element has no id")
+
+        element: dict[str, Any] = {"type": element_type, "id": tokens.pop(0)[1]}
+
+        if tokens and tokens[0][0] == "string":
+            element["label"] = tokens.pop(0)[1]
+
+        if element_type == BPMNElementType.EXCLUSIVE_GATEWAY.value:
+            element["has_join"] = bool(tokens) and tokens[0] == ("word", JOIN)
+            if element["has_join"]:
+                tokens.pop(0)
+            element.update(_parse_extra(tokens, number))
+            element["branches"] = self._parse_branches(
+                EXCLUSIVE_BRANCH, number, depth + 1
+            )
+        elif element_type == BPMNElementType.PARALLEL_GATEWAY.value:
+            element.update(_parse_extra(tokens, number))
+            element["branches"] = self._parse_branches(
+                PARALLEL_BRANCH, number, depth + 1
+            )
+        else:
+            element.update(_parse_extra(tokens, number))
+
+        return element
+
+    def _parse_branches(self, marker: str, gateway_number: int, depth: int) -> list:
+        branches: list = []
+
+        while self._next_depth() == depth:
+            number, _, content = self.lines[self.position]
+            tokens = _tokenize(content, number)
+            if tokens[0] != ("word", marker):
+                raise ValueError(f"Line {number}: expected a branch ({marker!r})")
+            self.position += 1
+            tokens = tokens[1:]
+
+            if marker == PARALLEL_BRANCH:
+                _parse_extra(tokens, number)
+                branches.append(self.parse_sequence(depth + 1))
+                continue
+
+            # A branch without a condition (an unnamed sequence flow) has a None condition
+            branch: dict[str, Any] = {"condition": None}
+            if tokens and tokens[0][0] == "string":
+                branch["condition"] = tokens.pop(0)[1]
+            if tokens and tokens[0] == ("word", NEXT):
+                if len(tokens) < 2 or tokens[1][0] == "object":
+                    raise ValueError(f"Line {number}: {NEXT!r} without an element id")
+                branch["next"] = tokens[1][1]
+                tokens = tokens[2:]
+            extra = _parse_extra(tokens, number)
+
+            branch["path"] = self.parse_sequence(depth + 1)
+            branch.update(extra)
+            branches.append(branch)
+
+        if not branches:
+            raise ValueError(f"Line {gateway_number}: the gateway has no branches")
+
+        return branches
+
+    def _next_depth(self) -> Optional[int]:
+        if self.position < len(self.lines):
+            return self.lines[self.position][1]
+        return None
+
+
+def _parse_extra(tokens: list[Token], number: int) -> dict:
+    """
+    Parse the end of a line: nothing, or the keys not written positionally.
+    """
+    if not tokens:
+        return {}
+    if len(tokens) > 1 or tokens[0][0] != "object":
+        raise ValueError(f"Line {number}: unexpected {tokens[0][1]!r}")
+    return tokens[0][1]
@@ -1,7 +1,4 @@
-import os
-
-from dotenv import load_dotenv
-
+from bpmn_assistant.config import settings
 from bpmn_assistant.core import LLMFacade, MessageItem
 from bpmn_assistant.core.enums import (
     AnthropicModels,
@@ -12,6 +9,22 @@ from bpmn_assistant.core.enums import (
     Provider,
 )
 
+# The provider of every supported model
+MODEL_PROVIDERS: dict[str, Provider] = {
+    **{model.value: Provider.OPENAI for model in OpenAIModels},
+    **{model.value: Provider.ANTHROPIC for model in AnthropicModels},
+    **{model.value: Provider.GOOGLE for model in GoogleModels},
+    **{model.value: Provider.FIREWORKS_AI for model in FireworksAIModels},
+}
+
+# The setting holding the API key of every provider
+API_KEY_SETTINGS: dict[Provider, str] = {
+    Provider.OPENAI: "OPENAI_API_KEY",
+    Provider.ANTHROPIC: "ANTHROPIC_API_KEY",
+    Provider.GOOGLE: "GEMINI_API_KEY",
+    Provider.FIREWORKS_AI: "FIREWORKS_AI_API_KEY",
+}
+
 
 def get_llm_facade(model: str, output_mode: OutputMode = OutputMode.JSON) -> LLMFacade:
     """
@@ -24,23 +37,13 @@ def get_llm_facade(model: str, output_mode: OutputMode = OutputMode.JSON) -> LLM
     Raises:
         Exception: If the model is invalid or if the required API key is not set
     """
-    load_dotenv(override=True)
-
-    if is_openai_model(model):
-        api_key = os.getenv("OPENAI_API_KEY")
-        provider = Provider.OPENAI
-    elif is_anthropic_model(model):
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        provider = Provider.ANTHROPIC
-    elif is_google_model(model):
-        api_key = os.getenv("GEMINI_API_KEY")
-        provider = Provider.GOOGLE
-    elif is_fireworks_ai_model(model):
-        api_key = os.getenv("FIREWORKS_AI_API_KEY")
-        provider = Provider.FIREWORKS_AI
-    else:
+    provider = MODEL_PROVIDERS.get(model)
+
+    if provider is None:
         raise Exception("Invalid model")
 
+    api_key = settings.get(API_KEY_SETTINGS[provider])
+
     if not api_key:
         raise Exception(f"API key not found for provider {provider}")
 
@@ -53,22 +56,9 @@ def get_llm_facade(model: str, output_mode: OutputMode = OutputMode.JSON) -> LLM
 
 
 def get_available_providers() -> dict:
-    load_dotenv(override=True)
-    openai_api_key = os.getenv("OPENAI_API_KEY")
-    anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
-    gemini_api_key = os.getenv("GEMINI_API_KEY")
-    fireworks_api_key = os.getenv("FIREWORKS_AI_API_KEY")
-
-    openai_present = openai_api_key is not None and len(openai_api_key) > 0
-    anthropic_present = anthropic_api_key is not None and len(anthropic_api_key) > 0
-    google_present = gemini_api_key is not None and len(gemini_api_key) > 0
-    fireworks_ai_present = fireworks_api_key is not None and len(fireworks_api_key) > 0
-
     return {
-        "openai": openai_present,
-        "anthropic": anthropic_present,
-        "google": google_present,
-        "fireworks_ai": fireworks_ai_present,
+        provider.value: bool(settings.get(setting))
+        for provider, setting in API_KEY_SETTINGS.items()
     }
 
 def replace_reasoning_model(model: str) -> str:
@@ -82,19 +72,19 @@ def replace_reasoning_model(model: str) -> str:
     return model
 
 def is_openai_model(model: str) -> bool:
-    return model in [model.value for model in OpenAIModels]
+    return MODEL_PROVIDERS.get(model) == Provider.OPENAI
 
 
 def is_anthropic_model(model: str) -> bool:
-    return model in [model.value for model in AnthropicModels]
+    return MODEL_PROVIDERS.get(model) == Provider.ANTHROPIC
 
 
 def is_google_model(model: str) -> bool:
-    return model in [model.value for model in GoogleModels]
+    return MODEL_PROVIDERS.get(model) == Provider.GOOGLE
 
 
 def is_fireworks_ai_model(model: str) -> bool:
-    return model in [model.value for model in FireworksAIModels]
+    return MODEL_PROVIDERS.get(model) == Provider.FIREWORKS_AI
 
 
 def message_history_to_string(message_history: list[MessageItem]) -> str:
@@ -0,0 +1,74 @@
+import os
+import signal
+from unittest.mock import patch
+
+import pytest
+
+from bpmn_assistant.config import Settings
+
+
+@pytest.fixture
+def env_file(tmp_path):
+    path = tmp_path / ".env"
+    path.write_text("BPMN_TEST_SETTING=first\n")
+    with patch.dict(os.environ):
+        yield path
+
+
+class TestSettings:
+
+    def test_loads_the_env_file_once(self, env_file):
+        settings = Settings(env_file, check_interval=60)
+
+        assert settings.get("BPMN_TEST_SETTING") == "first"
+        assert settings.get("BPMN_TEST_SETTING") == "first"
+        assert settings.reloads == 1
+
+    def test_reloads_when_the_env_file_changes(self, env_file):
+        settings = Settings(env_file, check_interval=0)
+        settings.get("BPMN_TEST_SETTING")
+
+        env_file.write_text("BPMN_TEST_SETTING=second\n")
+        os.utime(env_file, (0, 0))
+
+        assert settings.get("BPMN_TEST_SETTING") == "second"
+        assert settings.reloads == 2
+
+    def test_does_not_check_the_env_file_before_the_check_interval(self, env_file):
+        settings = Settings(env_file, check_interval=60)
+        settings.get("BPMN_TEST_SETTING")
+
+        env_file.write_text("BPMN_TEST_SETTING=second\n")
+        os.utime(env_file, (0, 0))
+
+        assert settings.get("BPMN_TEST_SETTING") == "first"
+
+    def test_reloads_on_request(self, env_file):
+        settings = Settings(env_file, check_interval=60)
+        settings.get("BPMN_TEST_SETTING")
+
+        env_file.write_text("BPMN_TEST_SETTING=second\n")
+        settings.request_reload()
+
+        assert settings.get("BPMN_TEST_SETTING") == "second"
+
+    @pytest.mark.skipif(not hasattr(signal, "SIGHUP"), reason="No SIGHUP")
+    def test_reloads_on_sighup(self, env_file):
+        settings = Settings(env_file, check_interval=60)
+        settings.get("BPMN_TEST_SETTING")
+        previous_handler = signal.getsignal(signal.SIGHUP)
+
+        try:
+            assert settings.install_reload_signal_handler()
+            env_file.write_text("BPMN_TEST_SETTING=second\n")
+            os.kill(os.getpid(), signal.SIGHUP)
+
+            assert settings.get("BPMN_TEST_SETTING") == "second"
+        finally:
+            signal.signal(signal.SIGHUP, previous_handler)
+
+    def test_returns_the_default_for_missing_settings(self, env_file):
+        settings = Settings(env_file)
+
+        assert settings.get("BPMN_TEST_MISSING") is None
+        assert settings.get("BPMN_TEST_MISSING", "default") == "default"
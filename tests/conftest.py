@@ -303,6 +303,42 @@ def pg_inside_eg_process():
     ]
 
 
+@pytest.fixture
+def eg_next_process():
+    """
+    Description: A process with an exclusive gateway whose first branch loops back to
+    an earlier task with 'next', and whose empty second branch continues the process.
+    """
+    return [
+        {"type": "startEvent", "id": "start1"},
+        {"type": "task", "id": "task1", "label": "Prepare the order"},
+        {
+            "type": "exclusiveGateway",
+            "id": "exclusive1",
+            "label": "Order complete?",
+            "branches": [
+                {
+                    "condition": "No",
+                    "path": [
+                        {
+                            "type": "task",
+                            "id": "task2",
+                            "label": "Add the missing items",
+                        },
+                    ],
+                    "next": "task1",
+                },
+                {
+                    "condition": "Yes",
+                    "path": [],
+                },
+            ],
+        },
+        {"type": "task", "id": "task3", "label": "Ship the order"},
+        {"type": "endEvent", "id": "end1"},
+    ]
+
+
 def dict_to_message_item(message_dict):
     return MessageItem(**message_dict)
 
@@ -574,6 +610,22 @@ def bpmn_xml_eg_empty_path():
     return load_bpmn("eg_empty_path.bpmn")
 
 
+@pytest.fixture
+def bpmn_xml_eg_unnamed_flow():
+    """
+    Description: A BPMN XML string that represents a process with an exclusive gateway that has an unnamed outgoing flow.
+    """
+    return load_bpmn("eg_unnamed_flow.bpmn")
+
+
+@pytest.fixture
+def bpmn_xml_eg_loop_into_branch():
+    """
+    Description: A BPMN XML string that represents a process with a loop that jumps back into the middle of a branch of an exclusive gateway with a join.
+    """
+    return load_bpmn("eg_loop_into_branch.bpmn")
+
+
 @pytest.fixture
 def labeled_events_process():
     """
@@ -602,3 +654,38 @@ def labeled_events_process():
 def bpmn_xml_labeled_events():
     """Description: BPMN XML with labeled start and end events."""
     return load_bpmn("labeled_events.bpmn")
+
+
+@pytest.fixture
+def bpmn_xml_long_linear_process():
+    """
+    Description: A BPMN XML string that represents a linear process with 50,000 elements
+    (a start event, 49,998 tasks and an end event).
+    """
+    ids = ["start"] + [f"task{i}" for i in range(1, 49_999)] + ["end"]
+
+    elements = ['<startEvent id="start" />']
+    elements += [f'<task id="{task_id}" name="Task {task_id}" />' for task_id in ids[1:-1]]
+    elements.append('<endEvent id="end" />')
+
+    flows = [
+        f'<sequenceFlow id="{source}-{target}" sourceRef="{source}" targetRef="{target}" />'
+        for source, target in zip(ids, ids[1:])
+    ]
+
+    return (
+        '<definitions xmlns="http://www.omg.org/spec/BPMN/20100524/MODEL" id="definitions_1">'
+        '<process id="Process_1" isExecutable="false">'
+        + "".join(elements)
+        + "".join(flows)
+        + "</process></definitions>"
+    )
+
+
+@pytest.fixture
+def bpmn_xml_collaboration():
+    """
+    Description: A BPMN XML string that represents a collaboration of three participants:
+    a linear process, a process with an exclusive gateway and an empty (black-box) process.
+    """
+    return load_bpmn("collaboration.bpmn")
@@ -0,0 +1,148 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+from anthropic.types import Message
+
+from bpmn_assistant.core import CacheablePrompt, LLMClientRegistry
+from bpmn_assistant.core.enums import OutputMode, Provider
+from bpmn_assistant.core.provider_impl import AnthropicProvider
+
+MODEL = "claude-3-5-haiku-20241022"
+
+
+def make_message(text: str, usage: dict) -> Message:
+    return Message.model_validate(
+        {
+            "id": "msg_1",
+            "type": "message",
+            "role": "assistant",
+            "model": MODEL,
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": usage,
+        }
+    )
+
+
+def make_provider(client: Mock) -> AnthropicProvider:
+    registry = LLMClientRegistry()
+    registry.get_client(Provider.ANTHROPIC, "key", lambda: client)
+    return AnthropicProvider("key", OutputMode.JSON, client_registry=registry)
+
+
+class TestAnthropicProviderPromptCaching:
+
+    def test_marks_the_static_prefix_as_cacheable(self):
+        client = Mock()
+        client.messages.create.return_value = make_message(
+            '"stop": true}', {"input_tokens": 10, "output_tokens": 5}
+        )
+        provider = make_provider(client)
+        messages = provider.get_initial_messages()
+
+        provider.call(MODEL, CacheablePrompt("Instructions", "Process"), messages, 100, 0)
+
+        api_messages = client.messages.create.call_args.kwargs["messages"]
+        assert api_messages[0]["content"] == [
+            {
+                "type": "text",
+                "text": "Instructions",
+                "cache_control": {"type": "ephemeral"},
+            },
+            {"type": "text", "text": "Process"},
+        ]
+        assert api_messages[1] == {"role": "assistant", "content": "{"}
+        # The stored message history is left as is
+        assert messages[0] == {"role": "user", "content": "Instructions" + "Process"}
+
+    def test_marks_the_last_user_message_of_a_conversation_as_cacheable(self):
+        messages = [
+            {"role": "user", "content": CacheablePrompt("Instructions", "Process")},
+            {"role": "assistant", "content": '{"function": "delete_element"}'},
+            {"role": "user", "content": "Updated process"},
+            {"role": "assistant", "content": "{"},
+        ]
+
+        api_messages = AnthropicProvider._with_cache_breakpoints(messages)
+
+        assert api_messages[1] == messages[1]
+        assert api_messages[2]["content"] == [
+            {
+                "type": "text",
+                "text": "Updated process",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        assert api_messages[3] == messages[3]
+        cache_breakpoints = str(api_messages).count("cache_control")
+        assert cache_breakpoints == 2
+
+    def test_records_the_cached_and_uncached_input_tokens(self):
+        client = Mock()
+        client.messages.create.return_value = make_message(
+            '"stop": true}',
+            {
+                "input_tokens": 200,
+                "cache_read_input_tokens": 3000,
+                "cache_creation_input_tokens": 0,
+                "output_tokens": 5,
+            },
+        )
+        provider = make_provider(client)
+
+        provider.call(MODEL, "Prompt", provider.get_initial_messages(), 100, 0)
+
+        [usage] = provider.usage
+        assert usage.input_tokens == 200
+        assert usage.cache_read_input_tokens == 3000
+        assert usage.total_input_tokens == 3200
+        assert usage.output_tokens == 5
+
+
+class TestAnthropicProviderStreaming:
+
+    USAGE = {
+        "input_tokens": 120,
+        "cache_read_input_tokens": 0,
+        "cache_creation_input_tokens": 0,
+        "output_tokens": 8,
+    }
+
+    def test_stream_records_the_usage(self):
+        stream = Mock(text_stream=iter(["Hello", " world"]))
+        stream.get_final_message.return_value = make_message("Hello world", self.USAGE)
+        client = MagicMock()
+        client.messages.stream.return_value.__enter__.return_value = stream
+        provider = make_provider(client)
+
+        chunks = list(provider.stream(MODEL, "Prompt", [], 100, 0))
+
+        assert chunks == ["Hello", " world"]
+        [usage] = provider.usage
+        assert usage.input_tokens == 120
+        assert usage.output_tokens == 8
+
+    def test_stream_async_records_the_usage(self):
+        async def text_stream():
+            for text in ["Hello", " world"]:
+                yield text
+
+        stream = Mock(text_stream=text_stream())
+        stream.get_final_message = AsyncMock(
+            return_value=make_message("Hello world", self.USAGE)
+        )
+        client = MagicMock()
+        client.messages.stream.return_value.__aenter__.return_value = stream
+        registry = LLMClientRegistry()
+        provider = AnthropicProvider("key", OutputMode.TEXT, client_registry=registry)
+
+        async def consume() -> list[str]:
+            registry.get_async_client(Provider.ANTHROPIC, "key", lambda: client)
+            chunks = provider.stream_async(MODEL, "Prompt", [], 100, 0)
+            return [text async for text in chunks]
+
+        assert asyncio.run(consume()) == ["Hello", " world"]
+        [usage] = provider.usage
+        assert usage.total_input_tokens == 120
+        assert usage.output_tokens == 8
@@ -0,0 +1,104 @@
+import time
+
+from bpmn_assistant.core import LRUCache, SQLiteCache
+
+
+class TestLRUCache:
+
+    def test_get_and_set(self):
+        cache = LRUCache(max_size=2)
+
+        assert cache.get("a") is None
+        cache.set("a", "1")
+
+        assert cache.get("a") == "1"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(max_size=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")  # "b" is now the least recently used entry
+        cache.set("c", "3")
+
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert cache.get("c") == "3"
+        assert len(cache) == 2
+
+    def test_ttl(self):
+        cache = LRUCache(max_size=2, ttl=0.05)
+        cache.set("a", "1")
+
+        assert cache.get("a") == "1"
+        time.sleep(0.1)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_disabled(self):
+        cache = LRUCache(max_size=0)
+        cache.set("a", "1")
+
+        assert cache.get("a") is None
+
+    def test_persistence(self, tmp_path):
+        cache = LRUCache(max_size=2, persist_dir=tmp_path)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.set("c", "3")
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["b", "c"]
+
+        reloaded_cache = LRUCache(max_size=2, persist_dir=tmp_path)
+
+        assert reloaded_cache.get("b") == "2"
+        assert reloaded_cache.get("c") == "3"
+
+        reloaded_cache.clear()
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestSQLiteCache:
+
+    def test_get_and_set(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.sqlite3", max_size=2)
+
+        assert cache.get("a") is None
+        cache.set("a", "1")
+
+        assert cache.get("a") == "1"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.sqlite3", max_size=2)
+        cache.set("a", "1")
+        time.sleep(0.01)
+        cache.set("b", "2")
+        time.sleep(0.01)
+        cache.get("a")  # "b" is now the least recently used entry
+        time.sleep(0.01)
+        cache.set("c", "3")
+
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert cache.get("c") == "3"
+        assert len(cache) == 2
+
+    def test_ttl(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.sqlite3", ttl=0.05)
+        cache.set("a", "1")
+
+        assert cache.get("a") == "1"
+        time.sleep(0.1)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_survives_restarts(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.sqlite3")
+        cache.set("a", "1")
+        cache.close()
+
+        assert SQLiteCache(tmp_path / "cache.sqlite3").get("a") == "1"
@@ -0,0 +1,78 @@
+import asyncio
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from bpmn_assistant.core.enums import OutputMode
+from bpmn_assistant.core.provider_impl import LiteLLMProvider
+
+MODEL = "gpt-4o-mini"
+API_KEYS = [f"key-{i}" for i in range(8)]
+
+
+def echo_api_key_response(api_key: str) -> SimpleNamespace:
+    message = SimpleNamespace(content=f'{{"api_key": "{api_key}"}}')
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def fake_completion(**params) -> SimpleNamespace:
+    # Give the other threads time to run in the middle of the call
+    time.sleep(random.uniform(0, 0.005))
+    return echo_api_key_response(params["api_key"])
+
+
+async def fake_acompletion(**params) -> SimpleNamespace:
+    await asyncio.sleep(random.uniform(0, 0.005))
+    return echo_api_key_response(params["api_key"])
+
+
+class TestLiteLLMProviderCredentials:
+
+    def test_does_not_write_the_api_key_to_the_environment(self):
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "env-key"}):
+            LiteLLMProvider("key-1", OutputMode.JSON)
+
+            assert os.environ["OPENAI_API_KEY"] == "env-key"
+
+    def test_concurrent_calls_in_threads_use_their_own_api_key(self):
+        providers = [LiteLLMProvider(api_key, OutputMode.JSON) for api_key in API_KEYS]
+
+        def call(index: int) -> tuple[str, dict]:
+            provider = providers[index % len(providers)]
+            response = provider.call(MODEL, "Hello", [], 10, 0.3)
+            return provider.api_key, response
+
+        with patch(
+            "bpmn_assistant.core.provider_impl.litellm_provider.completion",
+            side_effect=fake_completion,
+        ):
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                results = list(executor.map(call, range(400)))
+
+        assert len(results) == 400
+        for api_key, response in results:
+            assert response == {"api_key": api_key}
+
+    def test_concurrent_async_calls_use_their_own_api_key(self):
+        providers = [LiteLLMProvider(api_key, OutputMode.JSON) for api_key in API_KEYS]
+
+        async def call(index: int) -> tuple[str, dict]:
+            provider = providers[index % len(providers)]
+            response = await provider.call_async(MODEL, "Hello", [], 10, 0.3)
+            return provider.api_key, response
+
+        async def call_all() -> list[tuple[str, dict]]:
+            return await asyncio.gather(*(call(i) for i in range(400)))
+
+        with patch(
+            "bpmn_assistant.core.provider_impl.litellm_provider.acompletion",
+            side_effect=fake_acompletion,
+        ):
+            results = asyncio.run(call_all())
+
+        assert len(results) == 400
+        for api_key, response in results:
+            assert response == {"api_key": api_key}
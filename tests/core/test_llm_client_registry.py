@@ -0,0 +1,71 @@
+import asyncio
+
+from bpmn_assistant.core import LLMClientRegistry, LLMFacade
+from bpmn_assistant.core.enums import OutputMode, Provider
+
+MODEL = "claude-3-5-haiku-20241022"
+
+
+def make_facade(
+    registry: LLMClientRegistry,
+    api_key: str = "key-1",
+    output_mode: OutputMode = OutputMode.JSON,
+) -> LLMFacade:
+    return LLMFacade(
+        Provider.ANTHROPIC, api_key, MODEL, output_mode, client_registry=registry
+    )
+
+
+class TestLLMClientRegistry:
+
+    def test_creates_one_client_per_provider_and_api_key(self):
+        registry = LLMClientRegistry()
+
+        first = registry.get_client(Provider.ANTHROPIC, "key-1", object)
+        second = registry.get_client(Provider.ANTHROPIC, "key-1", object)
+        other_key = registry.get_client(Provider.ANTHROPIC, "key-2", object)
+        other_provider = registry.get_client(Provider.OPENAI, "key-1", object)
+
+        assert first is second
+        assert len({id(first), id(other_key), id(other_provider)}) == 3
+        assert registry.stats() == {
+            "clients": 3,
+            "async_clients": 0,
+            "created": 3,
+            "reused": 1,
+        }
+
+    def test_async_clients_are_per_event_loop(self):
+        registry = LLMClientRegistry()
+
+        async def get_twice():
+            first = registry.get_async_client(Provider.ANTHROPIC, "key-1", object)
+            second = registry.get_async_client(Provider.ANTHROPIC, "key-1", object)
+            assert first is second
+            return first
+
+        # asyncio.run creates a new event loop every time
+        assert asyncio.run(get_twice()) is not asyncio.run(get_twice())
+
+    def test_facades_share_clients_but_not_messages(self):
+        registry = LLMClientRegistry()
+
+        json_facade = make_facade(registry)
+        text_facade = make_facade(registry, output_mode=OutputMode.TEXT)
+        other_key_facade = make_facade(registry, api_key="key-2")
+
+        assert json_facade.provider.client is text_facade.provider.client
+        assert json_facade.provider.client is not other_key_facade.provider.client
+
+        json_facade.messages.append({"role": "user", "content": "Hello"})
+        assert text_facade.messages == []
+
+    def test_close_forgets_the_clients(self):
+        registry = LLMClientRegistry()
+        llm_facade = make_facade(registry)
+        client = llm_facade.provider.client
+
+        registry.close()
+
+        assert registry.stats()["clients"] == 0
+        assert llm_facade.provider.client is not client
@@ -0,0 +1,78 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from bpmn_assistant.core import (
+    LLMConversation,
+    LLMFacade,
+    run_conversation,
+    run_conversation_async,
+)
+
+
+def retrying_conversation(max_retries: int) -> LLMConversation[dict]:
+    prompt = "Answer"
+    for _ in range(max_retries):
+        try:
+            response = yield dict(prompt=prompt, max_tokens=10)
+            if "answer" not in response:
+                raise ValueError("Missing answer")
+            return response
+        except Exception as e:
+            prompt = f"Error: {e}. Try again."
+    raise Exception("Maximum number of retries reached")
+
+
+class TestRunConversation:
+
+    def test_sends_the_responses_back_to_the_conversation(self):
+        llm_facade = Mock(LLMFacade)
+        llm_facade.call.side_effect = [{"wrong": 1}, {"answer": 42}]
+
+        result = run_conversation(llm_facade, retrying_conversation(3))
+
+        assert result == {"answer": 42}
+        assert llm_facade.call.call_count == 2
+        assert llm_facade.call.call_args_list[1].kwargs == {
+            "prompt": "Error: Missing answer. Try again.",
+            "max_tokens": 10,
+        }
+
+    def test_throws_the_call_errors_into_the_conversation(self):
+        llm_facade = Mock(LLMFacade)
+        llm_facade.call.side_effect = [RuntimeError("Timeout"), {"answer": 42}]
+
+        result = run_conversation(llm_facade, retrying_conversation(3))
+
+        assert result == {"answer": 42}
+        assert llm_facade.call.call_args_list[1].kwargs["prompt"] == (
+            "Error: Timeout. Try again."
+        )
+
+    def test_raises_the_conversation_error(self):
+        llm_facade = Mock(LLMFacade)
+        llm_facade.call.return_value = {"wrong": 1}
+
+        with pytest.raises(Exception) as e:
+            run_conversation(llm_facade, retrying_conversation(3))
+
+        assert "Maximum number of retries reached" in str(e.value)
+        assert llm_facade.call.call_count == 3
+
+
+class TestRunConversationAsync:
+
+    def test_awaits_the_async_calls(self):
+        llm_facade = Mock(LLMFacade)
+        llm_facade.call_async = AsyncMock(
+            side_effect=[RuntimeError("Timeout"), {"wrong": 1}, {"answer": 42}]
+        )
+
+        result = asyncio.run(
+            run_conversation_async(llm_facade, retrying_conversation(3))
+        )
+
+        assert result == {"answer": 42}
+        assert llm_facade.call_async.await_count == 3
+        llm_facade.call.assert_not_called()
@@ -0,0 +1,38 @@
+from bpmn_assistant.core import LLMUsage, LLMUsageTracker
+
+
+def make_usage(input_tokens: int, cache_read_input_tokens: int) -> LLMUsage:
+    return LLMUsage(
+        model="claude-3-5-haiku-20241022",
+        input_tokens=input_tokens,
+        cache_read_input_tokens=cache_read_input_tokens,
+        cache_creation_input_tokens=0,
+        output_tokens=10,
+        latency=1.0,
+    )
+
+
+class TestLLMUsageTracker:
+
+    def test_stats(self):
+        tracker = LLMUsageTracker()
+
+        tracker.record(make_usage(1000, 0))
+        tracker.record(make_usage(100, 900))
+
+        stats = tracker.stats()
+        assert stats["calls"] == 2
+        assert stats["input_tokens"] == 1100
+        assert stats["cache_read_input_tokens"] == 900
+        assert stats["output_tokens"] == 20
+        assert stats["cache_hit_rate"] == 0.45
+        assert stats["average_latency"] == 1.0
+
+    def test_reset(self):
+        tracker = LLMUsageTracker()
+        tracker.record(make_usage(1000, 0))
+
+        tracker.reset()
+
+        assert tracker.stats()["calls"] == 0
+        assert tracker.stats()["cache_hit_rate"] == 0.0
@@ -0,0 +1,114 @@
+import asyncio
+import os
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from bpmn_assistant.core import (
+    LLMConversation,
+    LLMFacade,
+    LRUCache,
+    ResponseCache,
+    SQLiteCache,
+    run_conversation,
+    run_conversation_async,
+)
+from bpmn_assistant.core.enums import OutputMode
+
+
+def intent_conversation(prompt: str) -> LLMConversation[dict]:
+    for _ in range(2):
+        try:
+            response = yield dict(prompt=prompt, max_tokens=20, temperature=0.3)
+            if response.get("intent") not in ["modify", "talk"]:
+                raise ValueError("Invalid intent")
+            return response
+        except Exception as e:
+            prompt = f"Error: {e}. Try again."
+    raise Exception("Maximum number of retries reached")
+
+
+def make_llm_facade(*responses) -> Mock:
+    llm_facade = Mock(LLMFacade)
+    llm_facade.model = "gpt-4o-mini"
+    llm_facade.output_mode = OutputMode.JSON
+    llm_facade.call.side_effect = list(responses)
+    llm_facade.call_async = AsyncMock(side_effect=list(responses))
+    return llm_facade
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def response_cache(request, tmp_path):
+    if request.param == "sqlite":
+        return ResponseCache(SQLiteCache(tmp_path / "responses.sqlite3"))
+    return ResponseCache(LRUCache())
+
+
+class TestResponseCache:
+
+    def test_serves_repeated_conversations_from_the_cache(self, response_cache):
+        llm_facade = make_llm_facade({"intent": "modify"})
+
+        first = run_conversation(
+            llm_facade, intent_conversation("User: Add a task"), response_cache
+        )
+        second = run_conversation(
+            llm_facade, intent_conversation("User: Add a task\n"), response_cache
+        )
+
+        assert first == second == {"intent": "modify"}
+        assert llm_facade.call.call_count == 1
+        stats = response_cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+        assert stats["latency_saved"] > 0
+
+    def test_keys_on_the_prompt_and_the_model(self, response_cache):
+        llm_facade = make_llm_facade({"intent": "modify"}, {"intent": "talk"})
+
+        run_conversation(llm_facade, intent_conversation("User: A"), response_cache)
+        llm_facade.model = "gpt-4o"
+        run_conversation(llm_facade, intent_conversation("User: A"), response_cache)
+
+        assert llm_facade.call.call_count == 2
+
+    def test_caches_only_completed_conversations(self, response_cache):
+        llm_facade = make_llm_facade(
+            {"intent": "?"}, {"intent": "?"}, {"intent": "talk"}
+        )
+
+        with pytest.raises(Exception):
+            run_conversation(llm_facade, intent_conversation("User: Hi"), response_cache)
+        result = run_conversation(
+            llm_facade, intent_conversation("User: Hi"), response_cache
+        )
+
+        assert result == {"intent": "talk"}
+        assert response_cache.stats()["size"] == 1
+
+    def test_async_conversations_use_the_cache(self, response_cache):
+        llm_facade = make_llm_facade({"intent": "talk"})
+
+        async def run_twice():
+            for _ in range(2):
+                result = await run_conversation_async(
+                    llm_facade, intent_conversation("User: Hi"), response_cache
+                )
+            return result
+
+        assert asyncio.run(run_twice()) == {"intent": "talk"}
+        assert llm_facade.call_async.await_count == 1
+
+    def test_endpoints_opt_in(self):
+        with patch.dict(
+            os.environ,
+            {
+                "RESPONSE_CACHE_ENDPOINTS": "determine_intent",
+                "RESPONSE_CACHE_BACKEND": "memory",
+            },
+        ):
+            response_cache = ResponseCache.from_env()
+
+        assert response_cache.for_endpoint("determine_intent") is response_cache
+        assert response_cache.for_endpoint("define_change_request") is None
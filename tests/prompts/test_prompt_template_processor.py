@@ -0,0 +1,48 @@
+import pickle
+
+from bpmn_assistant.core import CacheablePrompt
+from bpmn_assistant.prompts import PromptTemplateProcessor
+
+
+class TestPromptTemplateProcessor:
+
+    def test_templates_with_a_static_prefix_render_cacheable_prompts(self):
+        processor = PromptTemplateProcessor()
+
+        first = processor.render_template(
+            "edit_bpmn.jinja2", process="[]", change_request="Add a task"
+        )
+        second = processor.render_template(
+            "edit_bpmn.jinja2", process="[{}]", change_request="Delete a task"
+        )
+
+        assert isinstance(first, CacheablePrompt)
+        assert first.prefix == second.prefix
+        assert first.suffix.startswith("---")
+        assert "Add a task" in first.suffix
+        assert "\x00" not in first
+
+    def test_templates_without_a_static_prefix_render_strings(self):
+        processor = PromptTemplateProcessor()
+
+        prompt = processor.render_template(
+            "determine_intent.jinja2", message_history="User: Hello"
+        )
+
+        assert not isinstance(prompt, CacheablePrompt)
+
+
+class TestCacheablePrompt:
+
+    def test_is_the_concatenation_of_the_prefix_and_the_suffix(self):
+        prompt = CacheablePrompt("Static instructions. ", "Dynamic part.")
+
+        assert prompt == "Static instructions. Dynamic part."
+        assert prompt.prefix == "Static instructions. "
+        assert prompt.suffix == "Dynamic part."
+
+    def test_survives_pickling(self):
+        prompt = pickle.loads(pickle.dumps(CacheablePrompt("Static. ", "Dynamic.")))
+
+        assert isinstance(prompt, CacheablePrompt)
+        assert prompt.prefix == "Static. "
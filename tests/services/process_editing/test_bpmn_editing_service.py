@@ -0,0 +1,240 @@
+from copy import deepcopy
+from unittest.mock import Mock
+
+import pytest
+
+from bpmn_assistant.core import LLMFacade
+from bpmn_assistant.core.exceptions import ElementNotFoundException, LLMCallError
+from bpmn_assistant.services.process_editing import BpmnEditingService
+
+
+def add_task(task_id: str, after_id: str) -> dict:
+    return {
+        "function": "add_element",
+        "arguments": {
+            "element": {"type": "userTask", "id": task_id, "label": "Approve"},
+            "after_id": after_id,
+        },
+    }
+
+
+def ids(process: list[dict]) -> list[str]:
+    return [element["id"] for element in process]
+
+
+class TestBatchedEditProposals:
+
+    def test_applies_the_operations_in_one_call(self, linear_process):
+        llm_facade = Mock(LLMFacade, usage=[])
+        llm_facade.call.side_effect = [
+            {
+                "operations": [
+                    add_task("approval1", "task3"),
+                    add_task("approval2", "approval1"),
+                    add_task("approval3", "approval2"),
+                ]
+            },
+            {"stop": True},
+        ]
+        service = BpmnEditingService(llm_facade, linear_process, "Add three approvals")
+
+        process = service.edit_bpmn()
+
+        assert ids(process)[3:7] == ["task3", "approval1", "approval2", "approval3"]
+        assert llm_facade.call.call_count == 2
+
+    def test_batch_is_applied_atomically(self, linear_process):
+        original_process = deepcopy(linear_process)
+        service = BpmnEditingService(Mock(LLMFacade, usage=[]), linear_process, "")
+        batch = {
+            "operations": [
+                add_task("approval1", "task3"),
+                {"function": "delete_element", "arguments": {"element_id": "missing"}},
+            ]
+        }
+
+        with pytest.raises(ElementNotFoundException) as e:
+            service.edit_log.apply(batch)
+
+        assert "Operation 2 of 2 (delete_element) failed" in str(e.value)
+        assert linear_process == original_process
+        assert service.edit_log.process is linear_process
+        assert service.edit_log.entries == []
+
+    def test_rejected_batch_is_retried(self, linear_process):
+        llm_facade = Mock(LLMFacade, usage=[])
+        llm_facade.call.side_effect = [
+            {
+                "operations": [
+                    add_task("approval1", "task3"),
+                    add_task("approval2", "missing"),
+                ]
+            },
+            {"operations": [add_task("approval1", "task3")]},
+            {"stop": True},
+        ]
+        service = BpmnEditingService(llm_facade, linear_process, "Add an approval")
+
+        process = service.edit_bpmn()
+
+        assert "approval1" in ids(process)
+        assert "approval2" not in ids(process)
+        retry_prompt = llm_facade.call.call_args_list[1].kwargs["prompt"]
+        assert "None of the operations were applied" in retry_prompt
+
+    @pytest.mark.parametrize(
+        "edit_proposal, message",
+        [
+            ({"operations": []}, "non-empty list"),
+            (
+                {"operations": [add_task("a", "task1")], "function": "add_element"},
+                "no other key",
+            ),
+            (
+                {"operations": [add_task("a", "task1"), {"function": "rename"}]},
+                "Invalid operation 2",
+            ),
+        ],
+    )
+    def test_invalid_batches_are_rejected(self, linear_process, edit_proposal, message):
+        service = BpmnEditingService(Mock(LLMFacade, usage=[]), linear_process, "")
+
+        with pytest.raises(ValueError, match=message):
+            service._validate_edit_proposal(edit_proposal)
+
+
+class TestElementOutlines:
+
+    def test_accepts_an_element_given_as_an_outline(self, linear_process):
+        llm_facade = Mock(LLMFacade, usage=[])
+        llm_facade.call.side_effect = [
+            {
+                "function": "add_element",
+                "arguments": {
+                    "element": "\n".join(
+                        [
+                            'exclusiveGateway exclusive1 "Approved?"',
+                            '  ? "Yes"',
+                            '  ? "No"',
+                            "    endEvent end2",
+                        ]
+                    ),
+                    "after_id": "task3",
+                },
+            },
+            {"stop": True},
+        ]
+        service = BpmnEditingService(llm_facade, linear_process, "Add an approval")
+
+        process = service.edit_bpmn()
+
+        assert process[4] == {
+            "type": "exclusiveGateway",
+            "id": "exclusive1",
+            "label": "Approved?",
+            "has_join": False,
+            "branches": [
+                {"condition": "Yes", "path": []},
+                {"condition": "No", "path": [{"type": "endEvent", "id": "end2"}]},
+            ],
+        }
+        # The log keeps the decoded element
+        [entry] = service.edit_log.entries
+        assert entry.edit_proposal["arguments"]["element"] == process[4]
+
+    @pytest.mark.parametrize(
+        "outline, message",
+        [
+            (
+                'task task5 "A"\ntask task6 "B"',
+                r"exactly one element \(with its branches\), not 2",
+            ),
+            ('task task5 "A', "Line 1: Unterminated string"),
+        ],
+    )
+    def test_rejects_invalid_element_outlines(self, linear_process, outline, message):
+        service = BpmnEditingService(Mock(LLMFacade, usage=[]), linear_process, "")
+        edit_proposal = {
+            "function": "update_element",
+            "arguments": {"new_element": outline},
+        }
+
+        with pytest.raises(ValueError, match=message):
+            service._validate_edit_proposal(edit_proposal)
+
+
+class TestResumeEditing:
+
+    def test_resumes_from_the_edits_applied_before_a_failure(self, linear_process):
+        llm_facade = Mock(LLMFacade, usage=[])
+        llm_facade.call.side_effect = [
+            add_task("approval1", "task3"),
+            TimeoutError("Request timed out"),
+        ]
+        service = BpmnEditingService(llm_facade, linear_process, "Add two approvals")
+
+        with pytest.raises(LLMCallError, match="Request timed out"):
+            service.edit_bpmn()
+
+        assert len(service.edit_log.entries) == 1
+
+        llm_facade.call.reset_mock()
+        llm_facade.call.side_effect = [
+            add_task("approval2", "approval1"),
+            {"stop": True},
+        ]
+
+        process = service.edit_bpmn()
+
+        assert ids(process)[3:6] == ["task3", "approval1", "approval2"]
+        # The initial edit is not requested again
+        assert llm_facade.call.call_count == 2
+        first_prompt = llm_facade.call.call_args_list[0].kwargs["prompt"]
+        assert "approval1" in first_prompt
+
+    def test_retries_an_invalid_response_without_interrupting(self, linear_process):
+        llm_facade = Mock(LLMFacade, usage=[])
+        llm_facade.call.side_effect = [
+            add_task("approval1", "task3"),
+            ValueError("Invalid JSON response from Anthropic: []"),
+            {"stop": True},
+        ]
+        service = BpmnEditingService(llm_facade, linear_process, "Add an approval")
+
+        process = service.edit_bpmn()
+
+        assert "approval1" in ids(process)
+        assert llm_facade.call.call_count == 3
+
+
+class TestDiffPrompts:
+
+    def run_session(self, process, steps, diff_checkpoint_interval):
+        llm_facade = Mock(LLMFacade, usage=[])
+        llm_facade.call.side_effect = [
+            add_task(f"approval{i}", "task3" if i == 0 else f"approval{i - 1}")
+            for i in range(steps)
+        ] + [{"stop": True}]
+        service = BpmnEditingService(
+            llm_facade, process, "Add approvals", diff_checkpoint_interval
+        )
+        result = service.edit_bpmn()
+        prompts = [call.kwargs["prompt"] for call in llm_facade.call.call_args_list]
+        return result, prompts[1:]  # The prompts of the intermediate steps
+
+    def test_sends_the_full_process_by_default(self, linear_process):
+        _, prompts = self.run_session(linear_process, 3, None)
+
+        assert all(prompt.startswith("Updated process:") for prompt in prompts)
+
+    def test_sends_the_changes_with_periodic_checkpoints(self, linear_process):
+        result, prompts = self.run_session(linear_process, 5, 2)
+
+        kinds = [
+            "diff" if prompt.startswith("Changes to the process") else "full"
+            for prompt in prompts
+        ]
+        assert kinds == ["diff", "diff", "full", "diff", "diff"]
+        assert "- Added userTask approval1 " in prompts[1]
+        assert "task1 " not in prompts[1]
+        assert "approval4" in prompts[-1]
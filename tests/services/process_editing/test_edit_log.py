@@ -0,0 +1,56 @@
+import pytest
+
+from bpmn_assistant.core.exceptions import ElementNotFoundException
+from bpmn_assistant.services.process_editing import EditLog
+
+
+def add_task(task_id: str, after_id: str) -> dict:
+    return {
+        "function": "add_element",
+        "arguments": {
+            "element": {"type": "task", "id": task_id, "label": "New task"},
+            "after_id": after_id,
+        },
+    }
+
+
+def delete(element_id: str) -> dict:
+    return {"function": "delete_element", "arguments": {"element_id": element_id}}
+
+
+def ids(process: list[dict]) -> list[str]:
+    return [element["id"] for element in process]
+
+
+class TestEditLog:
+    def test_apply_logs_the_edits(self, linear_process):
+        edit_log = EditLog(linear_process)
+
+        first = edit_log.apply(add_task("new1", "task1"))
+        second = edit_log.apply(delete("task2"))
+
+        assert edit_log.process is second
+        assert [entry.process for entry in edit_log.entries] == [first, second]
+        assert ids(second) == [
+            "start1",
+            "task1",
+            "new1",
+            "task3",
+            "task4",
+            "task5",
+            "end1",
+        ]
+        # The versions share the unchanged elements
+        assert second[1] is first[1] is linear_process[1]
+
+    def test_failed_edit_leaves_the_log_unchanged(self, linear_process):
+        edit_log = EditLog(linear_process)
+        first = edit_log.apply(add_task("new1", "task1"))
+
+        with pytest.raises(ElementNotFoundException):
+            edit_log.apply({"operations": [delete("task2"), delete("missing")]})
+
+        assert edit_log.process is first
+        assert len(edit_log.entries) == 1
+        # The next edits see the process without the failed batch
+        assert "task2" in ids(edit_log.apply(delete("task3")))
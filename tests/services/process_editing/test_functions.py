@@ -1,6 +1,10 @@
+from copy import deepcopy
+from unittest.mock import patch
+
 import pytest
 
 from bpmn_assistant.services.process_editing import (
+    ProcessIndex,
     delete_element,
     redirect_branch,
     add_element,
@@ -97,3 +101,59 @@ class TestProcessEditingFunctions:
         with pytest.raises(Exception) as e:
             update_element(order_process, new_element)
         assert str(e.value) == "Cannot update a gateway element"
+
+    def test_edit_uses_an_empty_shared_index(self):
+        # An empty index is falsy, but it is still the index to keep up to date
+        process = [{"type": "startEvent", "id": "start1"}]
+        process_index = ProcessIndex(process)
+        delete_element(process, "start1", process_index)
+        assert len(process_index) == 0
+
+        with patch(
+            "bpmn_assistant.services.process_editing.functions.ProcessIndex"
+        ) as index_class:
+            with pytest.raises(Exception) as e:
+                delete_element([], "start1", process_index)
+
+        index_class.assert_not_called()
+        assert "start1" in str(e.value)
+
+
+class TestStructuralSharing:
+    @pytest.mark.parametrize(
+        "edit",
+        [
+            lambda process: delete_element(process, "task4"),
+            lambda process: redirect_branch(process, "Payment fails", "task3"),
+            lambda process: add_element(
+                process, {"type": "task", "id": "task6", "label": "a"}, after_id="task4"
+            ),
+            lambda process: move_element(process, "task4", before_id="task5"),
+            lambda process: update_element(
+                process, {"type": "task", "id": "task4", "label": "a"}
+            ),
+        ],
+    )
+    def test_edit_leaves_the_original_process_untouched(self, order_process, edit):
+        original_process = deepcopy(order_process)
+
+        updated_process = edit(order_process)["process"]
+
+        assert order_process == original_process
+        assert updated_process != original_process
+
+    def test_edit_only_copies_the_path_to_the_edited_element(self, order_process):
+        updated_process = delete_element(order_process, "task4")["process"]
+
+        # The containers on the path to task4 are new
+        assert updated_process[2] is not order_process[2]
+        updated_branches = updated_process[2]["branches"]
+        assert updated_branches[1] is not order_process[2]["branches"][1]
+        # Everything else is shared
+        assert updated_process[0] is order_process[0]
+        assert updated_process[1] is order_process[1]
+        assert updated_branches[0] is order_process[2]["branches"][0]
+        assert (
+            updated_branches[1]["path"][0]["branches"][1]
+            is order_process[2]["branches"][1]["path"][0]["branches"][1]
+        )
@@ -0,0 +1,78 @@
+from bpmn_assistant.services.process_editing import (
+    add_element,
+    delete_element,
+    move_element,
+    redirect_branch,
+    update_element,
+)
+from bpmn_assistant.services.process_editing.process_diff import diff_processes
+
+
+class TestDiffProcesses:
+    def test_identical_processes(self, order_process):
+        assert diff_processes(order_process, order_process) == []
+
+    def test_added_element(self, order_process):
+        new_task = {"type": "task", "id": "task6", "label": "Pack order"}
+        process = add_element(order_process, new_task, after_id="task3")["process"]
+
+        assert diff_processes(order_process, process) == [
+            "- Added task task6 \"Pack order\" after 'task3'"
+        ]
+
+    def test_added_gateway_includes_its_elements(self, linear_process):
+        gateway = {
+            "type": "parallelGateway",
+            "id": "parallel1",
+            "branches": [
+                [{"type": "task", "id": "a", "label": "A"}],
+                [{"type": "task", "id": "b", "label": "B"}],
+            ],
+        }
+        process = add_element(linear_process, gateway, before_id="task1")["process"]
+
+        assert diff_processes(linear_process, process) == [
+            "- Added parallelGateway parallel1 after 'start1'\n"
+            "    |\n"
+            "      task a \"A\"\n"
+            "    |\n"
+            "      task b \"B\""
+        ]
+
+    def test_removed_gateway_includes_its_elements(self, order_process):
+        process = delete_element(order_process, "exclusive2")["process"]
+
+        assert diff_processes(order_process, process) == ["- Removed 'exclusive2'"]
+
+    def test_moved_element(self, order_process):
+        process = move_element(order_process, "task5", before_id="task3")["process"]
+
+        assert diff_processes(order_process, process) == [
+            "- Moved 'task5' at the start of the branch 'Payment succeeds' of "
+            "'exclusive2'"
+        ]
+
+    def test_moved_element_within_its_sequence(self, linear_process):
+        process = move_element(linear_process, "task2", after_id="task4")["process"]
+
+        assert diff_processes(linear_process, process) == [
+            "- Moved 'task2' after 'task4'"
+        ]
+
+    def test_updated_element(self, linear_process):
+        new_element = {"type": "userTask", "id": "task3", "label": "Prepare the quote"}
+        process = update_element(linear_process, new_element)["process"]
+
+        assert diff_processes(linear_process, process) == [
+            "- Updated userTask task3 \"Prepare the quote\""
+        ]
+
+    def test_redirected_branch_updates_the_gateway(self, order_process):
+        process = redirect_branch(order_process, "Payment fails", "task1")["process"]
+
+        [change] = diff_processes(order_process, process)
+        lines = change.split("\n")
+
+        assert lines[0].startswith("- Updated exclusiveGateway exclusive2 ")
+        assert '    ? "Payment fails" -> task1' in lines
+        assert "task5" not in change  # The elements of the branches are not listed
@@ -0,0 +1,143 @@
+import random
+
+import pytest
+
+from bpmn_assistant.core.exceptions import ElementNotFoundException, ProcessException
+from bpmn_assistant.services.process_editing import (
+    ProcessIndex,
+    add_element,
+    delete_element,
+    move_element,
+    redirect_branch,
+    update_element,
+)
+from bpmn_assistant.services.process_editing.helpers import (
+    find_branch_position,
+    find_position,
+    get_all_ids,
+)
+
+PROCESSES = ["order_process", "procurement_process", "pg_inside_eg_process"]
+
+
+def positions(process_index: ProcessIndex) -> dict:
+    return {
+        element_id: process_index.position(element_id).to_dict()
+        for element_id in process_index._positions
+    }
+
+
+def conditions(process: list[dict]) -> list[str]:
+    result = []
+    for element in process:
+        if element["type"] == "exclusiveGateway":
+            for branch in element["branches"]:
+                result.append(branch["condition"])
+                result += conditions(branch["path"])
+        elif element["type"] == "parallelGateway":
+            for branch in element["branches"]:
+                result += conditions(branch)
+    return result
+
+
+class TestProcessIndex:
+    @pytest.mark.parametrize("process_name", PROCESSES)
+    def test_matches_the_traversals(self, process_name, request):
+        process = request.getfixturevalue(process_name)
+        process_index = ProcessIndex(process)
+
+        assert len(process_index) == len(get_all_ids(process))
+        for element_id in get_all_ids(process):
+            assert element_id in process_index
+            for kwargs in [{"before_id": element_id}, {"after_id": element_id}]:
+                assert (
+                    process_index.insertion_position(**kwargs).to_dict()
+                    == find_position(process, **kwargs).to_dict()
+                )
+        for condition in conditions(process):
+            assert (
+                process_index.branch_position(condition).to_dict()
+                == find_branch_position(process, condition).to_dict()
+            )
+
+    def test_missing_elements(self, order_process):
+        process_index = ProcessIndex(order_process)
+
+        assert "missing" not in process_index
+        with pytest.raises(ElementNotFoundException):
+            process_index.position("missing")
+        with pytest.raises(ProcessException):
+            process_index.insertion_position(after_id="missing")
+        with pytest.raises(ProcessException):
+            process_index.branch_position("Missing condition")
+
+    @pytest.mark.parametrize("process_name", PROCESSES)
+    def test_is_maintained_incrementally_across_edits(self, process_name, request):
+        process = request.getfixturevalue(process_name)
+        process_index = ProcessIndex(process)
+        rng = random.Random(0)
+        applied = 0
+
+        for step in range(60):
+            ids = get_all_ids(process)
+            element_id = rng.choice(ids)
+            edit = rng.choice(["add", "delete", "move", "update", "redirect"])
+
+            try:
+                if edit == "add":
+                    new_element = {"type": "task", "id": f"new{step}", "label": "New"}
+                    key = rng.choice(["before_id", "after_id"])
+                    result = add_element(
+                        process,
+                        new_element,
+                        **{key: element_id},
+                        process_index=process_index,
+                    )
+                elif edit == "delete" and len(ids) > 3:
+                    result = delete_element(process, element_id, process_index)
+                elif edit == "move":
+                    result = move_element(
+                        process,
+                        element_id,
+                        after_id=rng.choice(ids),
+                        process_index=process_index,
+                    )
+                elif edit == "update":
+                    result = update_element(
+                        process,
+                        {"type": "userTask", "id": element_id, "label": "Updated"},
+                        process_index,
+                    )
+                elif edit == "redirect" and conditions(process):
+                    condition = rng.choice(conditions(process))
+                    result = redirect_branch(
+                        process, condition, element_id, process_index
+                    )
+                else:
+                    continue
+            except ProcessException:
+                # A rejected edit (e.g. moving an element inside itself, updating a
+                # gateway) must leave the index untouched
+                assert positions(process_index) == positions(ProcessIndex(process))
+                continue
+
+            process = result["process"]
+            applied += 1
+            assert positions(process_index) == positions(ProcessIndex(process))
+            assert process_index._branches == ProcessIndex(process)._branches
+
+        assert applied > 20
+
+    def test_move_inside_itself_is_rejected(self, order_process):
+        process_index = ProcessIndex(order_process)
+
+        with pytest.raises(ElementNotFoundException) as e:
+            move_element(
+                order_process,
+                "exclusive1",
+                after_id="task3",
+                process_index=process_index,
+            )
+
+        assert str(e.value) == "Element with id task3 does not exist"
+        assert positions(process_index) == positions(ProcessIndex(order_process))
@@ -0,0 +1,74 @@
+import asyncio
+import os
+from unittest.mock import patch
+
+import pytest
+
+from bpmn_assistant.services import BpmnBatchConverter, BpmnJsonGenerator
+
+
+class TestBpmnBatchConverter:
+
+    @pytest.fixture
+    def converter(self):
+        converter = BpmnBatchConverter(max_workers=2, chunk_size=2)
+        yield converter
+        converter.shutdown()
+
+    def test_convert(
+        self, converter, bpmn_xml_linear_process, bpmn_xml_exclusive_gateway
+    ):
+        bpmn_xmls = [
+            bpmn_xml_linear_process,
+            bpmn_xml_exclusive_gateway,
+            bpmn_xml_linear_process,
+        ]
+
+        results = converter.convert(bpmn_xmls)
+
+        assert results == [
+            {
+                "bpmn_json": BpmnJsonGenerator().create_bpmn_json(bpmn_xml),
+                "error": None,
+            }
+            for bpmn_xml in bpmn_xmls
+        ]
+
+    def test_convert_reports_errors_per_document(
+        self, converter, bpmn_xml_linear_process
+    ):
+        bpmn_xmls = [bpmn_xml_linear_process, "<definitions>", bpmn_xml_linear_process]
+
+        results = converter.convert(bpmn_xmls)
+
+        assert results[0]["error"] is None
+        assert results[1]["bpmn_json"] is None
+        assert "ParseError" in results[1]["error"]
+        assert results[2]["error"] is None
+        assert results[2]["bpmn_json"] == results[0]["bpmn_json"]
+
+    def test_convert_async(self, converter, bpmn_xml_parallel_gateway):
+        bpmn_xmls = [bpmn_xml_parallel_gateway, "not xml"]
+
+        results = asyncio.run(converter.convert_async(bpmn_xmls, streaming=True))
+
+        assert results[0] == {
+            "bpmn_json": BpmnJsonGenerator().create_bpmn_json(bpmn_xml_parallel_gateway),
+            "error": None,
+        }
+        assert results[1]["bpmn_json"] is None
+        assert results[1]["error"]
+
+    @pytest.mark.parametrize(
+        "value, max_workers",
+        [("3", 3), ("", None), ("auto", None), ("0", None), ("-2", None)],
+    )
+    def test_from_env(self, value, max_workers):
+        with patch.dict(os.environ, {"BPMN_BATCH_MAX_WORKERS": value}):
+            converter = BpmnBatchConverter.from_env()
+
+        assert converter.max_workers == max_workers
+
+    def test_rejects_invalid_max_workers(self):
+        with pytest.raises(ValueError, match="max_workers must be at least 1, got -1"):
+            BpmnBatchConverter(max_workers=-1)
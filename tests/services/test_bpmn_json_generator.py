@@ -1,4 +1,10 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
 from bpmn_assistant.services import BpmnJsonGenerator
+from tests.fixtures.bpmn_loader import load_bpmn
 
 
 class TestBpmnJsonGenerator:
@@ -724,6 +730,50 @@ class TestBpmnJsonGenerator:
 
         assert result == expected
 
+    def test_create_bpmn_json_eg_loop_into_branch(self, bpmn_xml_eg_loop_into_branch):
+        bpmn_json_generator = BpmnJsonGenerator()
+
+        result = bpmn_json_generator.create_bpmn_json(bpmn_xml_eg_loop_into_branch)
+
+        # The loop re-enters the "No" branch at task3, which is not a post-dominator of
+        # the first gateway: its join is still found where the branches meet
+        expected = [
+            {"type": "startEvent", "id": "start1"},
+            {
+                "type": "exclusiveGateway",
+                "id": "exclusive1",
+                "label": "Express order?",
+                "has_join": True,
+                "branches": [
+                    {
+                        "condition": "Yes",
+                        "path": [
+                            {"type": "task", "id": "task1", "label": "Ship by courier"}
+                        ],
+                    },
+                    {
+                        "condition": "No",
+                        "path": [
+                            {"type": "task", "id": "task2", "label": "Pack the order"},
+                            {"type": "task", "id": "task3", "label": "Ship by post"},
+                        ],
+                    },
+                ],
+            },
+            {
+                "type": "exclusiveGateway",
+                "id": "exclusive2",
+                "label": "Delivered?",
+                "has_join": False,
+                "branches": [
+                    {"condition": "No", "path": [], "next": "task3"},
+                    {"condition": "Yes", "path": [{"type": "endEvent", "id": "end1"}]},
+                ],
+            },
+        ]
+
+        assert result == expected
+
     def test_create_bpmn_json_labeled_events(self, bpmn_xml_labeled_events):
         bpmn_json_generator = BpmnJsonGenerator()
 
@@ -748,3 +798,110 @@ class TestBpmnJsonGenerator:
         ]
 
         assert result == expected
+
+    def test_create_bpmn_json_long_linear_process(self, bpmn_xml_long_linear_process):
+        bpmn_json_generator = BpmnJsonGenerator()
+
+        # The process is much longer than the recursion limit
+        result = bpmn_json_generator.create_bpmn_json(bpmn_xml_long_linear_process)
+
+        assert len(result) == 50_000
+        assert result[0] == {"type": "startEvent", "id": "start"}
+        assert result[1] == {"type": "task", "id": "task1", "label": "Task task1"}
+        assert result[-2] == {"type": "task", "id": "task49998", "label": "Task task49998"}
+        assert result[-1] == {"type": "endEvent", "id": "end"}
+
+    @pytest.mark.parametrize(
+        "filename",
+        [
+            "linear_process.bpmn",
+            "exclusive_gateway_join.bpmn",
+            "nested_exclusive_gateway.bpmn",
+            "pg_inside_eg.bpmn",
+            "eg_inside_pg.bpmn",
+            "eg_next_3.bpmn",
+            "eg_next_6.bpmn",
+            "eg_empty_path.bpmn",
+            "eg_loop_into_branch.bpmn",
+            "labeled_events.bpmn",
+        ],
+    )
+    def test_create_bpmn_json_streaming(self, filename):
+        bpmn_xml = load_bpmn(filename)
+
+        expected = BpmnJsonGenerator().create_bpmn_json(bpmn_xml)
+
+        assert BpmnJsonGenerator().create_bpmn_json(bpmn_xml, streaming=True) == expected
+        assert (
+            BpmnJsonGenerator().create_bpmn_json(
+                io.BytesIO(bpmn_xml.encode("utf-8")), streaming=True
+            )
+            == expected
+        )
+
+    def test_create_bpmn_json_streaming_without_process(self):
+        bpmn_xml = '<definitions xmlns="http://www.omg.org/spec/BPMN/20100524/MODEL" />'
+
+        with pytest.raises(ValueError, match="No process element found"):
+            BpmnJsonGenerator().create_bpmn_json(bpmn_xml, streaming=True)
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_create_bpmn_json_by_process(self, bpmn_xml_collaboration, streaming):
+        bpmn_json_generator = BpmnJsonGenerator()
+
+        result = bpmn_json_generator.create_bpmn_json_by_process(
+            bpmn_xml_collaboration, streaming=streaming
+        )
+
+        # The empty process of the black-box participant is skipped
+        assert list(result) == ["Process_Customer", "Process_Shop"]
+        assert result["Process_Customer"] == [
+            {"type": "startEvent", "id": "StartEvent_Customer"},
+            {"type": "task", "id": "Activity_PlaceOrder", "label": "Place order"},
+            {"type": "endEvent", "id": "EndEvent_Customer"},
+        ]
+        assert result["Process_Shop"] == [
+            {"type": "startEvent", "id": "StartEvent_Shop"},
+            {
+                "type": "exclusiveGateway",
+                "id": "Gateway_InStock",
+                "label": "Product in stock?",
+                "has_join": False,
+                "branches": [
+                    {
+                        "condition": "Yes",
+                        "path": [
+                            {
+                                "type": "task",
+                                "id": "Activity_ShipOrder",
+                                "label": "Ship order",
+                            },
+                            {"type": "endEvent", "id": "EndEvent_Shipped"},
+                        ],
+                    },
+                    {
+                        "condition": "No",
+                        "path": [{"type": "endEvent", "id": "EndEvent_Rejected"}],
+                    },
+                ],
+            },
+        ]
+
+    def test_create_bpmn_json_by_process_with_executor(self, bpmn_xml_collaboration):
+        expected = BpmnJsonGenerator().create_bpmn_json_by_process(bpmn_xml_collaboration)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = BpmnJsonGenerator().create_bpmn_json_by_process(
+                bpmn_xml_collaboration, executor=executor
+            )
+
+        assert result == expected
+
+    def test_create_bpmn_json_by_process_single_process(self, bpmn_xml_linear_process):
+        result = BpmnJsonGenerator().create_bpmn_json_by_process(bpmn_xml_linear_process)
+
+        assert result == {
+            "Process_00a4hfq": BpmnJsonGenerator().create_bpmn_json(
+                bpmn_xml_linear_process
+            )
+        }
@@ -0,0 +1,109 @@
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from bpmn_assistant.services import (
+    BpmnJsonGenerator,
+    BpmnLayout,
+    BpmnProcessTransformer,
+    BpmnXmlGenerator,
+)
+
+PROCESS_FIXTURES = [
+    "linear_process",
+    "order_process",
+    "procurement_process",
+    "pg_inside_eg_process",
+    "empty_gateway_path_process",
+]
+
+
+def layout_process(process: list[dict]):
+    transformed_process = BpmnProcessTransformer().transform(process)
+    return transformed_process, BpmnLayout().layout(process, transformed_process)
+
+
+class TestBpmnLayout:
+
+    def test_layout_linear_process(self, linear_process):
+        _, diagram_layout = layout_process(linear_process)
+
+        shapes = [diagram_layout.shapes[element["id"]] for element in linear_process]
+
+        # The elements are placed from left to right, on the same row
+        assert all(a.right < b.x for a, b in zip(shapes, shapes[1:]))
+        assert len({shape.center_y for shape in shapes}) == 1
+        assert diagram_layout.edges["start1-task1"] == [
+            (shapes[0].right, shapes[0].center_y),
+            (shapes[1].x, shapes[1].center_y),
+        ]
+
+    def test_layout_branches(self, procurement_process):
+        _, diagram_layout = layout_process(procurement_process)
+        shapes = diagram_layout.shapes
+
+        # The branches are stacked between the gateway and its join
+        assert shapes["task1"].center_y == shapes["task2"].center_y
+        assert shapes["task3"].center_y > shapes["task1"].center_y
+        assert shapes["parallel1"].right < shapes["task1"].x
+        assert shapes["task2"].right < shapes["parallel1-join"].x
+        assert shapes["parallel1-join"].center_y == shapes["parallel1"].center_y
+
+    @pytest.mark.parametrize("process_fixture", PROCESS_FIXTURES)
+    def test_layout_covers_the_process(self, process_fixture, request):
+        process = request.getfixturevalue(process_fixture)
+        transformed_process, diagram_layout = layout_process(process)
+
+        assert set(diagram_layout.shapes) == {
+            element["id"] for element in transformed_process["elements"]
+        }
+        assert set(diagram_layout.edges) == {
+            flow["id"] for flow in transformed_process["flows"]
+        }
+
+        # No two shapes overlap
+        shapes = list(diagram_layout.shapes.values())
+        for i, a in enumerate(shapes):
+            for b in shapes[i + 1 :]:
+                assert (
+                    a.right <= b.x or b.right <= a.x or a.bottom <= b.y or b.bottom <= a.y
+                )
+
+    def test_layout_places_unreached_elements_below_the_process(
+        self, procurement_process
+    ):
+        transformed_process = BpmnProcessTransformer().transform(procurement_process)
+        placed_ids = {element["id"] for element in transformed_process["elements"]}
+        transformed_process["elements"] += [
+            {"id": f"orphan{i}", "type": "task", "incoming": [], "outgoing": []}
+            for i in range(2)
+        ]
+
+        diagram_layout = BpmnLayout().layout(procurement_process, transformed_process)
+
+        shapes = diagram_layout.shapes
+        placed = [shapes[element_id] for element_id in placed_ids]
+        orphans = [shapes["orphan0"], shapes["orphan1"]]
+        assert all(orphan.y > max(shape.bottom for shape in placed) for orphan in orphans)
+        assert orphans[0].right < orphans[1].x
+
+    @pytest.mark.parametrize("process_fixture", PROCESS_FIXTURES)
+    def test_create_bpmn_xml_with_layout(self, process_fixture, request):
+        process = request.getfixturevalue(process_fixture)
+        xml_generator = BpmnXmlGenerator()
+
+        result = xml_generator.create_bpmn_xml(process, with_layout=True)
+
+        root = ET.fromstring(result)
+        namespaces = {"bpmndi": "http://www.omg.org/spec/BPMN/20100524/DI"}
+        shapes = root.findall(".//bpmndi:BPMNShape", namespaces)
+        edges = root.findall(".//bpmndi:BPMNEdge", namespaces)
+        transformed_process = BpmnProcessTransformer().transform(process)
+        assert len(shapes) == len(transformed_process["elements"])
+        assert len(edges) == len(transformed_process["flows"])
+
+        # The process itself is the same as without the layout
+        expected = BpmnJsonGenerator().create_bpmn_json(
+            xml_generator.create_bpmn_xml(process)
+        )
+        assert BpmnJsonGenerator().create_bpmn_json(result) == expected
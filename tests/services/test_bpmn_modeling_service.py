@@ -1,11 +1,27 @@
-from unittest.mock import Mock
+import asyncio
+import os
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from bpmn_assistant.core import LLMFacade
+from bpmn_assistant.core.exceptions import LLMCallError
 from bpmn_assistant.services import BpmnModelingService
 
 
+class TestFromEnv:
+
+    @pytest.mark.parametrize(
+        "value, diff_checkpoint_interval",
+        [("4", 4), ("", None), ("0", None), ("often", None), ("-1", None)],
+    )
+    def test_reads_the_diff_checkpoint_interval(self, value, diff_checkpoint_interval):
+        with patch.dict(os.environ, {"EDIT_DIFF_CHECKPOINT_INTERVAL": value}):
+            bpmn_service = BpmnModelingService.from_env()
+
+        assert bpmn_service.diff_checkpoint_interval == diff_checkpoint_interval
+
+
 class TestCreateBpmn:
 
     def test_create_bpmn_raises_exception_for_missing_id(self):
@@ -31,3 +47,231 @@ class TestCreateBpmn:
 
         assert "Max number of retries reached" in str(e.value)
         assert mock_llm_facade.call.call_count == 3
+
+
+class TestEditBpmn:
+
+    process = [
+        {"type": "startEvent", "id": "start1"},
+        {"type": "task", "id": "task1", "label": "Review"},
+        {"type": "endEvent", "id": "end1"},
+    ]
+    invalid_proposal = {"function": "rename_element", "arguments": {}}
+    call_failure = ConnectionError("Connection reset")
+
+    @staticmethod
+    def add_task(task_id: str, after_id: str) -> dict:
+        return {
+            "function": "add_element",
+            "arguments": {
+                "element": {"type": "userTask", "id": task_id, "label": "Approve"},
+                "after_id": after_id,
+            },
+        }
+
+    def make_facades(self, proposals: list) -> tuple[Mock, Mock]:
+        llm_facade = Mock(LLMFacade, usage=[])
+        llm_facade.call.side_effect = proposals
+        text_llm_facade = Mock(LLMFacade)
+        text_llm_facade.call.return_value = "Add approvals"
+        return llm_facade, text_llm_facade
+
+    def add_tasks(self, count: int) -> list[dict]:
+        return [
+            self.add_task(f"approval{i}", "task1" if i == 0 else f"approval{i - 1}")
+            for i in range(count)
+        ]
+
+    def test_resumes_the_editing_after_a_failed_llm_call(self):
+        bpmn_service = BpmnModelingService()
+        llm_facade, text_llm_facade = self.make_facades(
+            [
+                self.add_task("approval1", "task1"),
+                self.call_failure,  # The first attempt fails
+                self.add_task("approval2", "approval1"),
+                {"stop": True},
+            ]
+        )
+
+        process = bpmn_service.edit_bpmn(llm_facade, text_llm_facade, self.process, [])
+
+        assert [element["id"] for element in process] == [
+            "start1",
+            "task1",
+            "approval1",
+            "approval2",
+            "end1",
+        ]
+        # The initial edit is not requested again
+        assert llm_facade.call.call_count == 4
+        resumed_prompt = llm_facade.call.call_args_list[2].kwargs["prompt"]
+        assert "approval1" in resumed_prompt
+        assert text_llm_facade.call.call_count == 1
+
+    def test_resumes_the_async_editing(self):
+        bpmn_service = BpmnModelingService()
+        llm_facade, text_llm_facade = self.make_facades([])
+        llm_facade.call_async = AsyncMock(
+            side_effect=[
+                self.add_task("approval1", "task1"),
+                self.call_failure,
+                {"stop": True},
+            ]
+        )
+        text_llm_facade.call_async = AsyncMock(return_value="Add an approval")
+
+        process = asyncio.run(
+            bpmn_service.edit_bpmn_async(llm_facade, text_llm_facade, self.process, [])
+        )
+
+        assert [element["id"] for element in process][2] == "approval1"
+        assert llm_facade.call_async.call_count == 3
+
+    def test_resumes_within_the_iterations_left(self):
+        bpmn_service = BpmnModelingService()
+        llm_facade, text_llm_facade = self.make_facades(
+            # The initial edit and 3 of the 7 intermediate iterations, then 4 more
+            [*self.add_tasks(4), self.call_failure, *self.add_tasks(20)[4:]]
+        )
+
+        with pytest.raises(Exception, match="Max number of editing iterations reached"):
+            bpmn_service.edit_bpmn(llm_facade, text_llm_facade, self.process, [])
+
+        # The resumed editing stops at the cap instead of running 7 more iterations
+        assert llm_facade.call.call_count == 1 + 3 + 1 + 4
+
+    def test_does_not_resume_when_the_iterations_are_exhausted(self):
+        bpmn_service = BpmnModelingService()
+        llm_facade, text_llm_facade = self.make_facades(self.add_tasks(20))
+
+        with pytest.raises(Exception, match="Max number of editing iterations reached"):
+            bpmn_service.edit_bpmn(llm_facade, text_llm_facade, self.process, [])
+
+        assert llm_facade.call.call_count == 1 + 7
+
+    def test_does_not_resume_when_the_retries_are_exhausted(self):
+        bpmn_service = BpmnModelingService()
+        llm_facade, text_llm_facade = self.make_facades(
+            [self.add_task("approval1", "task1"), *[self.invalid_proposal] * 8]
+        )
+
+        with pytest.raises(Exception, match="Edit iteration 1 failed"):
+            bpmn_service.edit_bpmn(llm_facade, text_llm_facade, self.process, [])
+
+        assert llm_facade.call.call_count == 5
+
+    def test_raises_the_failure_when_no_edit_was_applied(self):
+        bpmn_service = BpmnModelingService()
+        llm_facade, text_llm_facade = self.make_facades([self.call_failure])
+
+        with pytest.raises(LLMCallError, match="Connection reset"):
+            bpmn_service.edit_bpmn(llm_facade, text_llm_facade, self.process, [])
+
+        assert llm_facade.call.call_count == 1
+
+    def test_raises_the_failure_when_the_attempts_are_exhausted(self):
+        bpmn_service = BpmnModelingService(max_edit_attempts=2)
+        llm_facade, text_llm_facade = self.make_facades(
+            [self.add_task("approval1", "task1"), self.call_failure, self.call_failure]
+        )
+
+        with pytest.raises(LLMCallError):
+            bpmn_service.edit_bpmn(llm_facade, text_llm_facade, self.process, [])
+
+        assert llm_facade.call.call_count == 3
+
+
+class TestEditBpmnSpeculatively:
+
+    process = [
+        {"type": "startEvent", "id": "start1"},
+        {"type": "task", "id": "task1", "label": "Review"},
+        {"type": "endEvent", "id": "end1"},
+    ]
+
+    def test_defines_the_change_request_while_the_intent_is_determined(self):
+        bpmn_service = BpmnModelingService()
+        llm_facade = Mock(LLMFacade, usage=[])
+        llm_facade.call_async = AsyncMock(
+            side_effect=[
+                {
+                    "function": "delete_element",
+                    "arguments": {"element_id": "task1"},
+                },
+                {"stop": True},
+            ]
+        )
+        text_llm_facade = Mock(LLMFacade)
+
+        async def run():
+            change_request_started = asyncio.Event()
+
+            async def define_change_request(*args, **kwargs):
+                change_request_started.set()
+                return "Delete the review task"
+
+            async def determine_intent():
+                # Would never return if the change request waited for the intent
+                await change_request_started.wait()
+                return {"intent": "modify"}
+
+            text_llm_facade.call_async = AsyncMock(side_effect=define_change_request)
+
+            return await bpmn_service.edit_bpmn_speculatively_async(
+                llm_facade, text_llm_facade, self.process, [], determine_intent()
+            )
+
+        intent, process = asyncio.run(asyncio.wait_for(run(), timeout=5))
+
+        assert intent == {"intent": "modify"}
+        assert [element["id"] for element in process] == ["start1", "end1"]
+        assert llm_facade.call_async.await_count == 2
+
+    def test_cancels_the_change_request_if_the_intent_is_talk(self):
+        bpmn_service = BpmnModelingService()
+        llm_facade = Mock(LLMFacade)
+        text_llm_facade = Mock(LLMFacade)
+
+        async def run():
+            cancelled = asyncio.Event()
+
+            async def define_change_request(*args, **kwargs):
+                try:
+                    await asyncio.sleep(60)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+
+            async def determine_intent():
+                await asyncio.sleep(0)
+                return {"intent": "talk"}
+
+            text_llm_facade.call_async = AsyncMock(side_effect=define_change_request)
+
+            result = await bpmn_service.edit_bpmn_speculatively_async(
+                llm_facade, text_llm_facade, self.process, [], determine_intent()
+            )
+            return result, cancelled.is_set()
+
+        (intent, process), cancelled = asyncio.run(asyncio.wait_for(run(), timeout=5))
+
+        assert intent == {"intent": "talk"}
+        assert process is None
+        assert cancelled
+        llm_facade.call_async.assert_not_called()
+
+    def test_cancels_the_change_request_if_the_intent_fails(self):
+        bpmn_service = BpmnModelingService()
+        text_llm_facade = Mock(LLMFacade)
+        text_llm_facade.call_async = AsyncMock(side_effect=lambda **kwargs: "Never")
+
+        async def determine_intent():
+            raise Exception("Maximum number of retries reached")
+
+        async def run():
+            await bpmn_service.edit_bpmn_speculatively_async(
+                Mock(LLMFacade), text_llm_facade, self.process, [], determine_intent()
+            )
+
+        with pytest.raises(Exception, match="Maximum number of retries reached"):
+            asyncio.run(asyncio.wait_for(run(), timeout=5))
@@ -186,3 +186,283 @@ class TestBpmnProcessTransformer:
         }
 
         assert result == expected
+
+    def test_transform_parallel_gateway_inside_exclusive_gateway(
+        self, pg_inside_eg_process
+    ):
+
+        self.transformer = BpmnProcessTransformer()
+
+        result = self.transformer.transform(pg_inside_eg_process)
+
+        expected = {
+            "elements": [
+                {
+                    "id": "start1",
+                    "type": "startEvent",
+                    "label": None,
+                    "incoming": [],
+                    "outgoing": ["start1-exclusive1"],
+                },
+                {
+                    "id": "exclusive1",
+                    "type": "exclusiveGateway",
+                    "label": "Exclusive Decision",
+                    "incoming": ["start1-exclusive1"],
+                    "outgoing": ["exclusive1-task2", "exclusive1-parallel1"],
+                },
+                {
+                    "id": "exclusive1-join",
+                    "type": "exclusiveGateway",
+                    "label": None,
+                    "incoming": [
+                        "task2-exclusive1-join",
+                        "parallel1-join-exclusive1-join",
+                    ],
+                    "outgoing": ["exclusive1-join-end1"],
+                },
+                {
+                    "id": "task2",
+                    "type": "task",
+                    "label": "Task A",
+                    "incoming": ["exclusive1-task2"],
+                    "outgoing": ["task2-exclusive1-join"],
+                },
+                {
+                    "id": "parallel1",
+                    "type": "parallelGateway",
+                    "label": None,
+                    "incoming": ["exclusive1-parallel1"],
+                    "outgoing": ["parallel1-task3", "parallel1-task4"],
+                },
+                {
+                    "id": "parallel1-join",
+                    "type": "parallelGateway",
+                    "label": None,
+                    "incoming": ["task3-parallel1-join", "task4-parallel1-join"],
+                    "outgoing": ["parallel1-join-exclusive1-join"],
+                },
+                {
+                    "id": "task3",
+                    "type": "task",
+                    "label": "Parallel Task 1",
+                    "incoming": ["parallel1-task3"],
+                    "outgoing": ["task3-parallel1-join"],
+                },
+                {
+                    "id": "task4",
+                    "type": "task",
+                    "label": "Parallel Task 2",
+                    "incoming": ["parallel1-task4"],
+                    "outgoing": ["task4-parallel1-join"],
+                },
+                {
+                    "id": "end1",
+                    "type": "endEvent",
+                    "label": None,
+                    "incoming": ["exclusive1-join-end1"],
+                    "outgoing": [],
+                },
+            ],
+            "flows": [
+                {
+                    "id": "start1-exclusive1",
+                    "sourceRef": "start1",
+                    "targetRef": "exclusive1",
+                    "condition": None,
+                },
+                {
+                    "id": "task2-exclusive1-join",
+                    "sourceRef": "task2",
+                    "targetRef": "exclusive1-join",
+                    "condition": None,
+                },
+                {
+                    "id": "exclusive1-task2",
+                    "sourceRef": "exclusive1",
+                    "targetRef": "task2",
+                    "condition": "Condition A",
+                },
+                {
+                    "id": "task3-parallel1-join",
+                    "sourceRef": "task3",
+                    "targetRef": "parallel1-join",
+                    "condition": None,
+                },
+                {
+                    "id": "parallel1-task3",
+                    "sourceRef": "parallel1",
+                    "targetRef": "task3",
+                    "condition": None,
+                },
+                {
+                    "id": "task4-parallel1-join",
+                    "sourceRef": "task4",
+                    "targetRef": "parallel1-join",
+                    "condition": None,
+                },
+                {
+                    "id": "parallel1-task4",
+                    "sourceRef": "parallel1",
+                    "targetRef": "task4",
+                    "condition": None,
+                },
+                {
+                    "id": "parallel1-join-exclusive1-join",
+                    "sourceRef": "parallel1-join",
+                    "targetRef": "exclusive1-join",
+                    "condition": None,
+                },
+                {
+                    "id": "exclusive1-parallel1",
+                    "sourceRef": "exclusive1",
+                    "targetRef": "parallel1",
+                    "condition": "Condition B",
+                },
+                {
+                    "id": "exclusive1-join-end1",
+                    "sourceRef": "exclusive1-join",
+                    "targetRef": "end1",
+                    "condition": None,
+                },
+            ],
+        }
+
+        assert result == expected
+
+    def test_transform_exclusive_gateway_with_next(self, eg_next_process):
+
+        self.transformer = BpmnProcessTransformer()
+
+        result = self.transformer.transform(eg_next_process)
+
+        expected = {
+            "elements": [
+                {
+                    "id": "start1",
+                    "type": "startEvent",
+                    "label": None,
+                    "incoming": [],
+                    "outgoing": ["start1-task1"],
+                },
+                {
+                    "id": "task1",
+                    "type": "task",
+                    "label": "Prepare the order",
+                    "incoming": ["start1-task1", "task2-task1"],
+                    "outgoing": ["task1-exclusive1"],
+                },
+                {
+                    "id": "exclusive1",
+                    "type": "exclusiveGateway",
+                    "label": "Order complete?",
+                    "incoming": ["task1-exclusive1"],
+                    "outgoing": ["exclusive1-task2", "exclusive1-task3"],
+                },
+                {
+                    "id": "task2",
+                    "type": "task",
+                    "label": "Add the missing items",
+                    "incoming": ["exclusive1-task2"],
+                    "outgoing": ["task2-task1"],
+                },
+                {
+                    "id": "task3",
+                    "type": "task",
+                    "label": "Ship the order",
+                    "incoming": ["exclusive1-task3"],
+                    "outgoing": ["task3-end1"],
+                },
+                {
+                    "id": "end1",
+                    "type": "endEvent",
+                    "label": None,
+                    "incoming": ["task3-end1"],
+                    "outgoing": [],
+                },
+            ],
+            "flows": [
+                {
+                    "id": "start1-task1",
+                    "sourceRef": "start1",
+                    "targetRef": "task1",
+                    "condition": None,
+                },
+                {
+                    "id": "task1-exclusive1",
+                    "sourceRef": "task1",
+                    "targetRef": "exclusive1",
+                    "condition": None,
+                },
+                {
+                    "id": "task2-task1",
+                    "sourceRef": "task2",
+                    "targetRef": "task1",
+                    "condition": None,
+                },
+                {
+                    "id": "exclusive1-task2",
+                    "sourceRef": "exclusive1",
+                    "targetRef": "task2",
+                    "condition": "No",
+                },
+                {
+                    "id": "exclusive1-task3",
+                    "sourceRef": "exclusive1",
+                    "targetRef": "task3",
+                    "condition": "Yes",
+                },
+                {
+                    "id": "task3-end1",
+                    "sourceRef": "task3",
+                    "targetRef": "end1",
+                    "condition": None,
+                },
+            ],
+        }
+
+        assert result == expected
+
+    def test_transform_connects_duplicate_elements_once(self):
+        # The same task in both branches connects to the join gateway through a single
+        # flow, even though the branches are nested below the top-level process
+        process = [
+            {"type": "startEvent", "id": "start1"},
+            {
+                "type": "exclusiveGateway",
+                "id": "exclusive1",
+                "label": "Urgent?",
+                "has_join": True,
+                "branches": [
+                    {
+                        "condition": "Yes",
+                        "path": [{"type": "task", "id": "task1", "label": "Notify"}],
+                    },
+                    {
+                        "condition": "No",
+                        "path": [{"type": "task", "id": "task1", "label": "Notify"}],
+                    },
+                ],
+            },
+            {"type": "endEvent", "id": "end1"},
+        ]
+
+        self.transformer = BpmnProcessTransformer()
+
+        result = self.transformer.transform(process)
+
+        assert [flow["id"] for flow in result["flows"]] == [
+            "start1-exclusive1",
+            "task1-exclusive1-join",
+            "exclusive1-task1",
+            "exclusive1-join-end1",
+        ]
+        assert {
+            element["id"]: element["incoming"] for element in result["elements"]
+        } == {
+            "start1": [],
+            "exclusive1": ["start1-exclusive1"],
+            "exclusive1-join": ["task1-exclusive1-join"],
+            "task1": ["exclusive1-task1"],
+            "end1": ["exclusive1-join-end1"],
+        }
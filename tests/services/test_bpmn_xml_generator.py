@@ -1,5 +1,8 @@
+import io
 from xml.etree import ElementTree as ET
 
+import pytest
+
 from bpmn_assistant.services import BpmnXmlGenerator
 
 
@@ -87,3 +90,47 @@ class TestBpmnXmlGenerator:
         result_tree = ET.ElementTree(ET.fromstring(result))
         expected_tree = ET.ElementTree(ET.fromstring(expected_xml))
         assert elements_equal(result_tree.getroot(), expected_tree.getroot())
+
+    @pytest.mark.parametrize(
+        "process_fixture",
+        [
+            "linear_process",
+            "order_process",
+            "procurement_process",
+            "pg_inside_eg_process",
+            "empty_gateway_path_process",
+        ],
+    )
+    def test_iter_bpmn_xml(self, process_fixture, request):
+        process = request.getfixturevalue(process_fixture)
+        xml_generator = BpmnXmlGenerator()
+
+        chunks = list(xml_generator.iter_bpmn_xml(process, chunk_size=100))
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == xml_generator.create_bpmn_xml(process)
+
+    def test_iter_bpmn_xml_escaping(self):
+        process = [
+            {"type": "startEvent", "id": "start1"},
+            {"type": "task", "id": "task1", "label": 'Check "A & B"\n<urgent>'},
+            {"type": "endEvent", "id": "end1"},
+        ]
+
+        result = "".join(BpmnXmlGenerator().iter_bpmn_xml(process))
+
+        assert 'name="Check &quot;A &amp; B&quot;&#10;&lt;urgent&gt;"' in result
+        task = ET.fromstring(result).find(".//{*}task")
+        assert task.get("name") == 'Check "A & B"\n<urgent>'
+
+    def test_write_bpmn_xml(self, order_process, tmp_path):
+        xml_generator = BpmnXmlGenerator()
+        expected_xml = xml_generator.create_bpmn_xml(order_process)
+
+        path = tmp_path / "order_process.bpmn"
+        xml_generator.write_bpmn_xml(order_process, path)
+        file = io.StringIO()
+        xml_generator.write_bpmn_xml(order_process, file)
+
+        assert path.read_text(encoding="utf-8") == expected_xml
+        assert file.getvalue() == expected_xml
@@ -0,0 +1,43 @@
+from unittest.mock import Mock, patch
+
+from bpmn_assistant.core import LLMFacade, MessageItem
+from bpmn_assistant.services.conversational_service import ConversationalService
+
+
+def make_service() -> tuple[ConversationalService, Mock]:
+    llm_facade = Mock(LLMFacade)
+    llm_facade.stream.return_value = iter(["Done", "!"])
+    with patch(
+        "bpmn_assistant.services.conversational_service.get_llm_facade",
+        return_value=llm_facade,
+    ):
+        return ConversationalService("gpt-4o-mini"), llm_facade
+
+
+class TestMakeFinalComment:
+
+    message_history = [MessageItem(role="user", content="Add a review task")]
+
+    def test_shows_the_outline_of_the_process(self):
+        service, llm_facade = make_service()
+        process = [
+            {"type": "startEvent", "id": "start1"},
+            {"type": "task", "id": "task1", "label": "Review"},
+            {"type": "endEvent", "id": "end1"},
+        ]
+
+        comment = "".join(service.make_final_comment(self.message_history, process))
+
+        prompt = llm_facade.stream.call_args.args[0]
+        assert comment == "Done!"
+        assert 'task task1 "Review"' in prompt
+
+    def test_makes_a_comment_without_a_process(self):
+        service, llm_facade = make_service()
+
+        comment = "".join(service.make_final_comment(self.message_history, None))
+
+        prompt = llm_facade.stream.call_args.args[0]
+        assert comment == "Done!"
+        assert "Add a review task" in prompt
+        assert "this is the updated BPMN process" not in prompt
@@ -0,0 +1,54 @@
+import os
+from unittest.mock import patch
+
+from bpmn_assistant.config.settings import Settings
+from bpmn_assistant.services import BpmnJsonGenerator, BpmnXmlGenerator, ConversionCache
+
+
+class TestConversionCache:
+
+    def test_json_cache(self, bpmn_xml_exclusive_gateway):
+        cache = ConversionCache(max_size=8)
+        expected = BpmnJsonGenerator().create_bpmn_json(bpmn_xml_exclusive_gateway)
+
+        first = BpmnJsonGenerator(cache=cache).create_bpmn_json(bpmn_xml_exclusive_gateway)
+        first.append({"type": "task", "id": "mutated"})
+        second = BpmnJsonGenerator(cache=cache).create_bpmn_json(bpmn_xml_exclusive_gateway)
+
+        # The cached result is not affected by changes to the returned process
+        assert second == expected
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_json_cache_ignores_formatting(self, bpmn_xml_linear_process):
+        cache = ConversionCache(max_size=8)
+        reformatted = bpmn_xml_linear_process.replace("\n", "\r\n  ").split("?>", 1)[1]
+
+        BpmnJsonGenerator(cache=cache).create_bpmn_json(bpmn_xml_linear_process)
+        BpmnJsonGenerator(cache=cache).create_bpmn_json(reformatted)
+
+        assert cache.stats()["hits"] == 1
+
+    def test_xml_cache(self, linear_process):
+        cache = ConversionCache(max_size=8)
+        bpmn_xml_generator = BpmnXmlGenerator(cache=cache)
+
+        first = bpmn_xml_generator.create_bpmn_xml(linear_process)
+        # The key order of the elements does not matter
+        reordered_process = [dict(reversed(element.items())) for element in linear_process]
+        second = bpmn_xml_generator.create_bpmn_xml(reordered_process)
+
+        assert first == second == BpmnXmlGenerator().create_bpmn_xml(linear_process)
+        assert cache.stats()["hits"] == 1
+
+    def test_from_env_reads_the_settings(self, tmp_path):
+        env_file = tmp_path / ".env"
+        env_file.write_text("BPMN_CACHE_MAX_SIZE=7\nBPMN_CACHE_TTL=60\n")
+
+        with patch.dict(os.environ), patch(
+            "bpmn_assistant.services.conversion_cache.settings", Settings(env_file)
+        ):
+            cache = ConversionCache.from_env()
+
+        assert cache.stats()["max_size"] == 7
+        assert cache.stats()["ttl"] == 60.0
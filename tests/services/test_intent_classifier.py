@@ -0,0 +1,91 @@
+import json
+from unittest.mock import Mock
+
+from bpmn_assistant.core import LLMFacade, MessageItem
+from bpmn_assistant.services import IntentClassifier, determine_intent
+
+
+def history(*user_messages: str) -> list[MessageItem]:
+    return [MessageItem(role="user", content=message) for message in user_messages]
+
+
+class TestIntentClassifier:
+
+    def test_rules_classify_clear_turns(self):
+        classifier = IntentClassifier(threshold=0.8)
+
+        assert classifier.classify(history("Add a review task")) == {"intent": "modify"}
+        assert classifier.classify(history("What does the process do?")) == {
+            "intent": "talk"
+        }
+
+    def test_leaves_ambiguous_turns_to_the_llm(self):
+        classifier = IntentClassifier(threshold=0.8)
+
+        # A request phrased as a question matches both the modify and the talk rules
+        assert classifier.classify(history("Can you add a review task?")) is None
+        assert classifier.classify(history("Ok")) is None
+
+    def test_never_answers_without_a_threshold(self):
+        classifier = IntentClassifier(threshold=None)
+
+        assert classifier.classify(history("Add a review task")) is None
+
+    def test_uses_the_last_user_message(self):
+        classifier = IntentClassifier(threshold=0.8)
+        message_history = [
+            MessageItem(role="user", content="Create a process for hiring"),
+            MessageItem(role="assistant", content="Here is the process."),
+            MessageItem(role="user", content="Why is there a gateway?"),
+        ]
+
+        assert classifier.classify(message_history) == {"intent": "talk"}
+
+    def test_model_trained_from_decisions(self, tmp_path):
+        decisions = [
+            (history("Yes, please go ahead"), "modify"),
+            (history("Go ahead with it"), "modify"),
+            (history("Please go ahead"), "modify"),
+            (history("Ok, got it"), "talk"),
+            (history("Great job"), "talk"),
+            (history("Nice, got it"), "talk"),
+        ]
+        model = IntentClassifier.train_model(decisions)
+        IntentClassifier.save_model(model, tmp_path / "model.json")
+        classifier = IntentClassifier(
+            threshold=0.8, model=IntentClassifier.load_model(tmp_path / "model.json")
+        )
+
+        assert classifier.classify(history("Go ahead")) == {"intent": "modify"}
+        assert classifier.classify(history("Got it")) == {"intent": "talk"}
+
+
+class TestDetermineIntentWithClassifier:
+
+    def test_answers_locally_without_calling_the_llm(self):
+        llm_facade = Mock(LLMFacade)
+
+        intent = determine_intent(
+            llm_facade,
+            history("Remove the approval step"),
+            intent_classifier=IntentClassifier(threshold=0.8),
+        )
+
+        assert intent == {"intent": "modify"}
+        llm_facade.call.assert_not_called()
+
+    def test_falls_back_to_the_llm_and_logs_its_decision(self, tmp_path):
+        llm_facade = Mock(LLMFacade)
+        llm_facade.call.return_value = {"intent": "modify"}
+        decisions_log = tmp_path / "decisions.jsonl"
+        classifier = IntentClassifier(threshold=0.8, decisions_log=decisions_log)
+
+        intent = determine_intent(
+            llm_facade, history("Can you add a task?"), intent_classifier=classifier
+        )
+
+        assert intent == {"intent": "modify"}
+        assert llm_facade.call.call_count == 1
+        [record] = [json.loads(line) for line in decisions_log.read_text().splitlines()]
+        assert record["intent"] == "modify"
+        assert IntentClassifier.load_decisions(decisions_log)[0][1] == "modify"
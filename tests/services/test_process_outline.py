@@ -0,0 +1,141 @@
+import re
+
+import pytest
+
+from bpmn_assistant.services import (
+    BpmnJsonGenerator,
+    outline_to_process,
+    process_to_outline,
+)
+
+PROCESS_FIXTURES = [
+    "linear_process",
+    "order_process",
+    "procurement_process",
+    "pg_inside_eg_process",
+    "empty_gateway_path_process",
+]
+
+
+class TestProcessOutline:
+
+    @pytest.mark.parametrize("process_fixture", PROCESS_FIXTURES)
+    def test_round_trip(self, process_fixture, request):
+        process = request.getfixturevalue(process_fixture)
+
+        outline = process_to_outline(process)
+
+        assert outline_to_process(outline) == process
+        assert len(outline) < len(str(process)) * 0.6
+
+    def test_outline(self, pg_inside_eg_process):
+        assert process_to_outline(pg_inside_eg_process) == "\n".join(
+            [
+                "startEvent start1",
+                'exclusiveGateway exclusive1 "Exclusive Decision" join',
+                '  ? "Condition A"',
+                '    task task2 "Task A"',
+                '  ? "Condition B"',
+                "    parallelGateway parallel1",
+                "      |",
+                '        task task3 "Parallel Task 1"',
+                "      |",
+                '        task task4 "Parallel Task 2"',
+                "endEvent end1",
+            ]
+        )
+
+    def test_branch_next_and_empty_path(self):
+        process = [
+            {"type": "task", "id": "task1", "label": "Review"},
+            {
+                "type": "exclusiveGateway",
+                "id": "exclusive1",
+                "label": "Approved?",
+                "has_join": False,
+                "branches": [
+                    {"condition": "Yes", "path": []},
+                    {"condition": "No", "path": [], "next": "task1"},
+                ],
+            },
+        ]
+
+        outline = process_to_outline(process)
+
+        assert outline.splitlines()[2:] == ['  ? "Yes"', '  ? "No" -> task1']
+        assert outline_to_process(outline) == process
+
+    def test_round_trip_of_branches_without_a_condition(self):
+        process = [
+            {"type": "startEvent", "id": "s"},
+            {
+                "type": "exclusiveGateway",
+                "id": "g",
+                "label": "ok?",
+                "has_join": False,
+                "branches": [
+                    {"condition": None, "path": [{"type": "endEvent", "id": "e1"}]},
+                    {"condition": "no", "path": [], "next": "s"},
+                    {"condition": None, "path": [], "next": "s"},
+                ],
+            },
+        ]
+
+        outline = process_to_outline(process)
+
+        assert outline.splitlines()[2:] == [
+            "  ?",
+            "    endEvent e1",
+            '  ? "no" -> s',
+            "  ? -> s",
+        ]
+        assert outline_to_process(outline) == process
+
+    def test_round_trip_of_a_diagram_with_an_unnamed_flow(
+        self, bpmn_xml_eg_unnamed_flow
+    ):
+        process = BpmnJsonGenerator().create_bpmn_json(bpmn_xml_eg_unnamed_flow)
+        [gateway] = [e for e in process if e["type"] == "exclusiveGateway"]
+        assert [branch["condition"] for branch in gateway["branches"]] == ["Yes", None]
+
+        assert outline_to_process(process_to_outline(process)) == process
+
+    def test_round_trip_of_unusual_values(self):
+        process = [
+            {"type": "startEvent", "id": "start 1", "label": None},
+            {"type": "task", "id": "join", "label": 'Say "hi"\nthen wait'},
+            {"type": "endEvent", "id": "->", "documentation": {"owner": "Ops"}},
+        ]
+
+        outline = process_to_outline(process)
+
+        assert outline.splitlines() == [
+            'startEvent "start 1" {"label": null}',
+            'task "join" "Say \\"hi\\"\\nthen wait"',
+            'endEvent "->" {"documentation": {"owner": "Ops"}}',
+        ]
+        assert outline_to_process(outline) == process
+
+    def test_ignores_blank_lines(self, linear_process):
+        outline = process_to_outline(linear_process).replace("\n", "\n\n") + "\n"
+
+        assert outline_to_process(outline) == linear_process
+
+    @pytest.mark.parametrize(
+        "outline, error",
+        [
+            ("task1 task1", "Line 1: unknown element type 'task1'"),
+            ('task {"label": "Review"}', "Line 1: the element has no id"),
+            ("startEvent start1\n   task task1", "Line 2: the indentation"),
+            ("startEvent start1\n  task task1", "Line 2: unexpected indentation"),
+            ('? "Yes"', "Line 1: a branch outside of a gateway"),
+            ('exclusiveGateway g1 "Ok?"', "Line 1: the gateway has no branches"),
+            ('exclusiveGateway g1 "Ok?"\n  |', "Line 2: expected a branch ('?')"),
+            ('exclusiveGateway g1 "Ok?"\n  ? Yes', "Line 2: unexpected 'Yes'"),
+            ('task task1 "Review', "Line 1: Unterminated string"),
+            ('task task1 "Review" now', "Line 1: unexpected 'now'"),
+        ],
+    )
+    def test_rejects_malformed_outlines(self, outline, error):
+        with pytest.raises(ValueError, match=re.escape(error)):
+            outline_to_process(outline)
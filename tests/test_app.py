@@ -0,0 +1,70 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from bpmn_assistant import app as app_module
+from bpmn_assistant.services import BpmnXmlGenerator
+
+
+@pytest.fixture
+def client():
+    with patch.object(app_module, "get_llm_facade"):
+        yield TestClient(app_module.app)
+
+
+def modify(client: TestClient, process: list[dict], endpoint: str = "/modify"):
+    request = {
+        "message_history": [{"role": "user", "content": "Create a process"}],
+        "process": None,
+        "model": "gpt-4o-mini",
+    }
+    with patch.object(
+        app_module.bpmn_modeling_service,
+        "create_bpmn_async",
+        AsyncMock(return_value=process),
+    ):
+        return client.post(endpoint, json=request)
+
+
+class TestModify:
+
+    def test_streams_the_body_of_a_json_response(self, client, linear_process):
+        response = modify(client, linear_process)
+
+        expected = JSONResponse(
+            content={
+                "bpmn_xml": BpmnXmlGenerator().create_bpmn_xml(linear_process),
+                "bpmn_json": linear_process,
+            }
+        )
+        assert response.status_code == 200
+        assert response.content == expected.body
+
+    def test_reports_a_failed_conversion_as_an_error(self, client):
+        # A label that is not a string only fails when the XML is serialized
+        process = [
+            {"type": "startEvent", "id": "start1"},
+            {"type": "task", "id": "task1", "label": 42},
+            {"type": "endEvent", "id": "end1"},
+        ]
+
+        response = modify(client, process)
+
+        assert response.status_code == 500
+        assert response.json() == {"detail": "cannot serialize 42 (type int)"}
+
+    def test_streams_the_intent_before_the_process(self, client, linear_process):
+        with patch.object(
+            app_module,
+            "determine_intent_async",
+            AsyncMock(return_value={"intent": "modify"}),
+        ):
+            response = modify(
+                client, linear_process, endpoint="/determine_intent_and_modify"
+            )
+
+        assert response.status_code == 200
+        assert list(response.json()) == ["intent", "bpmn_xml", "bpmn_json"]
+        assert response.json()["bpmn_json"] == linear_process
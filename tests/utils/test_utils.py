@@ -1,4 +1,21 @@
-from bpmn_assistant.utils import message_history_to_string
+import os
+from unittest.mock import patch
+
+import pytest
+
+from bpmn_assistant.core.enums import (
+    AnthropicModels,
+    FireworksAIModels,
+    GoogleModels,
+    OpenAIModels,
+)
+from bpmn_assistant.core.provider_impl import AnthropicProvider
+from bpmn_assistant.utils import (
+    MODEL_PROVIDERS,
+    get_llm_facade,
+    is_openai_model,
+    message_history_to_string,
+)
 
 
 class TestUtils:
@@ -9,4 +26,24 @@ class TestUtils:
 
         expected_string = "User: Can you help me create a BPMN process?\nAssistant: Sure! What are the steps involved in the process?\nUser: Create a process that involves a user signing up for a service. 1. The user visits the website and clicks on the 'Sign Up' button. 2. The user enters their email address and password. 3. The user clicks on the 'Sign Up' button. 4. The user receives a confirmation email. 5. The user clicks on the confirmation link in the email. 6. The user is redirected to the website and sees a confirmation message."
 
-        assert message_history_string == expected_string
\ No newline at end of file
+        assert message_history_string == expected_string
+
+    def test_get_llm_facade_resolves_the_provider_of_the_model(self):
+        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "key"}):
+            llm_facade = get_llm_facade(AnthropicModels.HAIKU_3_5.value)
+
+        assert isinstance(llm_facade.provider, AnthropicProvider)
+
+    def test_get_llm_facade_raises_exception_for_unknown_model(self):
+        with pytest.raises(Exception) as e:
+            get_llm_facade("unknown-model")
+
+        assert "Invalid model" in str(e.value)
+
+    def test_every_model_has_a_provider(self):
+        for models in (OpenAIModels, AnthropicModels, GoogleModels, FireworksAIModels):
+            for model in models:
+                assert model.value in MODEL_PROVIDERS
+
+        assert is_openai_model(OpenAIModels.GPT_4O.value)
+        assert not is_openai_model(AnthropicModels.HAIKU_3_5.value)